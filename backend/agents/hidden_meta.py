@@ -0,0 +1,253 @@
+"""HIDDEN_META parsing — operatives' private decisions, from text blocks or structured JSON output."""
+import json
+import logging
+import re
+from typing import Dict, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+META_FIELDS = ["decision", "loyalty_shift", "reason", "tension_impact", "exposure_impact"]
+DECISIONS = ("comply", "partial", "deceive", "exceed", "rogue")
+
+DEFAULT_META = {
+    "decision": "comply",
+    "loyalty_shift": 0,
+    "reason": "No hidden reasoning detected",
+    "tension_impact": 0,
+    "exposure_impact": 0,
+}
+
+# json_schema response format for the structured operative mode
+OPERATIVE_RESPONSE_SCHEMA = {
+    "name": "operative_response",
+    "strict": True,
+    "schema": {
+        "type": "object",
+        "properties": {
+            "transmission": {"type": "string"},
+            "meta": {
+                "type": "object",
+                "properties": {
+                    "decision": {"type": "string", "enum": list(DECISIONS)},
+                    "loyalty_shift": {"type": "integer"},
+                    "reason": {"type": "string"},
+                    "tension_impact": {"type": "integer"},
+                    "exposure_impact": {"type": "integer"},
+                },
+                "required": META_FIELDS,
+                "additionalProperties": False,
+            },
+        },
+        "required": ["transmission", "meta"],
+        "additionalProperties": False,
+    },
+}
+
+_OPEN = re.compile(r"\[\s*HIDDEN_META\s*\]", re.IGNORECASE)
+_CLOSE = re.compile(r"\[\s*/\s*HIDDEN_META\s*\]", re.IGNORECASE)
+# "decision: comply", "**loyalty_shift:** -2", "- reason: ..." (markdown decoration is ignored)
+_FIELD = re.compile(r"^[\s*`>-]*([A-Za-z][A-Za-z_]*)[\s*`]*:[\s*`]*(.*?)[\s*`]*$")
+_INT = re.compile(r"[+-]?\s*\d+")
+# A code fence wrapping the block is dropped with it
+_FENCE_BEFORE = re.compile(r"```[\w-]*\s*$")
+_FENCE_AFTER = re.compile(r"^\s*```[ \t]*")
+# Trailing backticks that may be the start of such a fence
+_PARTIAL_FENCE = re.compile(r"`{1,3}[\w-]*\s*$")
+# Longest opening tag worth waiting for when a chunk ends mid-tag
+_MAX_TAG_LENGTH = 24
+
+
+def normalize_meta(fields: Dict[str, object]) -> Tuple[dict, List[str]]:
+    """Validate raw meta fields, filling defaults for missing or unusable ones.
+
+    Args:
+        fields: Field name -> raw value (text from a block, or parsed JSON).
+
+    Returns:
+        (meta dict with every field set, list of problems found).
+    """
+    meta = dict(DEFAULT_META)
+    problems = []
+    for field in META_FIELDS:
+        value = fields.get(field)
+        if value is None:
+            problems.append(f"missing {field}")
+            continue
+        if field == "decision":
+            decision = str(value).strip().lower()
+            if decision in DECISIONS:
+                meta[field] = decision
+            else:
+                problems.append(f"unknown decision {value!r}")
+        elif field == "reason":
+            reason = str(value).strip()
+            if reason:
+                meta[field] = reason
+            else:
+                problems.append("empty reason")
+        elif isinstance(value, int) and not isinstance(value, bool):
+            meta[field] = value
+        else:
+            match = _INT.match(str(value).strip())
+            if match:
+                meta[field] = int(match.group(0).replace(" ", ""))
+            else:
+                problems.append(f"non-integer {field} {value!r}")
+    return meta, problems
+
+
+class HiddenMetaParser:
+    """Single-pass, incremental HIDDEN_META parser.
+
+    Feed the response as it arrives; each call returns the public text that is
+    safe to show so far. Text that might be the start of a block (a partial
+    tag or a code fence) is held back until the next chunk settles it, and
+    blocks never reach the output even when they are left unterminated.
+    Only the first block's fields are used, as before.
+    """
+
+    def __init__(self):
+        self._buffer = ""
+        self._in_meta = False
+        self._after_close = False
+        self._blocks = 0
+        self._closed = 0
+        self._fields: Dict[str, str] = {}
+        self._public: List[str] = []
+
+    def feed(self, chunk: str) -> str:
+        """Add a chunk of the response; returns newly available public text."""
+        self._buffer += chunk
+        return self._drain(final=False)
+
+    def close(self) -> str:
+        """Mark the end of the response; returns any public text still held back."""
+        return self._drain(final=True)
+
+    def _parse_lines(self, text: str) -> None:
+        if self._blocks != 1:
+            return
+        for line in text.splitlines():
+            match = _FIELD.match(line)
+            if match:
+                self._fields.setdefault(match.group(1).lower(), match.group(2))
+
+    def _holdback(self) -> int:
+        """Index from which the buffer might still turn into a block opening."""
+        hold = len(self._buffer)
+        bracket = self._buffer.rfind("[")
+        if bracket >= 0 and "]" not in self._buffer[bracket:] and hold - bracket <= _MAX_TAG_LENGTH:
+            hold = bracket
+        # A fence just before the held-back text may belong to the block too
+        fence = _PARTIAL_FENCE.search(self._buffer, 0, hold)
+        if fence:
+            hold = fence.start()
+        return hold
+
+    def _drain(self, final: bool) -> str:
+        emitted = []
+        while True:
+            if self._in_meta:
+                match = _CLOSE.search(self._buffer)
+                if match:
+                    self._parse_lines(self._buffer[:match.start()])
+                    self._buffer = self._buffer[match.end():]
+                    self._in_meta = False
+                    self._after_close = True
+                    self._closed += 1
+                    continue
+                # Keep the last, partial line: it may hold the start of the closing tag
+                cut = len(self._buffer) if final else self._buffer.rfind("\n") + 1
+                self._parse_lines(self._buffer[:cut])
+                self._buffer = self._buffer[cut:]
+                break
+
+            if self._after_close:
+                rest = self._buffer.lstrip()
+                if not final and len(rest) < 3 and "```".startswith(rest):
+                    break
+                fence = _FENCE_AFTER.match(self._buffer)
+                if fence:
+                    self._buffer = self._buffer[fence.end():]
+                self._after_close = False
+
+            match = _OPEN.search(self._buffer)
+            if match:
+                emitted.append(_FENCE_BEFORE.sub("", self._buffer[:match.start()]))
+                self._buffer = self._buffer[match.end():]
+                self._in_meta = True
+                self._blocks += 1
+                continue
+            hold = len(self._buffer) if final else self._holdback()
+            emitted.append(self._buffer[:hold])
+            self._buffer = self._buffer[hold:]
+            break
+
+        text = "".join(emitted)
+        self._public.append(text)
+        return text
+
+    def result(self) -> dict:
+        """Parsed response once the parser has been closed.
+
+        Returns:
+            Dict with text (public, stripped), hidden_meta (every field set),
+            meta_valid (False if anything had to be defaulted) and problems.
+        """
+        if self._blocks == 0:
+            return {
+                "text": "".join(self._public).strip(),
+                "hidden_meta": dict(DEFAULT_META),
+                "meta_valid": False,
+                "problems": ["no HIDDEN_META block"],
+            }
+        meta, problems = normalize_meta(self._fields)
+        if self._closed == 0:
+            problems.insert(0, "unterminated HIDDEN_META block")
+        return {
+            "text": "".join(self._public).strip(),
+            "hidden_meta": meta,
+            "meta_valid": not problems,
+            "problems": problems,
+        }
+
+
+def parse_operative_response(response: str) -> dict:
+    """Parse a complete legacy-format response (text plus HIDDEN_META block).
+
+    Returns:
+        Same shape as HiddenMetaParser.result().
+    """
+    parser = HiddenMetaParser()
+    parser.feed(response)
+    parser.close()
+    return parser.result()
+
+
+def parse_structured_response(response: str) -> dict:
+    """Parse a structured-mode response: {"transmission": ..., "meta": {...}}.
+
+    A response that is not the expected JSON is parsed as the legacy text
+    format instead, so a model ignoring the format still yields a transmission.
+
+    Returns:
+        Same shape as HiddenMetaParser.result().
+    """
+    try:
+        data = json.loads(response)
+    except json.JSONDecodeError:
+        data = None
+    if not isinstance(data, dict) or not isinstance(data.get("transmission"), str):
+        result = parse_operative_response(response)
+        result["meta_valid"] = False
+        result["problems"].insert(0, "response is not structured JSON")
+        return result
+
+    fields = data.get("meta")
+    meta, problems = normalize_meta(fields if isinstance(fields, dict) else {})
+    return {
+        "text": data["transmission"].strip(),
+        "hidden_meta": meta,
+        "meta_valid": not problems,
+        "problems": problems,
+    }
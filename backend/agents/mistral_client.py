@@ -1,66 +1,146 @@
 """Mistral API client wrapper with async helpers."""
+import asyncio
 import logging
-from mistralai import Mistral
-from config import MISTRAL_API_KEY, MISTRAL_MODEL
+import time
+from typing import Optional
+from config import MISTRAL_API_KEY, MISTRAL_MODEL, UPSTREAM_WARMUP_TIMEOUT, HTTP_READ_TIMEOUT
+from utils.http_pool import get_http_client
+from utils.metrics import record_llm_call
+from utils.tracing import span
 
 logger = logging.getLogger(__name__)
 
-# Initialize the Mistral client
-client = Mistral(api_key=MISTRAL_API_KEY)
+# Created on first use — importing the SDK is a large share of startup time
+_client = None
 
 
-async def chat_completion(system_prompt: str, user_message: str, temperature: float = 0.7) -> str:
+def get_client():
+    """Get the Mistral client, constructing it on first use."""
+    global _client
+    if _client is None:
+        from mistralai import Mistral
+        _client = Mistral(
+            api_key=MISTRAL_API_KEY,
+            async_client=get_http_client(),
+            timeout_ms=int(HTTP_READ_TIMEOUT * 1000),
+        )
+    return _client
+
+
+def reset_client() -> None:
+    """Drop the client, so the next call builds one on the current HTTP pool (used on shutdown)."""
+    global _client
+    _client = None
+
+
+async def warm_up() -> bool:
+    """Construct the client and open a pooled connection to the API.
+    
+    Listing models is the cheapest authenticated call, so it also surfaces a
+    bad API key at boot instead of on the first order.
+    
+    Returns:
+        True if the API answered.
+    """
+    if not MISTRAL_API_KEY:
+        return False
+    try:
+        await asyncio.wait_for(get_client().models.list_async(), timeout=UPSTREAM_WARMUP_TIMEOUT)
+        return True
+    except Exception as e:
+        logger.warning(f"Mistral warm-up failed: {e}")
+        return False
+
+
+async def _complete(messages: list, temperature: float, mode: str, **extra) -> str:
+    """Send one chat completion request, recording latency, tokens and errors for `mode`."""
+    with span(f"llm.{mode}", **{"llm.messages": len(messages)}) as current:
+        started = time.perf_counter()
+        try:
+            response = await get_client().chat.complete_async(
+                model=MISTRAL_MODEL,
+                messages=messages,
+                temperature=temperature,
+                **extra,
+            )
+        except Exception as e:
+            record_llm_call(mode, time.perf_counter() - started, error=True)
+            logger.error(f"Mistral API error ({mode}): {e}")
+            raise
+        elapsed = time.perf_counter() - started
+        usage = getattr(response, "usage", None)
+        prompt_tokens = getattr(usage, "prompt_tokens", 0) or 0
+        completion_tokens = getattr(usage, "completion_tokens", 0) or 0
+        record_llm_call(mode, elapsed, prompt_tokens, completion_tokens)
+        if current is not None:
+            current.set(**{"llm.prompt_tokens": prompt_tokens, "llm.completion_tokens": completion_tokens})
+        content = response.choices[0].message.content
+        logger.info(f"Mistral {mode} response received ({len(content)} chars, "
+                    f"{prompt_tokens}+{completion_tokens} tokens, {elapsed:.2f}s)")
+        return content
+
+
+async def chat_completion(system_prompt: str, user_message: str, temperature: float = 0.7,
+                          mode: str = "other") -> str:
     """Make an async chat completion call to Mistral API.
     
     Args:
         system_prompt: The system prompt for the agent.
         user_message: The user/order message.
         temperature: Sampling temperature (0-1).
+        mode: What the call is for (e.g. 'turn_briefing'); tags its metrics.
     
     Returns:
         The assistant's response text.
     """
-    try:
-        response = await client.chat.complete_async(
-            model=MISTRAL_MODEL,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_message},
-            ],
-            temperature=temperature,
-        )
-        content = response.choices[0].message.content
-        logger.info(f"Mistral response received ({len(content)} chars)")
-        return content
-    except Exception as e:
-        logger.error(f"Mistral API error: {e}")
-        raise
+    return await _complete(
+        [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_message},
+        ],
+        temperature, mode,
+    )
+
+
+async def chat_messages(messages: list, temperature: float = 0.7, json_mode: bool = False,
+                        mode: str = "other") -> str:
+    """Chat completion over a full conversation (system, user and assistant turns).
+
+    Args:
+        messages: Role/content dicts, oldest first; the last must be a user message.
+        temperature: Sampling temperature (0-1).
+        json_mode: Ask for a JSON object response.
+        mode: What the call is for; tags its metrics.
 
+    Returns:
+        The assistant's response text.
+    """
+    extra = {"response_format": {"type": "json_object"}} if json_mode else {}
+    return await _complete(messages, temperature, mode, **extra)
 
-async def chat_completion_json(system_prompt: str, user_message: str, temperature: float = 0.5) -> str:
+
+async def chat_completion_json(system_prompt: str, user_message: str, temperature: float = 0.5,
+                               schema: Optional[dict] = None, mode: str = "other") -> str:
     """Chat completion expecting JSON output — lower temperature for reliability.
     
     Args:
         system_prompt: The system prompt.
         user_message: The user message.
         temperature: Lower default for JSON reliability.
+        schema: Optional json_schema spec (name, schema, strict) the output must follow;
+            without it any JSON object is accepted.
+        mode: What the call is for (e.g. 'route_order'); tags its metrics.
     
     Returns:
         The assistant's response text (should be JSON).
     """
-    try:
-        response = await client.chat.complete_async(
-            model=MISTRAL_MODEL,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_message},
-            ],
-            temperature=temperature,
-            response_format={"type": "json_object"},
-        )
-        content = response.choices[0].message.content
-        logger.info(f"Mistral JSON response received ({len(content)} chars)")
-        return content
-    except Exception as e:
-        logger.error(f"Mistral JSON API error: {e}")
-        raise
+    return await _complete(
+        [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_message},
+        ],
+        temperature, mode,
+        response_format=(
+            {"type": "json_schema", "json_schema": schema} if schema else {"type": "json_object"}
+        ),
+    )
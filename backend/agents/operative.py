@@ -1,33 +1,53 @@
 """Operative Agent — builds prompts, calls Mistral, parses hidden meta."""
-import re
-import json
 import logging
-from typing import Optional
-from config import PROMPTS_DIR
-from agents.mistral_client import chat_completion
+from config import OPERATIVE_RESPONSE_MODE
+from agents.mistral_client import chat_completion, chat_completion_json
+from agents.hidden_meta import (
+    OPERATIVE_RESPONSE_SCHEMA, parse_operative_response, parse_structured_response,
+)
+from utils.metrics import record_fallback
+from agents.templates import CompiledTemplate, load_template, render_cached
 from game.operative_manager import load_operative
-from game.state_manager import load_world_state
+from game.state_manager import load_world_state, get_state_version
 
 logger = logging.getLogger(__name__)
 
 
-def _load_prompt_template(codename: str) -> str:
-    """Load the markdown system prompt template for an operative."""
-    path = PROMPTS_DIR / f"{codename.lower()}.md"
-    with open(path, "r", encoding="utf-8") as f:
-        return f.read()
+# Appended to the system prompt in structured mode, replacing the HIDDEN_META block format
+STRUCTURED_OUTPUT_INSTRUCTIONS = """
+
+## RESPONSE FORMAT
+Respond with a single JSON object instead of a HIDDEN_META block:
+- "transmission": your in-character transmission to the Director (what the Director sees)
+- "meta": your hidden decision, with "decision" (comply, partial, deceive, exceed or rogue), "loyalty_shift", \
+"reason" (one sentence), "tension_impact" and "exposure_impact" (integers)
+"""
+
+
+def _load_prompt_template(codename: str) -> CompiledTemplate:
+    """Load the compiled system prompt template for an operative."""
+    return load_template(codename.lower())
 
 
 def build_operative_prompt(codename: str) -> str:
     """Build a fully-injected operative system prompt with current memory + world state.
     
+    The rendered prompt is reused until game state or the template changes.
+    
     Args:
         codename: Operative codename (e.g. 'NIGHTHAWK').
     
     Returns:
         Complete system prompt string with all dynamic data injected.
     """
-    template = _load_prompt_template(codename)
+    return render_cached(
+        f"operative:{codename}", _load_prompt_template(codename), get_state_version(),
+        lambda: _operative_prompt_values(codename),
+    )
+
+
+def _operative_prompt_values(codename: str) -> dict:
+    """Placeholder values for an operative's prompt, from its memory and the world state."""
     operative = load_operative(codename)
     world_state = load_world_state()
     
@@ -65,14 +85,13 @@ def build_operative_prompt(codename: str) -> str:
         f"Agency Exposure: {world_state['agency_exposure_level']}/100"
     )
     
-    # Inject into template
-    prompt = template.replace("{loyalty}", str(operative["loyalty"]))
-    prompt = prompt.replace("{missions}", missions_text)
-    prompt = prompt.replace("{relationships}", relationships_text)
-    prompt = prompt.replace("{known_compromises}", compromises_text)
-    prompt = prompt.replace("{world_context}", world_context)
-    
-    return prompt
+    return {
+        "loyalty": str(operative["loyalty"]),
+        "missions": missions_text,
+        "relationships": relationships_text,
+        "known_compromises": compromises_text,
+        "world_context": world_context,
+    }
 
 
 async def call_operative(codename: str, order: str) -> dict:
@@ -87,6 +106,7 @@ async def call_operative(codename: str, order: str) -> dict:
             - codename: str
             - response: str (in-character text, HIDDEN_META stripped)
             - hidden_meta: dict (parsed hidden decision data)
+            - meta_valid: bool (False if any hidden field was missing or malformed)
             - raw_response: str (full response including HIDDEN_META)
     """
     operative = load_operative(codename)
@@ -97,6 +117,7 @@ async def call_operative(codename: str, order: str) -> dict:
             "codename": codename,
             "response": f"[SIGNAL LOST] Unable to reach {codename}. Operative status: {operative['current_status']}.",
             "hidden_meta": {"decision": "unavailable", "loyalty_shift": 0, "reason": "Operative not active"},
+            "meta_valid": True,
             "raw_response": "",
             "error": True,
         }
@@ -105,16 +126,28 @@ async def call_operative(codename: str, order: str) -> dict:
     system_prompt = build_operative_prompt(codename)
     user_message = f"ORDER RECEIVED: {order}"
     
-    raw_response = await chat_completion(system_prompt, user_message)
+    if OPERATIVE_RESPONSE_MODE == "json":
+        raw_response = await chat_completion_json(
+            system_prompt + STRUCTURED_OUTPUT_INSTRUCTIONS, user_message,
+            temperature=0.7, schema=OPERATIVE_RESPONSE_SCHEMA, mode="operative",
+        )
+        parsed = parse_structured_response(raw_response)
+    else:
+        raw_response = await chat_completion(system_prompt, user_message, mode="operative")
+        parsed = parse_operative_response(raw_response)
     
-    # Parse response
-    response_text = strip_hidden_meta(raw_response)
-    hidden_meta = parse_hidden_meta(raw_response)
+    hidden_meta = parsed["hidden_meta"]
+    if parsed["meta_valid"]:
+        logger.info(f"Parsed HIDDEN_META: decision={hidden_meta['decision']}, loyalty_shift={hidden_meta['loyalty_shift']}")
+    else:
+        record_fallback("operative")
+        logger.warning(f"{codename} hidden meta unusable ({'; '.join(parsed['problems'])}) — defaults applied")
     
     return {
         "codename": codename,
-        "response": response_text,
+        "response": parsed["text"],
         "hidden_meta": hidden_meta,
+        "meta_valid": parsed["meta_valid"],
         "raw_response": raw_response,
     }
 
@@ -128,9 +161,7 @@ def strip_hidden_meta(response: str) -> str:
     Returns:
         Response with HIDDEN_META block removed (what the Director sees).
     """
-    pattern = r'\[HIDDEN_META\].*?\[/HIDDEN_META\]'
-    cleaned = re.sub(pattern, '', response, flags=re.DOTALL).strip()
-    return cleaned
+    return parse_operative_response(response)["text"]
 
 
 def parse_hidden_meta(response: str) -> dict:
@@ -141,40 +172,6 @@ def parse_hidden_meta(response: str) -> dict:
     
     Returns:
         Dict with parsed fields: decision, loyalty_shift, reason, tension_impact, exposure_impact.
-        Returns defaults if parsing fails.
+        Fields that are missing or unusable get their defaults.
     """
-    defaults = {
-        "decision": "comply",
-        "loyalty_shift": 0,
-        "reason": "No hidden reasoning detected",
-        "tension_impact": 0,
-        "exposure_impact": 0,
-    }
-    
-    # Extract the HIDDEN_META block
-    match = re.search(r'\[HIDDEN_META\](.*?)\[/HIDDEN_META\]', response, re.DOTALL)
-    if not match:
-        logger.warning("No HIDDEN_META block found in operative response")
-        return defaults
-    
-    meta_text = match.group(1)
-    result = {}
-    
-    # Parse each field
-    for field in ["decision", "loyalty_shift", "reason", "tension_impact", "exposure_impact"]:
-        pattern = rf'{field}:\s*(.+?)(?:\n|$)'
-        field_match = re.search(pattern, meta_text, re.IGNORECASE)
-        if field_match:
-            value = field_match.group(1).strip()
-            if field in ("loyalty_shift", "tension_impact", "exposure_impact"):
-                try:
-                    # Handle formats like "+5", "-3", "5"
-                    value = int(value.replace("+", ""))
-                except ValueError:
-                    value = defaults[field]
-            result[field] = value
-        else:
-            result[field] = defaults[field]
-    
-    logger.info(f"Parsed HIDDEN_META: decision={result.get('decision')}, loyalty_shift={result.get('loyalty_shift')}")
-    return result
+    return parse_operative_response(response)["hidden_meta"]
@@ -2,61 +2,102 @@
 import json
 import logging
 from typing import Optional
-from config import PROMPTS_DIR, OPERATIVE_CODENAMES
+from config import OPERATIVE_CODENAMES, ORCHESTRATOR_SESSION_ENABLED
 from agents.mistral_client import chat_completion, chat_completion_json
-from game.state_manager import load_world_state
+from agents.orchestrator_session import OrchestratorSession
+from utils.metrics import record_fallback
+from agents.templates import CompiledTemplate, load_template, render_cached
+from game.state_manager import load_world_state, get_state_version
 from game.operative_manager import load_operative, get_operative_public_info
 
 logger = logging.getLogger(__name__)
 
 
-def _load_orchestrator_template() -> str:
-    """Load the orchestrator system prompt template."""
-    path = PROMPTS_DIR / "orchestrator.md"
-    with open(path, "r", encoding="utf-8") as f:
-        return f.read()
+def _load_orchestrator_template() -> CompiledTemplate:
+    """Load the compiled orchestrator system prompt template."""
+    return load_template("orchestrator")
 
 
 def _build_orchestrator_prompt() -> str:
-    """Build the orchestrator system prompt with current world state injected."""
-    template = _load_orchestrator_template()
-    world_state = load_world_state()
+    """Build the orchestrator system prompt with current world state injected.
     
-    # Format world state (sanitized — no loyalty scores)
-    world_state_text = json.dumps({
-        "turn": world_state["turn"],
-        "regions": world_state["regions"],
-        "threat_level": world_state["threat_level"],
-        "agency_exposure_level": world_state["agency_exposure_level"],
-        "director_trust_score": world_state["director_trust_score"],
-        "compromised_assets": world_state["compromised_assets"],
-    }, indent=2)
-    
-    # Format mission log (last 10 entries)
-    recent_missions = world_state.get("mission_log", [])[-10:]
-    if recent_missions:
-        mission_log_text = json.dumps(recent_missions, indent=2)
-    else:
-        mission_log_text = "No missions completed yet."
+    The rendered prompt is reused until game state or the template changes,
+    so the several orchestrator calls in one order build it only once.
+    """
+    return render_cached(
+        "orchestrator", _load_orchestrator_template(), get_state_version(),
+        _orchestrator_prompt_values,
+    )
+
+
+def _orchestrator_context() -> dict:
+    """Public game state the orchestrator works from — no loyalty scores or agendas."""
+    world_state = load_world_state()
     
-    # Format operative list (public info only)
-    operative_list = []
+    operatives = {}
     for codename in OPERATIVE_CODENAMES:
         try:
             op = load_operative(codename)
-            operative_list.append(
-                f"- {codename}: Located in {op['location']}, Status: {op['current_status']}"
-            )
+            operatives[codename] = f"Located in {op['location']}, Status: {op['current_status']}"
         except Exception:
-            operative_list.append(f"- {codename}: Status unknown")
-    operative_list_text = "\n".join(operative_list)
+            operatives[codename] = "Status unknown"
+    
+    return {
+        "world_state": {
+            "turn": world_state["turn"],
+            "regions": world_state["regions"],
+            "threat_level": world_state["threat_level"],
+            "agency_exposure_level": world_state["agency_exposure_level"],
+            "director_trust_score": world_state["director_trust_score"],
+            "compromised_assets": world_state["compromised_assets"],
+        },
+        # Last 10 entries
+        "mission_log": world_state.get("mission_log", [])[-10:],
+        "operatives": operatives,
+    }
+
+
+def _orchestrator_prompt_values() -> dict:
+    """Placeholder values for the orchestrator prompt (public information only)."""
+    context = _orchestrator_context()
+    
+    if context["mission_log"]:
+        mission_log_text = json.dumps(context["mission_log"], indent=2)
+    else:
+        mission_log_text = "No missions completed yet."
     
-    # Inject into template
-    prompt = template.replace("{world_state}", world_state_text)
-    prompt = prompt.replace("{mission_log}", mission_log_text)
-    prompt = prompt.replace("{operative_list}", operative_list_text)
+    return {
+        "world_state": json.dumps(context["world_state"], indent=2),
+        "mission_log": mission_log_text,
+        "operative_list": "\n".join(
+            f"- {codename}: {status}" for codename, status in context["operatives"].items()
+        ),
+    }
+
+
+# Running conversation used when ORCHESTRATOR_SESSION_ENABLED is set
+session = OrchestratorSession(_build_orchestrator_prompt, _orchestrator_context)
+
+
+def reset_session() -> None:
+    """Forget the orchestrator conversation (used when a new game starts)."""
+    session.reset()
+
+
+async def _ask(user_message: str, mode: str, json_mode: bool = False) -> str:
+    """Send an orchestrator request, within the session when session mode is on.
     
-    return prompt
+    While another call holds the session, or with session mode off, the
+    request goes out on its own with the full system prompt.
+    """
+    if ORCHESTRATOR_SESSION_ENABLED and not session.busy:
+        return await session.complete(
+            user_message, json_mode=json_mode, temperature=0.5 if json_mode else 0.7, mode=mode,
+        )
+    system_prompt = _build_orchestrator_prompt()
+    if json_mode:
+        return await chat_completion_json(system_prompt, user_message, mode=mode)
+    return await chat_completion(system_prompt, user_message, mode=mode)
 
 
 async def generate_world_event() -> dict:
@@ -70,12 +111,13 @@ async def generate_world_event() -> dict:
     user_message = "MODE: GENERATE_EVENT\n\nGenerate a new geopolitical world event based on current tensions and missions."
     
     try:
-        response = await chat_completion_json(system_prompt, user_message)
+        response = await chat_completion_json(system_prompt, user_message, mode="generate_event")
         event = json.loads(response)
         logger.info(f"World event generated: {event.get('event_title', 'Unknown')}")
         return event
     except (json.JSONDecodeError, Exception) as e:
         logger.error(f"Failed to parse world event: {e}")
+        record_fallback("generate_event")
         # Fallback event
         return {
             "event_title": "Intelligence Intercept Detected",
@@ -90,6 +132,34 @@ async def generate_world_event() -> dict:
         }
 
 
+def _detect_target(director_order: str) -> str:
+    """Best-effort operative detection from the raw order text."""
+    for codename in OPERATIVE_CODENAMES:
+        if codename in director_order.upper():
+            return codename
+    return OPERATIVE_CODENAMES[0]  # Default fallback
+
+
+def _fallback_routing(director_order: str) -> dict:
+    """Routing used when the orchestrator response is unusable."""
+    return {
+        "target_operative": _detect_target(director_order),
+        "mission_brief": director_order,
+        "mission_type": "reconnaissance",
+        "risk_level": "medium",
+    }
+
+
+def _validate_routing(routing: dict, director_order: str) -> dict:
+    """Ensure a parsed routing targets a known operative."""
+    target = str(routing.get("target_operative", "")).upper()
+    if target not in OPERATIVE_CODENAMES:
+        # Try to extract codename from the order text
+        target = _detect_target(director_order)
+    routing["target_operative"] = target
+    return routing
+
+
 async def route_order(director_order: str) -> dict:
     """Parse a director's order and route it to the correct operative.
     
@@ -99,7 +169,6 @@ async def route_order(director_order: str) -> dict:
     Returns:
         Dict with target_operative, mission_brief, mission_type, risk_level.
     """
-    system_prompt = _build_orchestrator_prompt()
     user_message = (
         f"MODE: ROUTE_ORDER\n\n"
         f"The Director has issued the following order:\n\"{director_order}\"\n\n"
@@ -107,38 +176,61 @@ async def route_order(director_order: str) -> dict:
     )
     
     try:
-        response = await chat_completion_json(system_prompt, user_message)
-        routing = json.loads(response)
-        
-        # Validate target operative
-        target = routing.get("target_operative", "").upper()
-        if target not in OPERATIVE_CODENAMES:
-            # Try to extract codename from the order text
-            for codename in OPERATIVE_CODENAMES:
-                if codename in director_order.upper():
-                    target = codename
-                    break
-            else:
-                target = OPERATIVE_CODENAMES[0]  # Default fallback
-            routing["target_operative"] = target
-        
-        logger.info(f"Order routed to {target}: {routing.get('mission_type', 'unknown')}")
+        response = await _ask(user_message, "route_order", json_mode=True)
+        routing = _validate_routing(json.loads(response), director_order)
+        logger.info(f"Order routed to {routing['target_operative']}: {routing.get('mission_type', 'unknown')}")
         return routing
     except (json.JSONDecodeError, Exception) as e:
         logger.error(f"Failed to parse order routing: {e}")
+        record_fallback("route_order")
         # Fallback: try to detect operative name in order
-        target = OPERATIVE_CODENAMES[0]
-        for codename in OPERATIVE_CODENAMES:
-            if codename in director_order.upper():
-                target = codename
-                break
-        
-        return {
-            "target_operative": target,
-            "mission_brief": director_order,
-            "mission_type": "reconnaissance",
-            "risk_level": "medium",
-        }
+        return _fallback_routing(director_order)
+
+
+async def route_orders(director_orders: list) -> list:
+    """Route several Director orders with a single orchestrator call.
+    
+    Args:
+        director_orders: List of raw text orders from the Director.
+    
+    Returns:
+        List of routing dicts, one per order and in the same order.
+        Entries the orchestrator fails to return fall back to keyword routing.
+    """
+    if len(director_orders) == 1:
+        return [await route_order(director_orders[0])]
+    
+    orders_text = "\n".join([
+        f"{i + 1}. \"{order}\"" for i, order in enumerate(director_orders)
+    ])
+    user_message = (
+        f"MODE: ROUTE_ORDER\n\n"
+        f"The Director has issued {len(director_orders)} orders:\n{orders_text}\n\n"
+        f"Route every order. Respond with a JSON object whose \"routes\" key is an array "
+        f"containing one routing object per order, in the same order."
+    )
+    
+    try:
+        response = await _ask(user_message, "route_order", json_mode=True)
+        parsed = json.loads(response)
+        routes = parsed.get("routes", []) if isinstance(parsed, dict) else parsed
+        if not isinstance(routes, list):
+            raise ValueError("Batch routing response has no routes array")
+    except (json.JSONDecodeError, Exception) as e:
+        logger.error(f"Failed to parse batch order routing: {e}")
+        routes = []
+    
+    routings = []
+    for i, director_order in enumerate(director_orders):
+        if i < len(routes) and isinstance(routes[i], dict):
+            routings.append(_validate_routing(routes[i], director_order))
+        else:
+            record_fallback("route_order")
+            routings.append(_fallback_routing(director_order))
+    
+    logger.info(f"Batch of {len(director_orders)} orders routed to "
+                f"{', '.join(r['target_operative'] for r in routings)}")
+    return routings
 
 
 async def synthesize_intel(operative_reports: list) -> str:
@@ -150,8 +242,6 @@ async def synthesize_intel(operative_reports: list) -> str:
     Returns:
         Narrative intelligence briefing string.
     """
-    system_prompt = _build_orchestrator_prompt()
-    
     reports_text = "\n\n".join([
         f"=== REPORT FROM {r['codename']} ===\n{r['response']}"
         for r in operative_reports
@@ -164,11 +254,12 @@ async def synthesize_intel(operative_reports: list) -> str:
     )
     
     try:
-        briefing = await chat_completion(system_prompt, user_message)
+        briefing = await _ask(user_message, "synthesize_intel")
         logger.info("Intel synthesis completed")
         return briefing
     except Exception as e:
         logger.error(f"Intel synthesis failed: {e}")
+        record_fallback("synthesize_intel")
         return "INTELLIGENCE BRIEFING UNAVAILABLE — Communications disruption detected. Awaiting signal restoration."
 
 
@@ -178,7 +269,6 @@ async def generate_turn_briefing() -> str:
     Returns:
         Narrative briefing string summarizing current situation.
     """
-    system_prompt = _build_orchestrator_prompt()
     user_message = (
         "MODE: TURN_BRIEFING\n\n"
         "Generate a comprehensive situation briefing for the Director at the start of this turn. "
@@ -186,9 +276,10 @@ async def generate_turn_briefing() -> str:
     )
     
     try:
-        briefing = await chat_completion(system_prompt, user_message)
+        briefing = await _ask(user_message, "turn_briefing")
         logger.info("Turn briefing generated")
         return briefing
     except Exception as e:
         logger.error(f"Turn briefing generation failed: {e}")
+        record_fallback("turn_briefing")
         return "SITUATION BRIEFING UNAVAILABLE — Secure channel interference detected. Manual assessment recommended."
@@ -0,0 +1,173 @@
+"""Orchestrator session mode — one running conversation per game, fed state changes instead of full dumps."""
+import asyncio
+import json
+import logging
+from typing import Callable, List, Optional
+
+from config import ORCHESTRATOR_REANCHOR_EVERY, ORCHESTRATOR_SESSION_MAX_CHARS
+from agents.mistral_client import chat_messages
+from game.state_manager import get_state_version
+from utils.json_patch import make_patch
+
+logger = logging.getLogger(__name__)
+
+
+def _new_missions(old: list, new: list) -> list:
+    """Missions in `new` that were not in `old`.
+
+    The mission log is sent as a sliding window, so the new window starts with
+    the tail of the old one; whatever follows that overlap is new.
+    """
+    for overlap in range(min(len(old), len(new)), 0, -1):
+        if old[-overlap:] == new[:overlap]:
+            return new[overlap:]
+    return new
+
+
+def state_delta(old: dict, new: dict) -> List[dict]:
+    """JSON Patch from one orchestrator context to the next.
+
+    Missions that scrolled out of the window are not reported as removed;
+    only newly logged missions are appended.
+    """
+    patch = make_patch(
+        {k: v for k, v in old.items() if k != "mission_log"},
+        {k: v for k, v in new.items() if k != "mission_log"},
+    )
+    for mission in _new_missions(old.get("mission_log", []), new.get("mission_log", [])):
+        patch.append({"op": "add", "path": "/mission_log/-", "value": mission})
+    return patch
+
+
+class OrchestratorSession:
+    """A bounded orchestrator conversation.
+
+    The first call (the anchor) sends the full system prompt. Later calls send
+    only a JSON Patch of what changed since the previous call, ahead of the
+    request itself. The conversation is re-anchored with a fresh prompt every
+    ORCHESTRATOR_REANCHOR_EVERY calls, when it grows past
+    ORCHESTRATOR_SESSION_MAX_CHARS, when a delta would be larger than the
+    prompt it replaces, or when the game is reset.
+
+    One call runs at a time; `busy` tells callers to use a one-off prompt instead.
+    """
+
+    def __init__(self, build_prompt: Callable[[], str], build_context: Callable[[], dict],
+                 reanchor_every: int = ORCHESTRATOR_REANCHOR_EVERY,
+                 max_chars: int = ORCHESTRATOR_SESSION_MAX_CHARS):
+        self._build_prompt = build_prompt
+        self._build_context = build_context
+        self._reanchor_every = reanchor_every
+        self._max_chars = max_chars
+        self._lock = asyncio.Lock()
+        self._system: Optional[str] = None
+        self._messages: List[dict] = []
+        self._context: Optional[dict] = None
+        self._version: Optional[int] = None
+        self._calls_since_anchor = 0
+        self._stats = {"calls": 0, "anchors": 0, "delta_calls": 0, "errors": 0, "chars_sent": 0}
+
+    @property
+    def busy(self) -> bool:
+        return self._lock.locked()
+
+    def reset(self) -> None:
+        """Drop the conversation; the next call re-anchors."""
+        self._system = None
+        self._messages = []
+        self._context = None
+        self._version = None
+        self._calls_since_anchor = 0
+
+    def _anchor(self, version: int, context: Optional[dict] = None) -> None:
+        self._system = self._build_prompt()
+        self._context = context if context is not None else self._build_context()
+        self._version = version
+        self._messages = []
+        self._calls_since_anchor = 0
+        self._stats["anchors"] += 1
+        logger.info(f"Orchestrator session anchored at state version {version}")
+
+    def _history_chars(self) -> int:
+        return sum(len(m["content"]) for m in self._messages)
+
+    def _prepare(self, user_message: str) -> str:
+        """Re-anchor if due, otherwise prefix the request with the state changes."""
+        version = get_state_version()
+        if (self._system is None
+                or self._calls_since_anchor >= self._reanchor_every
+                or self._history_chars() + len(user_message) > self._max_chars):
+            self._anchor(version)
+            return user_message
+
+        if version == self._version:
+            self._stats["delta_calls"] += 1
+            return f"STATE UPDATE: no change since the previous message.\n\n{user_message}"
+
+        context = self._build_context()
+        # A lower turn number means a new game was started (possibly by another worker)
+        if context["world_state"]["turn"] < self._context["world_state"]["turn"]:
+            self._anchor(version, context)
+            return user_message
+
+        patch = state_delta(self._context, context)
+        delta = json.dumps(patch)
+        if len(delta) > len(self._system) // 2:
+            self._anchor(version, context)
+            return user_message
+
+        self._context = context
+        self._version = version
+        self._stats["delta_calls"] += 1
+        if not patch:
+            return f"STATE UPDATE: no change since the previous message.\n\n{user_message}"
+        return (
+            "STATE UPDATE: changes since the previous message, as a JSON Patch (RFC 6902) "
+            "against the state in your instructions with all earlier updates applied "
+            "(/world_state, /mission_log and /operatives are the CURRENT WORLD STATE, "
+            "MISSION HISTORY and AVAILABLE OPERATIVES sections):\n"
+            f"{delta}\n\n{user_message}"
+        )
+
+    async def complete(self, user_message: str, json_mode: bool = False, temperature: float = 0.7,
+                       mode: str = "other") -> str:
+        """Send a request within the conversation.
+
+        Args:
+            user_message: The request (e.g. a MODE: ROUTE_ORDER message).
+            json_mode: Ask for a JSON object response.
+            temperature: Sampling temperature.
+            mode: What the call is for; tags its metrics.
+
+        Returns:
+            The assistant's response text.
+
+        Raises:
+            Whatever the Mistral call raises; the conversation is reset first.
+        """
+        async with self._lock:
+            content = self._prepare(user_message)
+            messages = [{"role": "system", "content": self._system}, *self._messages,
+                        {"role": "user", "content": content}]
+            self._stats["calls"] += 1
+            self._stats["chars_sent"] += sum(len(m["content"]) for m in messages)
+            try:
+                response = await chat_messages(messages, temperature=temperature, json_mode=json_mode, mode=mode)
+            except Exception:
+                self._stats["errors"] += 1
+                self.reset()
+                raise
+            self._messages.append({"role": "user", "content": content})
+            self._messages.append({"role": "assistant", "content": response})
+            self._calls_since_anchor += 1
+            return response
+
+    def stats(self) -> dict:
+        """Call counters and the current conversation size."""
+        return {
+            **self._stats,
+            "anchored": self._system is not None,
+            "calls_since_anchor": self._calls_since_anchor,
+            "history_messages": len(self._messages),
+            "history_chars": self._history_chars(),
+        }
@@ -0,0 +1,97 @@
+"""Prompt templates — compiled once from agents/prompts/, recompiled when the file changes."""
+import logging
+import re
+from typing import Callable, Dict, List, Optional, Tuple
+from config import PROMPTS_DIR
+
+logger = logging.getLogger(__name__)
+
+# {placeholder} names — JSON examples in the prompts ({"routes": ...}) never match
+_PLACEHOLDER = re.compile(r"\{([a-z_]+)\}")
+
+
+class CompiledTemplate:
+    """A template split into literal text and placeholder segments.
+
+    Rendering is a single join instead of one str.replace pass per placeholder.
+    """
+
+    def __init__(self, source: str, stamp: int):
+        self.stamp = stamp
+        self.segments: List[Tuple[bool, str]] = []
+        position = 0
+        for match in _PLACEHOLDER.finditer(source):
+            if match.start() > position:
+                self.segments.append((False, source[position:match.start()]))
+            self.segments.append((True, match.group(1)))
+            position = match.end()
+        if position < len(source):
+            self.segments.append((False, source[position:]))
+
+    @property
+    def placeholders(self) -> List[str]:
+        return [text for is_placeholder, text in self.segments if is_placeholder]
+
+    def render(self, values: Dict[str, str]) -> str:
+        """Fill in placeholders; any without a value are left as written."""
+        return "".join(
+            values.get(text, f"{{{text}}}") if is_placeholder else text
+            for is_placeholder, text in self.segments
+        )
+
+
+_templates: Dict[str, CompiledTemplate] = {}
+
+# Rendered prompts keyed by name, stored with the (state version, template stamp) they were built at
+_rendered: Dict[str, Tuple[Tuple[int, int], str]] = {}
+
+
+def load_template(name: str) -> CompiledTemplate:
+    """Get a compiled prompt template by name (its filename without .md).
+
+    The file's modification time is checked on every call, so edits to a
+    prompt take effect without a restart.
+    """
+    path = PROMPTS_DIR / f"{name}.md"
+    stamp = path.stat().st_mtime_ns
+    template = _templates.get(name)
+    if template is None or template.stamp != stamp:
+        with open(path, "r", encoding="utf-8") as f:
+            template = CompiledTemplate(f.read(), stamp)
+        if name in _templates:
+            logger.info(f"Prompt template '{name}' changed on disk — recompiled")
+        _templates[name] = template
+    return template
+
+
+def render_cached(cache_key: str, template: CompiledTemplate, version: int,
+                  build_values: Callable[[], Dict[str, str]]) -> str:
+    """Render a template, reusing the last result while state and template are unchanged.
+
+    Args:
+        cache_key: Identifies the prompt (e.g. 'orchestrator', 'operative:CEDAR').
+        template: The compiled template.
+        version: Current state version.
+        build_values: Builds the placeholder values; only called on a cache miss.
+
+    Returns:
+        The rendered prompt.
+    """
+    stamp = (version, template.stamp)
+    cached: Optional[Tuple[Tuple[int, int], str]] = _rendered.get(cache_key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    prompt = template.render(build_values())
+    _rendered[cache_key] = (stamp, prompt)
+    return prompt
+
+
+def preload_templates() -> int:
+    """Compile every prompt template (used at startup).
+
+    Returns:
+        Number of templates loaded.
+    """
+    for path in sorted(PROMPTS_DIR.glob("*.md")):
+        load_template(path.stem)
+    return len(_templates)
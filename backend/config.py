@@ -13,6 +13,18 @@ MISTRAL_MODEL = "mistral-large-latest"
 
 # ElevenLabs Config
 ELEVENLABS_MODEL = "eleven_multilingual_v2"
+ELEVENLABS_OUTPUT_FORMAT = "mp3_44100_128"
+TTS_MAX_CONCURRENCY_PER_VOICE = 2  # Concurrent TTS renders allowed per voice
+TTS_SEGMENTATION_ENABLED = True    # Synthesize and cache per sentence, then join
+TTS_PRERENDER_ENABLED = True       # Render transmission audio in the background
+TTS_PRERENDER_MAX_QUEUE = 50       # Pending pre-render jobs before new ones are skipped
+TTS_PRERENDER_STATUS_LIMIT = 500   # Audio status entries remembered for the UI
+
+# Audio variants — transcoded from the ElevenLabs MP3 with ffmpeg
+FFMPEG_BINARY = os.getenv("FFMPEG_BINARY", "ffmpeg")
+TRANSCODE_WORKERS = 2
+AUDIO_FORMATS = {"mp3": 64, "opus": 32}  # Format -> default bitrate (kbps) when transcoding
+AUDIO_BITRATES_KBPS = [16, 24, 32, 48, 64, 96, 128]
 
 # Voice IDs per operative (placeholder — replace with real IDs)
 OPERATIVE_VOICES = {
@@ -42,6 +54,65 @@ TENSION_PRESSURE_THRESHOLD = 80
 TENSION_PRESSURE_CHANCE = 0.20
 RELATIONSHIP_WARNING_CHANCE = 0.40
 
+# Batch orders
+MAX_BATCH_ORDERS = 10
+
+# Server-Sent Events
+EVENT_QUEUE_SIZE = 100        # Buffered events per client before it is told to resync
+EVENT_REPLAY_SIZE = 200       # Recent events replayed to reconnecting clients
+EVENT_KEEPALIVE_SECONDS = 15
+
+# Shared upstream HTTP pool (Mistral + ElevenLabs). HTTP/2 needs the optional h2 package.
+HTTP2_ENABLED = os.getenv("HTTP2_ENABLED", "true").lower() not in ("0", "false", "no")
+HTTP_POOL_MAX_CONNECTIONS = 20
+HTTP_POOL_MAX_KEEPALIVE = 10
+HTTP_KEEPALIVE_EXPIRY = 120.0
+HTTP_CONNECT_TIMEOUT = 5.0
+HTTP_READ_TIMEOUT = 60.0
+HTTP_WRITE_TIMEOUT = 10.0
+HTTP_POOL_TIMEOUT = 10.0
+
+# Startup warm-up — pre-open upstream API connections at boot (bounded by the timeout)
+UPSTREAM_WARMUP_ENABLED = os.getenv("UPSTREAM_WARMUP", "true").lower() not in ("0", "false", "no")
+UPSTREAM_WARMUP_TIMEOUT = 5.0
+
+# Admission control for LLM-bound endpoints — per session (X-Session-Id header
+# or client address) and across all sessions; requests beyond the queue get a 429
+ADMISSION_MAX_IN_FLIGHT = int(os.getenv("ADMISSION_MAX_IN_FLIGHT", "2"))
+ADMISSION_MAX_QUEUE = int(os.getenv("ADMISSION_MAX_QUEUE", "4"))
+ADMISSION_GLOBAL_MAX_IN_FLIGHT = int(os.getenv("ADMISSION_GLOBAL_MAX_IN_FLIGHT", "8"))
+ADMISSION_GLOBAL_MAX_QUEUE = int(os.getenv("ADMISSION_GLOBAL_MAX_QUEUE", "32"))
+# Starting estimate of request duration, used for Retry-After until real timings arrive
+ADMISSION_INITIAL_SERVICE_SECONDS = 10.0
+
+# Operative response format — "text" (HIDDEN_META block) or "json" (structured output with a schema)
+OPERATIVE_RESPONSE_MODE = os.getenv("OPERATIVE_RESPONSE_MODE", "text").lower()
+
+# Orchestrator session mode — keep one conversation per game and send state changes
+# instead of the full state; re-anchored with a fresh full prompt every N calls
+ORCHESTRATOR_SESSION_ENABLED = os.getenv("ORCHESTRATOR_SESSION", "false").lower() in ("1", "true", "yes")
+ORCHESTRATOR_REANCHOR_EVERY = 6
+ORCHESTRATOR_SESSION_MAX_CHARS = 24000  # Conversation size (excluding the anchor) that forces a re-anchor
+
+# Tracing — spans for recent traces are kept in memory (see /api/debug/traces); set
+# TRACE_EXPORT_PATH to also append them to a file as OTLP/JSON
+TRACING_ENABLED = os.getenv("TRACING", "true").lower() not in ("0", "false", "no")
+TRACE_BUFFER_SIZE = 100
+TRACE_EXPORT_PATH = os.getenv("TRACE_EXPORT_PATH", "")
+
+# Background jobs — long turn operations submitted through /api/jobs
+JOB_MAX_CONCURRENCY = 4
+JOB_RETENTION = 100
+
+# Versioned state — how many past versions of each public view are kept for ?since= deltas
+SNAPSHOT_HISTORY_SIZE = 50
+
+# Sections the /api/dashboard endpoint can return (all by default)
+DASHBOARD_FIELDS = [
+    "world_state", "operatives", "transmissions", "briefing",
+    "rogue_events", "current_event", "game_over",
+]
+
 # Game over conditions
 EXPOSURE_GAME_OVER = 100
 TRUST_GAME_OVER = 0
@@ -54,4 +125,32 @@ MEMORY_INITIAL_DIR = BASE_DIR / "memory_initial"
 STATE_DIR = BASE_DIR / "state"
 STATE_INITIAL_DIR = BASE_DIR / "state_initial"
 VOICE_CACHE_DIR = BASE_DIR / "voice" / "cache"
+VOICE_CACHE_MAX_BYTES = int(os.getenv("VOICE_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+# Replays only reorder the index in memory; it is written out at most this often (and on shutdown)
+VOICE_CACHE_INDEX_FLUSH_SECONDS = float(os.getenv("VOICE_CACHE_INDEX_FLUSH_SECONDS", "30"))
 PROMPTS_DIR = BASE_DIR / "agents" / "prompts"
+
+# Transmission log — append-only JSONL, with the most recent entries kept in memory
+TRANSMISSION_LOG_PATH = STATE_DIR / "transmissions.jsonl"
+TRANSMISSION_BUFFER_SIZE = 200
+TRANSMISSION_PAGE_SIZE = 50
+TRANSMISSION_MAX_PAGE_SIZE = 200
+
+# Session state (current event, briefing, rogue events, state version):
+# "memory" for a single process, "sqlite" to share it across uvicorn workers
+SESSION_STORE = os.getenv("SESSION_STORE", "memory")
+SESSION_DB_PATH = STATE_DIR / "session.db"
+
+# Request profiling (opt-in). When enabled, requests sending an X-Profile header (equal to
+# PROFILING_TOKEN, if set) and a PROFILE_SAMPLE_RATE fraction of all requests are profiled.
+# PROFILING_TOKEN also guards the /api/admin/profiles routes (X-Admin-Token header).
+PROFILING_ENABLED = os.getenv("PROFILING", "false").lower() in ("1", "true", "yes")
+PROFILING_TOKEN = os.getenv("PROFILING_TOKEN", "")
+PROFILE_SAMPLE_RATE = float(os.getenv("PROFILE_SAMPLE_RATE", "0"))
+PROFILE_DIR = BASE_DIR / "profiles"
+PROFILE_MAX_COUNT = 50
+PROFILE_MAX_BYTES = 50 * 1024 * 1024
+
+# State I/O accounting. Counts always go to /metrics; with IO_DEBUG_HEADERS set, each
+# response also reports its state file reads, writes and bytes in X-State-* headers.
+IO_DEBUG_HEADERS = os.getenv("IO_DEBUG_HEADERS", "false").lower() in ("1", "true", "yes")
@@ -3,17 +3,21 @@ import logging
 from game.state_manager import (
     load_world_state, save_world_state,
     update_region_tension, update_agency_exposure, update_director_trust,
-    mark_asset_compromised, add_mission_to_log,
+    mark_asset_compromised, add_mission_to_log, state_lock,
 )
 from game.operative_manager import (
     load_operative, update_loyalty, log_mission, set_operative_status,
     add_known_compromise,
 )
+from game.events import publish, WORLD_UPDATE
 from config import OPERATIVE_REGIONS
+from utils.tracing import traced
 
 logger = logging.getLogger(__name__)
 
 
+@traced("decision.process_operative_response")
+@state_lock
 def process_operative_response(codename: str, order: str, response_data: dict) -> dict:
     """Process an operative's response — update world state, loyalty, log mission.
     
@@ -39,6 +43,7 @@ def process_operative_response(codename: str, order: str, response_data: dict) -
         "loyalty_shift": loyalty_shift,
         "tension_impact": tension_impact,
         "exposure_impact": exposure_impact,
+        "meta_valid": response_data.get("meta_valid", True),
     }
     
     # 1. Update loyalty
@@ -91,6 +96,7 @@ def process_operative_response(codename: str, order: str, response_data: dict) -
         "order_received": order,
         "decision": decision,
         "reason_hidden": reason,
+        "meta_valid": changes["meta_valid"],
         "reported_to_director": response_data.get("response", "")[:200],
         "outcome": f"Decision: {decision}, loyalty shift: {loyalty_shift + extra_shift}",
     }
@@ -112,6 +118,7 @@ def process_operative_response(codename: str, order: str, response_data: dict) -
     return changes
 
 
+@state_lock
 def process_event_response(director_action: str, event: dict) -> dict:
     """Process the Director's response to a world event.
     
@@ -136,6 +143,7 @@ def process_event_response(director_action: str, event: dict) -> dict:
     }
 
 
+@state_lock
 def handle_extraction_order(codename: str) -> dict:
     """Handle a Director's order to extract an operative.
     
@@ -158,6 +166,7 @@ def handle_extraction_order(codename: str) -> dict:
     # Remove from compromised list if present
     if codename in state["compromised_assets"]:
         state["compromised_assets"].remove(codename)
+        publish(WORLD_UPDATE, {"compromised_assets": list(state["compromised_assets"])})
     
     save_world_state(state)
     
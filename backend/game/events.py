@@ -0,0 +1,120 @@
+"""Game Event Bus — pushes typed state-change events to Server-Sent Events subscribers."""
+import asyncio
+import itertools
+import json
+import logging
+from collections import deque
+from typing import AsyncIterator, Optional, Set
+
+from config import EVENT_QUEUE_SIZE, EVENT_REPLAY_SIZE, EVENT_KEEPALIVE_SECONDS
+
+logger = logging.getLogger(__name__)
+
+# Event types
+TENSION_CHANGE = "tension_change"
+WORLD_UPDATE = "world_update"
+SIGNAL_CHANGE = "signal_change"
+TRANSMISSION = "transmission"
+ROGUE_ALERT = "rogue_alert"
+WORLD_EVENT = "world_event"
+TURN_ADVANCE = "turn_advance"
+AUDIO_READY = "audio_ready"
+GAME_RESET = "game_reset"
+JOB_PROGRESS = "job_progress"
+JOB_COMPLETE = "job_complete"
+RESYNC = "resync"
+
+
+class EventBus:
+    """Fan-out of game events to connected clients.
+
+    Publishing is synchronous so it can be called from the plain functions
+    that mutate game state. Each subscriber gets a bounded queue; a client too
+    slow to keep up is told to resync instead of holding events in memory.
+    Recent events are kept so reconnecting clients can catch up.
+    """
+
+    def __init__(self):
+        self._subscribers: Set[asyncio.Queue] = set()
+        self._recent: deque = deque(maxlen=EVENT_REPLAY_SIZE)
+        self._ids = itertools.count(1)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def publish(self, event_type: str, data: dict) -> None:
+        """Publish an event to every subscriber.
+
+        Args:
+            event_type: One of the event type constants.
+            data: JSON-serializable payload (public information only).
+        """
+        event = {"id": next(self._ids), "type": event_type, "data": data}
+        self._recent.append(event)
+        if not self._subscribers:
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if self._loop is not None and running is not self._loop:
+            # Called from a worker thread — hand off to the event loop
+            self._loop.call_soon_threadsafe(self._deliver, event)
+        else:
+            self._deliver(event)
+
+    def _deliver(self, event: dict) -> None:
+        for queue in list(self._subscribers):
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                # Slow client — drop its backlog and ask it to refetch
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait({"id": event["id"], "type": RESYNC, "data": {}})
+
+    def subscribe(self, last_event_id: Optional[int] = None) -> asyncio.Queue:
+        """Register a subscriber queue, replaying events after `last_event_id`."""
+        self._loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=EVENT_QUEUE_SIZE)
+        if last_event_id is not None:
+            missed = [e for e in self._recent if e["id"] > last_event_id]
+            if self._recent and self._recent[0]["id"] > last_event_id + 1:
+                # Gap is older than the replay buffer
+                missed = [{"id": self._recent[-1]["id"], "type": RESYNC, "data": {}}]
+            for event in missed[-EVENT_QUEUE_SIZE:]:
+                queue.put_nowait(event)
+        self._subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        self._subscribers.discard(queue)
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    async def stream(self, last_event_id: Optional[int] = None) -> AsyncIterator[str]:
+        """Yield Server-Sent Events frames for one client until it disconnects."""
+        queue = self.subscribe(last_event_id)
+        try:
+            while True:
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=EVENT_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+                yield (
+                    f"id: {event['id']}\n"
+                    f"event: {event['type']}\n"
+                    f"data: {json.dumps(event['data'])}\n\n"
+                )
+        finally:
+            self.unsubscribe(queue)
+
+
+# Global event bus instance
+event_bus = EventBus()
+
+
+def publish(event_type: str, data: dict) -> None:
+    """Publish a game event on the global bus."""
+    event_bus.publish(event_type, data)
@@ -0,0 +1,207 @@
+"""Job Manager — runs long turn operations in the background and reports their progress."""
+import asyncio
+import contextvars
+import logging
+import time
+import uuid
+from collections import Counter, OrderedDict
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+from config import JOB_MAX_CONCURRENCY, JOB_RETENTION
+from game.events import publish, JOB_PROGRESS, JOB_COMPLETE
+from game.session_store import SessionStore, session_store
+from utils.admission import AdmissionTicket
+from utils.io_budget import io_scope
+from utils.metrics import registry, record_queue_wait
+from utils.tracing import span
+
+logger = logging.getLogger(__name__)
+
+# Job status values
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+JOB_CANCELLED = "cancelled"
+
+ACTIVE_STATUSES = (JOB_QUEUED, JOB_RUNNING)
+
+# The job whose work is running in the current task (None outside of jobs)
+_current_job: contextvars.ContextVar[Optional[dict]] = contextvars.ContextVar("current_job", default=None)
+
+
+def report_progress(stage: str) -> None:
+    """Record that the current job has reached a stage (e.g. routing → operative → synthesis).
+
+    A no-op when called outside a job, so turn logic can report progress
+    unconditionally and still be used by the synchronous endpoints.
+    """
+    job = _current_job.get()
+    if job is None:
+        return
+    job["stage"] = stage
+    job["stages"].append(stage)
+    job_manager.save(job)
+    publish(JOB_PROGRESS, {"id": job["id"], "kind": job["kind"], "stage": stage})
+
+
+class JobManager:
+    """Runs submitted jobs on a bounded pool of tasks.
+
+    Jobs are kept in memory (the most recent JOB_RETENTION of them) so their
+    status and result can be fetched after completion; completion is also
+    pushed over the event bus. Each job's public view is mirrored to the
+    session store so any worker can report on it, but a job runs — and can
+    only be cancelled — on the worker that accepted it.
+    """
+
+    def __init__(self, max_concurrency: int = JOB_MAX_CONCURRENCY, retention: int = JOB_RETENTION,
+                 store: SessionStore = session_store):
+        self.store = store
+        self._slots = asyncio.Semaphore(max_concurrency)
+        self._jobs: "OrderedDict[str, dict]" = OrderedDict()
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._retention = retention
+
+    def submit(self, kind: str, work: Callable[[], Awaitable[dict]],
+               dedupe_key: Optional[str] = None,
+               ticket: Optional[AdmissionTicket] = None) -> Tuple[dict, bool]:
+        """Queue a job.
+
+        Args:
+            kind: Job type label (e.g. 'order', 'start-turn').
+            work: Zero-argument coroutine function doing the work.
+            dedupe_key: Identical submissions share this key; while one is
+                still queued or running, it is returned instead of starting another.
+            ticket: Admission ticket to wait on before running; the job takes
+                ownership and releases it when finished.
+
+        Returns:
+            Tuple of (public job view, whether a new job was created).
+        """
+        if dedupe_key is not None:
+            for job in self._jobs.values():
+                if job["dedupe_key"] == dedupe_key and job["status"] in ACTIVE_STATUSES:
+                    return _public(job), False
+
+        job = {
+            "id": str(uuid.uuid4()),
+            "kind": kind,
+            "status": JOB_QUEUED,
+            "stage": None,
+            "stages": [],
+            "dedupe_key": dedupe_key,
+            "created_at": datetime.now().isoformat(),
+            "started_at": None,
+            "finished_at": None,
+            "result": None,
+            "error": None,
+            "io": None,
+        }
+        self._jobs[job["id"]] = job
+        self.save(job)
+        task = asyncio.create_task(self._run(job, work, ticket))
+        if ticket is not None:
+            ticket.claim()
+            # Also covers a job cancelled before it ever started running
+            task.add_done_callback(lambda _: ticket.close())
+        self._tasks[job["id"]] = task
+        self._prune()
+        return _public(job), True
+
+    async def _run(self, job: dict, work: Callable[[], Awaitable[dict]],
+                   ticket: Optional[AdmissionTicket]) -> None:
+        queued_at = time.monotonic()
+        try:
+            if ticket is not None:
+                await ticket.acquire()
+            async with self._slots:
+                record_queue_wait("job", time.monotonic() - queued_at)
+                job["status"] = JOB_RUNNING
+                job["started_at"] = datetime.now().isoformat()
+                self.save(job)
+                _current_job.set(job)
+                # The job's state I/O, counted apart from the request that submitted it
+                with io_scope() as io, span(f"job.{job['kind']}", **{"job.id": job["id"]}):
+                    try:
+                        job["result"] = await work()
+                    finally:
+                        job["io"] = io.as_dict()
+                job["status"] = JOB_SUCCEEDED
+        except asyncio.CancelledError:
+            job["status"] = JOB_CANCELLED
+        except Exception as e:
+            logger.error(f"Job {job['id']} ({job['kind']}) failed: {e}")
+            job["status"] = JOB_FAILED
+            job["error"] = str(e)
+        finally:
+            job["finished_at"] = datetime.now().isoformat()
+            self._tasks.pop(job["id"], None)
+            self.save(job)
+            publish(JOB_COMPLETE, _public(job))
+
+    def save(self, job: dict) -> None:
+        """Mirror a job's public view to the session store."""
+        self.store.set(f"job:{job['id']}", _public(job))
+
+    def _prune(self) -> None:
+        """Forget the oldest finished jobs beyond the retention limit."""
+        excess = len(self._jobs) - self._retention
+        for job_id in [jid for jid, j in self._jobs.items() if j["status"] not in ACTIVE_STATUSES]:
+            if excess <= 0:
+                break
+            del self._jobs[job_id]
+            self.store.delete(f"job:{job_id}")
+            excess -= 1
+
+    def get(self, job_id: str) -> Optional[dict]:
+        """Get a job's public view (including jobs run by other workers), or None if unknown."""
+        job = self._jobs.get(job_id)
+        return _public(job) if job else self.store.get(f"job:{job_id}")
+
+    def list(self, active_only: bool = False) -> list:
+        """Get the jobs retained by this worker, newest first."""
+        jobs = reversed(self._jobs.values())
+        return [_public(j) for j in jobs if not active_only or j["status"] in ACTIVE_STATUSES]
+
+    def cancel(self, job_id: str) -> Optional[dict]:
+        """Cancel a queued or running job.
+
+        Work already committed to game state (e.g. an operative response that
+        was recorded) is not rolled back.
+
+        Returns:
+            The job's public view, or None if this worker does not own the job.
+        """
+        job = self._jobs.get(job_id)
+        if job is None:
+            return None
+        task = self._tasks.get(job_id)
+        if task is not None:
+            task.cancel()
+        return _public(job)
+
+    async def shutdown(self) -> None:
+        """Cancel all unfinished jobs (used on shutdown)."""
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def _public(job: dict) -> dict:
+    """Job fields exposed to clients."""
+    public = {k: v for k, v in job.items() if k != "dedupe_key"}
+    public["stages"] = list(job["stages"])
+    return public
+
+
+# Global job manager instance
+job_manager = JobManager()
+
+registry.gauge(
+    "shadow_jobs", "Jobs held by this worker, by status.",
+    lambda: {(status,): count for status, count in Counter(j["status"] for j in job_manager._jobs.values()).items()},
+    ["status"],
+)
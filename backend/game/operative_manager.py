@@ -4,10 +4,15 @@ import logging
 import random
 from typing import Optional
 from config import MEMORY_DIR, OPERATIVE_CODENAMES
+from game.events import publish, SIGNAL_CHANGE
+from game.state_manager import bump_state_version, state_lock, write_state_file, STATE_EPOCH
+from utils.io_budget import record_read, record_write
+from utils.tracing import traced
 
 logger = logging.getLogger(__name__)
 
 
+@traced("state.load_operative")
 def load_operative(codename: str) -> dict:
     """Load an operative's memory/state from JSON.
     
@@ -18,10 +23,13 @@ def load_operative(codename: str) -> dict:
         Operative data dict.
     """
     path = MEMORY_DIR / f"{codename}.json"
-    with open(path, "r") as f:
-        return json.load(f)
+    with open(path, "rb") as f:
+        raw = f.read()
+    record_read("operative", len(raw))
+    return json.loads(raw)
 
 
+@traced("state.save_operative")
 def save_operative(codename: str, data: dict) -> None:
     """Save an operative's memory/state to JSON.
     
@@ -30,8 +38,11 @@ def save_operative(codename: str, data: dict) -> None:
         data: Full operative data dict.
     """
     path = MEMORY_DIR / f"{codename}.json"
-    with open(path, "w") as f:
-        json.dump(data, f, indent=2)
+    raw = json.dumps(data, indent=2)
+    with state_lock:
+        write_state_file(path, raw)
+    record_write("operative", len(raw))
+    bump_state_version()
     logger.info(f"Operative {codename} state saved (loyalty={data.get('loyalty', '?')})")
 
 
@@ -50,6 +61,7 @@ def load_all_operatives() -> dict:
     return operatives
 
 
+@state_lock
 def log_mission(codename: str, mission: dict) -> dict:
     """Log a completed mission to an operative's memory.
     
@@ -71,9 +83,11 @@ def log_mission(codename: str, mission: dict) -> dict:
     data["missions"].append(mission)
     save_operative(codename, data)
     logger.info(f"Mission logged for {codename}: {mission.get('id', 'unknown')}")
+    publish(SIGNAL_CHANGE, public_info_from_data(data))
     return data
 
 
+@state_lock
 def update_loyalty(codename: str, delta: int) -> dict:
     """Update an operative's loyalty score, clamped 0-100.
     
@@ -89,9 +103,11 @@ def update_loyalty(codename: str, delta: int) -> dict:
     data["loyalty"] = max(0, min(100, old + delta))
     save_operative(codename, data)
     logger.info(f"{codename} loyalty: {old} → {data['loyalty']}")
+    publish(SIGNAL_CHANGE, public_info_from_data(data))
     return data
 
 
+@state_lock
 def update_relationship(codename: str, target: str, description: str) -> dict:
     """Update the relationship between two operatives.
     
@@ -110,6 +126,7 @@ def update_relationship(codename: str, target: str, description: str) -> dict:
     return data
 
 
+@state_lock
 def add_known_compromise(codename: str, compromised_codename: str) -> dict:
     """Record that an operative knows another is compromised.
     
@@ -128,6 +145,7 @@ def add_known_compromise(codename: str, compromised_codename: str) -> dict:
     return data
 
 
+@state_lock
 def set_operative_status(codename: str, status: str) -> dict:
     """Set operative status (active, dark, compromised, extracted).
     
@@ -143,6 +161,7 @@ def set_operative_status(codename: str, status: str) -> dict:
     data["current_status"] = status
     save_operative(codename, data)
     logger.info(f"{codename} status: {old} → {status}")
+    publish(SIGNAL_CHANGE, public_info_from_data(data))
     return data
 
 
@@ -151,11 +170,18 @@ def get_operative_public_info(codename: str) -> dict:
     
     Signal quality is a noisy proxy for loyalty — the player shouldn't see exact loyalty.
     """
-    data = load_operative(codename)
+    return public_info_from_data(load_operative(codename))
+
+
+def public_info_from_data(data: dict) -> dict:
+    """Build an operative's public info from already-loaded operative data."""
     loyalty = data["loyalty"]
     
-    # Signal quality: loyalty ± random noise (±10), clamped 0-100
-    noise = random.randint(-10, 10)
+    # Signal quality: loyalty ± random noise (±10), clamped 0-100.
+    # Noise is re-rolled per mission rather than per read, so repeated
+    # refreshes return the same value and versioned views stay cacheable.
+    rng = random.Random(f"{STATE_EPOCH}:{data['codename']}:{len(data['missions'])}")
+    noise = rng.randint(-10, 10)
     signal_quality = max(0, min(100, loyalty + noise))
     
     return {
@@ -170,4 +196,5 @@ def get_operative_public_info(codename: str) -> dict:
 
 def get_all_operatives_public() -> list:
     """Get public info for all operatives."""
-    return [get_operative_public_info(cn) for cn in OPERATIVE_CODENAMES]
+    operatives = load_all_operatives()
+    return [public_info_from_data(operatives[cn]) for cn in OPERATIVE_CODENAMES if cn in operatives]
@@ -1,6 +1,7 @@
 """Rogue Engine — autonomous event trigger system that runs every turn end."""
 import random
 import logging
+import uuid
 from datetime import datetime
 from typing import List
 
@@ -13,17 +14,21 @@ from config import (
 from game.state_manager import (
     load_world_state, save_world_state,
     update_region_tension, update_agency_exposure,
-    mark_asset_compromised, add_rogue_event,
+    mark_asset_compromised, add_rogue_event, state_lock,
 )
 from game.operative_manager import (
-    load_operative, update_loyalty, set_operative_status,
-    add_known_compromise, load_all_operatives,
+    load_operative, save_operative, update_loyalty, set_operative_status,
+    load_all_operatives, public_info_from_data,
 )
+from game.events import publish, ROGUE_ALERT, SIGNAL_CHANGE
 from agents.mistral_client import chat_completion
+from utils.metrics import record_fallback
+from utils.tracing import traced
 
 logger = logging.getLogger(__name__)
 
 
+@traced("rogue.check_autonomous_triggers")
 async def check_autonomous_triggers() -> List[dict]:
     """Run all autonomous trigger checks at end of turn.
     
@@ -65,11 +70,16 @@ async def check_autonomous_triggers() -> List[dict]:
                 if event:
                     events.append(event)
     
-    # Save any state changes
-    state = load_world_state()
+    # The handlers saved their changes through this same state dict, so it is
+    # current; with no events there is nothing to write
+    if events:
+        for event in events:
+            event["id"] = str(uuid.uuid4())
+            add_rogue_event(state, event)
+        save_world_state(state)
+    
     for event in events:
-        add_rogue_event(state, event)
-    save_world_state(state)
+        publish(ROGUE_ALERT, event)
     
     return events
 
@@ -136,12 +146,17 @@ async def _handle_silent_defection(codename: str, operative: dict, state: dict)
     set_operative_status(codename, "dark")
     mark_asset_compromised(state, codename)
     
-    for other_codename in OPERATIVE_CODENAMES:
-        if other_codename != codename:
-            other = load_operative(other_codename)
-            if other["current_status"] == "active":
-                update_loyalty(other_codename, -3)
-                add_known_compromise(other_codename, codename)
+    # One read and one write per other operative (loyalty and known compromises together)
+    with state_lock:
+        for other_codename in OPERATIVE_CODENAMES:
+            if other_codename != codename:
+                other = load_operative(other_codename)
+                if other["current_status"] == "active":
+                    other["loyalty"] = max(0, min(100, other["loyalty"] - 3))
+                    if codename not in other["known_compromises"]:
+                        other["known_compromises"].append(codename)
+                    save_operative(other_codename, other)
+                    publish(SIGNAL_CHANGE, public_info_from_data(other))
     
     save_world_state(state)
     
@@ -287,10 +302,11 @@ async def _generate_rogue_narration(codename: str, event_type: str, context: str
     )
     
     try:
-        narration = await chat_completion(system_prompt, user_message, temperature=0.8)
+        narration = await chat_completion(system_prompt, user_message, temperature=0.8, mode="rogue_narration")
         return narration
     except Exception as e:
         logger.error(f"Rogue narration generation failed: {e}")
+        record_fallback("rogue_narration")
         # Fallback narration
         fallbacks = {
             "defection_warning": f"ALERT: {codename} has reported being approached by an unknown foreign intelligence operative. The contact attempted to recruit {codename} using undisclosed leverage. {codename} has self-reported this contact per protocol. Assessment: volatile situation requiring immediate Director attention.",
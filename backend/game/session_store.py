@@ -0,0 +1,135 @@
+"""Session Store — turn session state shared by every worker process.
+
+The in-memory store is for single-process development. The SQLite store keeps
+the state in a local database file so `uvicorn --workers N` sees one game.
+"""
+import json
+import logging
+import os
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Optional
+
+from config import SESSION_STORE, SESSION_DB_PATH
+
+logger = logging.getLogger(__name__)
+
+
+class SessionStore(ABC):
+    """Key/value store for JSON-serializable session state."""
+
+    @abstractmethod
+    def get(self, key: str, default: Any = None) -> Any:
+        ...
+
+    @abstractmethod
+    def set(self, key: str, value: Any) -> None:
+        ...
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        ...
+
+    @abstractmethod
+    def setdefault(self, key: str, value: Any) -> Any:
+        """Store `value` unless the key exists; return the stored value either way."""
+
+    @abstractmethod
+    def incr(self, key: str) -> int:
+        """Atomically increment an integer counter (missing counts as 0) and return it."""
+
+
+class InMemorySessionStore(SessionStore):
+    """Process-local store (development / single worker)."""
+
+    def __init__(self):
+        self._data: dict = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._data.get(key, default)
+
+    def set(self, key: str, value: Any) -> None:
+        self._data[key] = value
+
+    def delete(self, key: str) -> None:
+        self._data.pop(key, None)
+
+    def setdefault(self, key: str, value: Any) -> Any:
+        with self._lock:
+            return self._data.setdefault(key, value)
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            self._data[key] = self._data.get(key, 0) + 1
+            return self._data[key]
+
+
+class SQLiteSessionStore(SessionStore):
+    """Store backed by a local SQLite database shared across worker processes."""
+
+    def __init__(self, path=SESSION_DB_PATH):
+        self.path = str(path)
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        # Connections must not be shared across a fork
+        if self._conn is None or self._pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=10, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("CREATE TABLE IF NOT EXISTS session (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+            self._conn = conn
+            self._pid = os.getpid()
+        return self._conn
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            row = self._connection().execute("SELECT value FROM session WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row else default
+
+    def set(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._connection().execute(
+                "INSERT INTO session (key, value) VALUES (?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+                (key, json.dumps(value)),
+            )
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._connection().execute("DELETE FROM session WHERE key = ?", (key,))
+
+    def setdefault(self, key: str, value: Any) -> Any:
+        with self._lock:
+            conn = self._connection()
+            conn.execute("INSERT OR IGNORE INTO session (key, value) VALUES (?, ?)", (key, json.dumps(value)))
+            row = conn.execute("SELECT value FROM session WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0])
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            row = self._connection().execute(
+                "INSERT INTO session (key, value) VALUES (?, '1') "
+                "ON CONFLICT(key) DO UPDATE SET value = CAST(value AS INTEGER) + 1 "
+                "RETURNING value",
+                (key,),
+            ).fetchone()
+        return int(row[0])
+
+
+def create_session_store(kind: str = SESSION_STORE) -> SessionStore:
+    """Build the session store selected by configuration ('memory' or 'sqlite')."""
+    if kind == "sqlite":
+        logger.info(f"Session state stored in {SESSION_DB_PATH}")
+        return SQLiteSessionStore()
+    if kind != "memory":
+        logger.warning(f"Unknown SESSION_STORE '{kind}' — using in-memory session state")
+    return InMemorySessionStore()
+
+
+# Global session store instance
+session_store = create_session_store()
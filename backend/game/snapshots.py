@@ -0,0 +1,76 @@
+"""Versioned Snapshots — public views cached per state version, with JSON-Patch deltas."""
+import logging
+from collections import OrderedDict
+from typing import Any, Callable, List, Optional, Tuple
+
+from config import OPERATIVE_CODENAMES, SNAPSHOT_HISTORY_SIZE
+from game.state_manager import (
+    load_world_state, get_public_world_state, is_game_over, get_state_version, STATE_EPOCH,
+)
+from game.operative_manager import load_all_operatives, public_info_from_data
+from utils.json_patch import make_patch
+
+logger = logging.getLogger(__name__)
+
+
+class VersionedView:
+    """A public document rebuilt only when the state version changes.
+
+    Recent versions are kept so a client can ask for just the changes since
+    the version it already has.
+    """
+
+    def __init__(self, name: str, builder: Callable[[], Any], history: int = SNAPSHOT_HISTORY_SIZE):
+        self.name = name
+        self._builder = builder
+        self._history: "OrderedDict[int, Any]" = OrderedDict()
+        self._max_history = history
+
+    def current(self) -> Tuple[int, Any]:
+        """Get (version, document) for the current state version."""
+        version = get_state_version()
+        doc = self._history.get(version)
+        if doc is None:
+            doc = self._builder()
+            self._history[version] = doc
+            while len(self._history) > self._max_history:
+                self._history.popitem(last=False)
+        return version, doc
+
+    def etag(self, version: int) -> str:
+        """Strong ETag for this view at a version."""
+        return f'"{STATE_EPOCH}-{self.name}-{version}"'
+
+    def delta_since(self, since: int) -> Optional[List[dict]]:
+        """JSON Patch from version `since` to the current version.
+
+        Returns:
+            List of patch operations, or None if `since` is no longer retained.
+        """
+        version, doc = self.current()
+        if since == version:
+            return []
+        base = self._history.get(since)
+        if base is None:
+            return None
+        return make_patch(base, doc)
+
+    def clear(self) -> None:
+        self._history.clear()
+
+
+def _build_public_snapshot() -> dict:
+    """Read world state and every operative once and build all public views from them."""
+    state = load_world_state()
+    operatives = load_all_operatives()
+    return {
+        "world_state": get_public_world_state(state),
+        "operatives": [public_info_from_data(operatives[cn]) for cn in OPERATIVE_CODENAMES if cn in operatives],
+        "game_over": is_game_over(state) or {"game_over": False},
+    }
+
+
+# One read of the state files per version, shared by every public view
+public_snapshot_view = VersionedView("snapshot", _build_public_snapshot)
+world_state_view = VersionedView("world", lambda: public_snapshot_view.current()[1]["world_state"])
+operatives_view = VersionedView("operatives", lambda: public_snapshot_view.current()[1]["operatives"])
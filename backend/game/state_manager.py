@@ -1,24 +1,126 @@
 """World State Manager — read/write world state JSON, update regions, exposure, trust, etc."""
 import json
 import logging
+import os
+import tempfile
+import threading
+import uuid
+from contextlib import ContextDecorator
+from pathlib import Path
 from typing import Optional
 from config import STATE_DIR
+from game.events import publish, TENSION_CHANGE, WORLD_UPDATE, WORLD_EVENT, TURN_ADVANCE
+from game.session_store import session_store
+from utils.io_budget import record_read, record_write
+from utils.tracing import traced
+
+try:
+    import fcntl
+except ImportError:  # Windows — the state lock then only covers this process
+    fcntl = None
 
 logger = logging.getLogger(__name__)
 
 WORLD_STATE_PATH = STATE_DIR / "world_state.json"
 
+# Identifies the version sequence, so ETags from a previous sequence never match.
+# Shared through the session store so every worker agrees on it.
+STATE_EPOCH = session_store.setdefault("state_epoch", uuid.uuid4().hex[:8])
+
+
+def get_state_version() -> int:
+    """Get the current state version (incremented on every committed write)."""
+    return session_store.get("state_version", 0)
+
+
+def bump_state_version() -> int:
+    """Record that game state has changed.
+
+    Returns:
+        The new state version.
+    """
+    return session_store.incr("state_version")
+
+
+class StateLock(ContextDecorator):
+    """Exclusive lock for writes and read-modify-write cycles on the state files.
+
+    Held across threads and worker processes (an flock on a lock file next to
+    the world state) and reentrant, so locked helpers can call each other.
+    Use it as a context manager or decorator around synchronous code only: a
+    coroutine awaiting while it holds the lock would let others on the same
+    thread in.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._depth = 0
+        self._fd: Optional[int] = None
+
+    def __enter__(self):
+        self._lock.acquire()
+        if self._depth == 0 and fcntl is not None:
+            try:
+                fd = os.open(WORLD_STATE_PATH.with_name(".state.lock"), os.O_RDWR | os.O_CREAT, 0o644)
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            except BaseException:
+                self._lock.release()
+                raise
+            self._fd = fd
+        self._depth += 1
+        return self
+
+    def __exit__(self, *exc) -> bool:
+        self._depth -= 1
+        if self._depth == 0 and self._fd is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+            os.close(self._fd)
+            self._fd = None
+        self._lock.release()
+        return False
+
+
+# Global state lock instance
+state_lock = StateLock()
+
+
+def write_state_file(path: Path, raw: str) -> None:
+    """Replace a state file atomically.
+
+    The JSON is written to a temporary file in the same directory and moved
+    over the old one, so a reader in another worker sees the old file or the
+    new one, never a truncated one.
+    """
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.stem}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(raw)
+        # mkstemp creates the file private to this user
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
 
+@traced("state.load_world_state")
 def load_world_state() -> dict:
     """Load the current world state from JSON file."""
-    with open(WORLD_STATE_PATH, "r") as f:
-        return json.load(f)
+    with open(WORLD_STATE_PATH, "rb") as f:
+        raw = f.read()
+    record_read("world_state", len(raw))
+    return json.loads(raw)
 
 
+@traced("state.save_world_state")
 def save_world_state(state: dict) -> None:
     """Save the world state to JSON file."""
-    with open(WORLD_STATE_PATH, "w") as f:
-        json.dump(state, f, indent=2)
+    # ASCII-only (json's default), so its length is the byte count
+    raw = json.dumps(state, indent=2)
+    with state_lock:
+        write_state_file(WORLD_STATE_PATH, raw)
+    record_write("world_state", len(raw))
+    bump_state_version()
     logger.info(f"World state saved (turn {state.get('turn', '?')})")
 
 
@@ -42,6 +144,11 @@ def update_region_tension(state: dict, region_key: str, delta: int) -> dict:
         old = state["regions"][region_key]["tension"]
         state["regions"][region_key]["tension"] = max(0, min(100, old + delta))
         logger.info(f"Region {region_key} tension: {old} → {state['regions'][region_key]['tension']}")
+        publish(TENSION_CHANGE, {
+            "region": region_key,
+            "tension": state["regions"][region_key]["tension"],
+            "delta": state["regions"][region_key]["tension"] - old,
+        })
     return state
 
 
@@ -58,6 +165,7 @@ def update_agency_exposure(state: dict, delta: int) -> dict:
     old = state["agency_exposure_level"]
     state["agency_exposure_level"] = max(0, min(100, old + delta))
     logger.info(f"Agency exposure: {old} → {state['agency_exposure_level']}")
+    publish(WORLD_UPDATE, {"agency_exposure_level": state["agency_exposure_level"]})
     return state
 
 
@@ -74,6 +182,7 @@ def update_director_trust(state: dict, delta: int) -> dict:
     old = state["director_trust_score"]
     state["director_trust_score"] = max(0, min(100, old + delta))
     logger.info(f"Director trust: {old} → {state['director_trust_score']}")
+    publish(WORLD_UPDATE, {"director_trust_score": state["director_trust_score"]})
     return state
 
 
@@ -90,6 +199,7 @@ def mark_asset_compromised(state: dict, codename: str) -> dict:
     if codename not in state["compromised_assets"]:
         state["compromised_assets"].append(codename)
         logger.warning(f"Asset compromised: {codename}")
+        publish(WORLD_UPDATE, {"compromised_assets": list(state["compromised_assets"])})
     return state
 
 
@@ -118,6 +228,7 @@ def add_world_event(state: dict, event: dict) -> dict:
         Updated world state.
     """
     state["world_events"].append(event)
+    publish(WORLD_EVENT, event)
     return state
 
 
@@ -169,6 +280,7 @@ def advance_turn(state: dict) -> dict:
     state["turn"] += 1
     state["threat_level"] = calculate_threat_level(state)
     logger.info(f"Turn advanced to {state['turn']} — Threat: {state['threat_level']}")
+    publish(TURN_ADVANCE, {"turn": state["turn"], "threat_level": state["threat_level"]})
     return state
 
 
@@ -0,0 +1,198 @@
+"""Transmission Log — append-only JSONL store with a bounded in-memory window."""
+import json
+import logging
+from collections import deque
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from config import TRANSMISSION_LOG_PATH, TRANSMISSION_BUFFER_SIZE
+from utils.io_budget import record_read, record_write
+
+logger = logging.getLogger(__name__)
+
+
+class TransmissionLog:
+    """Every transmission of the current game, persisted one JSON line each.
+
+    The most recent transmissions are kept in memory; older pages are read
+    back from the file. Each record gets a sequence number (its line index),
+    which is what cursors resolve to: ids in the window are indexed in memory,
+    older ones are looked up in the file. The file is the source of truth: it
+    is read lazily, and before each read the log picks up lines appended by
+    other worker processes.
+    """
+
+    def __init__(self, path: Path = TRANSMISSION_LOG_PATH, buffer_size: int = TRANSMISSION_BUFFER_SIZE):
+        self.path = path
+        self._recent: deque = deque(maxlen=buffer_size)
+        self._seq_by_id: Dict[str, int] = {}
+        self._count = 0
+        self._offset = 0
+        self._inode: Optional[int] = None
+
+    def _reset_window(self) -> None:
+        self._recent.clear()
+        self._seq_by_id.clear()
+        self._count = 0
+        self._offset = 0
+
+    def _sync(self) -> None:
+        """Read any lines appended to the file since the last sync."""
+        try:
+            st = self.path.stat()
+        except FileNotFoundError:
+            # Cleared (possibly by another worker)
+            self._reset_window()
+            self._inode = None
+            return
+        if st.st_ino != self._inode or st.st_size < self._offset:
+            # Replaced or truncated since we last read it — start over
+            self._reset_window()
+            self._inode = st.st_ino
+        if st.st_size == self._offset:
+            return
+
+        with open(self.path, "rb") as f:
+            f.seek(self._offset)
+            data = f.read()
+        record_read("transmissions", len(data))
+        # Only consume complete lines; a partial last line is still being written
+        complete = data[:data.rfind(b"\n") + 1]
+        self._offset += len(complete)
+        for line in complete.splitlines():
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                logger.warning(f"Skipping corrupt transmission log line {self._count + 1}")
+                continue
+            record["seq"] = self._count
+            if len(self._recent) == self._recent.maxlen:
+                # Keep the id index to the window; older ids are found in the file
+                self._seq_by_id.pop(self._recent[0]["id"], None)
+            self._seq_by_id[record["id"]] = self._count
+            self._recent.append(record)
+            self._count += 1
+
+    def __len__(self) -> int:
+        self._sync()
+        return self._count
+
+    def append(self, transmission: dict) -> dict:
+        """Persist a transmission and add it to the recent window.
+
+        Returns:
+            The stored record (with its sequence number).
+        """
+        # A single O_APPEND write, so lines from concurrent workers never interleave
+        line = json.dumps(transmission) + "\n"
+        with open(self.path, "a") as f:
+            f.write(line)
+        record_write("transmissions", len(line))
+        self._sync()
+        return {**transmission, "seq": self._seq_of(transmission["id"])}
+
+    def _seq_of(self, transmission_id: str) -> int:
+        """Sequence number of a transmission, from the window or else the file.
+
+        Raises:
+            KeyError: If the id is not in the log.
+        """
+        seq = self._seq_by_id.get(transmission_id)
+        if seq is not None:
+            return seq
+        # Only records older than the window can be missing from the index
+        oldest_buffered = self._count - len(self._recent)
+        if oldest_buffered == 0:
+            raise KeyError(transmission_id)
+
+        seq = 0
+        nbytes = 0
+        with open(self.path, "r") as f:
+            for line in f:
+                if seq >= oldest_buffered:
+                    break
+                nbytes += len(line)
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if record.get("id") == transmission_id:
+                    record_read("transmissions", nbytes)
+                    return seq
+                seq += 1
+        record_read("transmissions", nbytes)
+        raise KeyError(transmission_id)
+
+    def _slice(self, start: int, end: int) -> List[dict]:
+        """Records with sequence numbers in [start, end)."""
+        start = max(0, start)
+        end = min(self._count, end)
+        if start >= end:
+            return []
+        oldest_buffered = self._count - len(self._recent)
+        if start >= oldest_buffered:
+            return [self._recent[i - oldest_buffered] for i in range(start, end)]
+
+        # Older than the in-memory window — read the range back from disk
+        records = []
+        seq = 0
+        nbytes = 0
+        with open(self.path, "r") as f:
+            for line in f:
+                nbytes += len(line)
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if seq >= start:
+                    records.append({**record, "seq": seq})
+                seq += 1
+                if seq >= end:
+                    break
+        record_read("transmissions", nbytes)
+        return records
+
+    def page(self, after: Optional[str] = None, before: Optional[str] = None, limit: int = 50) -> dict:
+        """Get one page of transmissions in chronological order.
+
+        With `after`, returns the entries following that id; with `before`, the
+        entries preceding it; with neither, the most recent entries.
+
+        Raises:
+            KeyError: If a cursor id is not in the log.
+
+        Returns:
+            Dict with 'transmissions', 'next_cursor' (pass as `after` to poll
+            for newer entries), 'prev_cursor' (pass as `before` for older
+            history, None at the start of the log) and 'total'.
+        """
+        self._sync()
+        if after is not None:
+            start = self._seq_of(after) + 1
+            end = start + limit
+        elif before is not None:
+            end = self._seq_of(before)
+            start = max(0, end - limit)
+        else:
+            end = self._count
+            start = max(0, end - limit)
+
+        records = self._slice(start, end)
+        return {
+            "transmissions": records,
+            "next_cursor": records[-1]["id"] if records else after,
+            "prev_cursor": records[0]["id"] if records and records[0]["seq"] > 0 else None,
+            "total": self._count,
+        }
+
+    def clear(self) -> None:
+        """Delete every transmission (used when a new game starts)."""
+        self.path.unlink(missing_ok=True)
+        self._reset_window()
+        self._inode = None
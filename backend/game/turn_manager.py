@@ -1,32 +1,78 @@
 """Turn Manager — orchestrates the full turn cycle."""
+import asyncio
 import logging
 import uuid
 from datetime import datetime
-from typing import Optional
+from typing import AsyncIterator, Optional
 
+from config import TRANSMISSION_PAGE_SIZE
 from game.state_manager import (
     load_world_state, save_world_state, advance_turn,
-    add_world_event, is_game_over, update_region_tension
+    add_world_event, is_game_over, update_region_tension, state_lock,
 )
 from game.operative_manager import load_all_operatives
 from game.decision_engine import process_operative_response, process_event_response
 from agents.orchestrator import (
-    generate_world_event, route_order, synthesize_intel, generate_turn_briefing
+    generate_world_event, route_order, route_orders, synthesize_intel, generate_turn_briefing,
+    reset_session as reset_orchestrator_session,
 )
 from agents.operative import call_operative
+from game.events import publish, TRANSMISSION
+from game.jobs import report_progress
+from game.transmission_log import TransmissionLog
+from game.session_store import SessionStore, session_store
+from voice.prerender import (
+    enqueue_prerender, get_audio_status, PRIORITY_ROGUE_EVENT,
+)
+from utils.tracing import traced
 
 logger = logging.getLogger(__name__)
 
 
 class TurnManager:
-    """Manages the game turn cycle."""
+    """Manages the game turn cycle.
+    
+    Session state lives in the session store rather than on the instance, so
+    every worker process serves the same game.
+    """
+    
+    def __init__(self, store: SessionStore = session_store):
+        self.store = store
+        self.transmissions = TransmissionLog()
+    
+    @property
+    def current_event(self) -> Optional[dict]:
+        return self.store.get("current_event")
+    
+    @current_event.setter
+    def current_event(self, event: Optional[dict]) -> None:
+        self.store.set("current_event", event)
     
-    def __init__(self):
-        self.current_event: Optional[dict] = None
-        self.transmissions: list = []
-        self.current_briefing: str = ""
-        self.rogue_events: list = []
+    @property
+    def current_briefing(self) -> str:
+        return self.store.get("current_briefing", "")
     
+    @current_briefing.setter
+    def current_briefing(self, briefing: str) -> None:
+        self.store.set("current_briefing", briefing)
+    
+    @property
+    def rogue_events(self) -> list:
+        return self.store.get("rogue_events", [])
+    
+    @rogue_events.setter
+    def rogue_events(self, events: list) -> None:
+        self.store.set("rogue_events", events)
+    
+    def reset(self) -> None:
+        """Clear all session state for a new game."""
+        self.current_event = None
+        self.current_briefing = ""
+        self.rogue_events = []
+        self.transmissions.clear()
+        reset_orchestrator_session()
+    
+    @traced("turn.start_turn")
     async def start_turn(self) -> dict:
         """Start a new turn: generate world event + briefing.
         
@@ -41,6 +87,7 @@ class TurnManager:
             return {"game_over": game_over}
         
         # Generate world event
+        report_progress("world_event")
         event = await generate_world_event()
         event["turn"] = state["turn"]
         event["timestamp"] = datetime.now().isoformat()
@@ -49,19 +96,22 @@ class TurnManager:
         affected_region = event.get("affected_region")
         tension_impact = event.get("tension_impact", 0)
         if affected_region and tension_impact:
-            state = load_world_state()
-            update_region_tension(state, affected_region, tension_impact)
-            save_world_state(state)
+            with state_lock:
+                state = load_world_state()
+                update_region_tension(state, affected_region, tension_impact)
+                save_world_state(state)
         
         # Store event in world state
-        state = load_world_state()
-        add_world_event(state, event)
-        state["world_events"] = state.get("world_events", [])[-20:]  # Keep last 20
-        save_world_state(state)
+        with state_lock:
+            state = load_world_state()
+            add_world_event(state, event)
+            state["world_events"] = state.get("world_events", [])[-20:]  # Keep last 20
+            save_world_state(state)
         
         self.current_event = event
         
         # Generate briefing
+        report_progress("briefing")
         briefing = await generate_turn_briefing()
         self.current_briefing = briefing
         
@@ -72,6 +122,7 @@ class TurnManager:
             "game_over": None,
         }
     
+    @traced("turn.issue_order")
     async def issue_order(self, director_order: str) -> dict:
         """Director issues an order — routed through orchestrator to operative.
         
@@ -89,20 +140,120 @@ class TurnManager:
             return {"game_over": game_over}
         
         # Route order through orchestrator
+        report_progress("routing")
         routing = await route_order(director_order)
         target = routing["target_operative"]
         mission_brief = routing.get("mission_brief", director_order)
         
         # Call operative agent
+        report_progress("operative")
         response_data = await call_operative(target, mission_brief)
         
+        transmission, changes = self._record_response(director_order, routing, response_data, state["turn"])
+        
+        # Synthesize intel
+        report_progress("synthesis")
+        intel_report = await synthesize_intel([{
+            "codename": target,
+            "response": response_data["response"],
+        }])
+        
+        return {
+            "transmission": transmission,
+            "routing": routing,
+            "intel_report": intel_report,
+            "changes": changes,
+            "game_over": is_game_over(load_world_state()),
+        }
+    
+    async def issue_orders(self, director_orders: list) -> AsyncIterator[dict]:
+        """Director issues several orders at once.
+        
+        All orders are routed with a single orchestrator call, the operative
+        calls run in parallel, and results are yielded as each one finishes.
+        
+        Args:
+            director_orders: List of raw text orders from the Director.
+        
+        Yields:
+            Dicts tagged by "type": one "order_result" (or "order_error") per
+            order, then "intel_report" and a final "complete" entry.
+        """
+        state = load_world_state()
+        
+        # Check game over
+        game_over = is_game_over(state)
+        if game_over:
+            yield {"type": "complete", "game_over": game_over}
+            return
+        
+        # Route all orders in one orchestrator call
+        report_progress("routing")
+        routings = await route_orders(director_orders)
+        
+        async def dispatch(index: int, routing: dict):
+            mission_brief = routing.get("mission_brief", director_orders[index])
+            try:
+                return index, await call_operative(routing["target_operative"], mission_brief), None
+            except Exception as e:
+                logger.error(f"Batch order {index} to {routing['target_operative']} failed: {e}")
+                return index, None, e
+        
+        report_progress("operative")
+        tasks = [
+            asyncio.create_task(dispatch(i, routing))
+            for i, routing in enumerate(routings)
+        ]
+        reports = []
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                index, response_data, error = await next_done
+                routing = routings[index]
+                if error is not None:
+                    yield {"type": "order_error", "index": index, "routing": routing, "error": str(error)}
+                    continue
+                
+                transmission, changes = self._record_response(
+                    director_orders[index], routing, response_data, state["turn"]
+                )
+                reports.append({
+                    "codename": routing["target_operative"],
+                    "response": response_data["response"],
+                })
+                yield {
+                    "type": "order_result",
+                    "index": index,
+                    "transmission": transmission,
+                    "routing": routing,
+                    "changes": changes,
+                }
+        finally:
+            for task in tasks:
+                task.cancel()
+        
+        # Synthesize intel across every report in the batch
+        if reports:
+            report_progress("synthesis")
+            intel_report = await synthesize_intel(reports)
+            yield {"type": "intel_report", "intel_report": intel_report}
+        
+        yield {"type": "complete", "game_over": is_game_over(load_world_state())}
+    
+    def _record_response(self, director_order: str, routing: dict, response_data: dict, turn: int) -> tuple:
+        """Apply an operative response to game state and log its transmission.
+        
+        Returns:
+            Tuple of (transmission record, state changes dict).
+        """
+        target = routing["target_operative"]
+        
         # Process response — update state
         changes = process_operative_response(target, director_order, response_data)
         
         # Create transmission record
         transmission = {
             "id": str(uuid.uuid4()),
-            "turn": state["turn"],
+            "turn": turn,
             "timestamp": datetime.now().isoformat(),
             "codename": target,
             "order": director_order,
@@ -110,21 +261,17 @@ class TurnManager:
             "mission_type": routing.get("mission_type", "unknown"),
             "risk_level": routing.get("risk_level", "unknown"),
         }
-        self.transmissions.append(transmission)
         
-        # Synthesize intel
-        intel_report = await synthesize_intel([{
-            "codename": target,
-            "response": response_data["response"],
-        }])
+        # Audio status is tracked by the pre-renderer, not persisted with the record
+        record = self.transmissions.append(transmission)
         
-        return {
-            "transmission": transmission,
-            "routing": routing,
-            "intel_report": intel_report,
-            "changes": changes,
-            "game_over": is_game_over(load_world_state()),
+        # Start rendering audio now so it's cached before the Director presses play
+        transmission = {
+            **record,
+            "audio_status": enqueue_prerender(record["id"], target, record["response"]),
         }
+        publish(TRANSMISSION, transmission)
+        return transmission, changes
     
     async def respond_to_event(self, action: str) -> dict:
         """Director responds to the current world event.
@@ -141,6 +288,7 @@ class TurnManager:
         result = process_event_response(action, self.current_event)
         return result
     
+    @traced("turn.end_turn")
     async def end_turn(self) -> dict:
         """End the current turn — advance state, check triggers.
         
@@ -153,13 +301,23 @@ class TurnManager:
         from game.rogue_engine import check_autonomous_triggers
         
         # Check autonomous triggers
+        report_progress("rogue_check")
         rogue_events = await check_autonomous_triggers()
+        
+        # Pre-render alert narration so it's ready when the Director listens
+        for event in rogue_events:
+            event["audio_status"] = enqueue_prerender(
+                event["id"], event["codename"], event.get("narration", ""),
+                priority=PRIORITY_ROGUE_EVENT,
+            )
         self.rogue_events = rogue_events
         
         # Advance turn
-        state = load_world_state()  # Reload after rogue events may have modified state
-        advance_turn(state)
-        save_world_state(state)
+        report_progress("advance")
+        with state_lock:
+            state = load_world_state()  # Reload after rogue events may have modified state
+            advance_turn(state)
+            save_world_state(state)
         
         return {
             "new_turn": state["turn"],
@@ -168,9 +326,24 @@ class TurnManager:
             "game_over": is_game_over(state),
         }
     
-    def get_transmissions(self) -> list:
-        """Get all transmissions from the current game."""
-        return self.transmissions
+    def get_transmissions(self, after: Optional[str] = None, before: Optional[str] = None,
+                          limit: int = TRANSMISSION_PAGE_SIZE) -> dict:
+        """Get one page of the current game's transmissions.
+        
+        Args:
+            after: Return entries following this transmission id.
+            before: Return entries preceding this transmission id.
+            limit: Maximum entries to return.
+        
+        Returns:
+            Page dict from TransmissionLog.page, with audio status filled in.
+        
+        Raises:
+            KeyError: If a cursor id is unknown.
+        """
+        page = self.transmissions.page(after=after, before=before, limit=limit)
+        page["transmissions"] = [_with_audio_status(t) for t in page["transmissions"]]
+        return page
     
     def get_current_briefing(self) -> str:
         """Get the current turn's briefing."""
@@ -178,7 +351,13 @@ class TurnManager:
     
     def get_rogue_events(self) -> list:
         """Get rogue events from the last turn."""
-        return self.rogue_events
+        return [_with_audio_status(e) for e in self.rogue_events]
+
+
+def _with_audio_status(record: dict) -> dict:
+    """Copy of a transmission/rogue event with its current pre-render status."""
+    status = get_audio_status(record.get("id", "")) or record.get("audio_status")
+    return {**record, "audio_status": status}
 
 
 # Global turn manager instance
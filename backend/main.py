@@ -1,10 +1,34 @@
 """Shadow Network — FastAPI Backend Entry Point."""
+import time
+_import_started = time.perf_counter()
+
+import asyncio
 import logging
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 
+from config import UPSTREAM_WARMUP_ENABLED, ORCHESTRATOR_SESSION_ENABLED
 from routes.game import router as game_router
 from routes.audio import router as audio_router
+from routes.jobs import router as jobs_router
+from routes.debug import router as debug_router
+from routes.admin import router as admin_router
+from agents import mistral_client, orchestrator
+from agents.templates import preload_templates
+from game.jobs import job_manager
+from game.snapshots import public_snapshot_view
+from game.turn_manager import turn_manager
+from voice import elevenlabs_client
+from voice.cache import voice_cache
+from voice.prerender import stop_prerender_worker
+from voice.transcode import shutdown_transcoder
+from utils.startup import startup_timer, FirstRequestTimer
+from utils.http_pool import close_http_client, get_pool_stats
+from utils.metrics import render_metrics, CONTENT_TYPE
+from utils.tracing import tracer, TracingMiddleware, TRACE_HEADER
+from utils.profiling import ProfilingMiddleware, PROFILE_ID_HEADER
+from utils.io_budget import IOBudgetMiddleware, IO_HEADERS
 
 # Configure logging
 logging.basicConfig(
@@ -14,11 +38,46 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+startup_timer.mark_imported(_import_started)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Startup/shutdown hooks.
+    
+    Startup warms everything the first request would otherwise pay for:
+    prompt templates, game state, the voice cache index and upstream
+    API connections.
+    """
+    with startup_timer.step("voice_cache"):
+        voice_cache.load()
+    with startup_timer.step("prompt_templates"):
+        preload_templates()
+    with startup_timer.step("game_state"):
+        public_snapshot_view.current()
+        logger.info(f"Transmission log loaded ({len(turn_manager.transmissions)} entries)")
+    if UPSTREAM_WARMUP_ENABLED:
+        with startup_timer.step("upstream_connections"):
+            await asyncio.gather(mistral_client.warm_up(), elevenlabs_client.warm_up())
+    startup_timer.mark_ready()
+    yield
+    await job_manager.shutdown()
+    await stop_prerender_worker()
+    shutdown_transcoder()
+    voice_cache.flush()
+    await close_http_client()
+    # The SDK clients wrap the closed pool; a restarted lifespan must build new ones
+    mistral_client.reset_client()
+    elevenlabs_client.reset_client()
+    tracer.flush()
+
+
 # Create FastAPI app
 app = FastAPI(
     title="Shadow Network",
     description="Cold War Spy Agency Simulator — Backend API",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # CORS — allow React frontend
@@ -28,11 +87,27 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[TRACE_HEADER, PROFILE_ID_HEADER, *IO_HEADERS],
 )
 
+# State file reads/writes per request, in /metrics (and X-State-* headers with IO_DEBUG_HEADERS=true)
+app.add_middleware(IOBudgetMiddleware)
+
+# Opt-in request profiling (PROFILING=true); profiles are listed under /api/admin/profiles
+app.add_middleware(ProfilingMiddleware)
+
+# Root span per request; the trace id is returned in X-Trace-Id (see /api/debug/traces)
+app.add_middleware(TracingMiddleware)
+
+# Times the first request after boot (see /health)
+app.add_middleware(FirstRequestTimer)
+
 # Register routers
 app.include_router(game_router)
 app.include_router(audio_router)
+app.include_router(jobs_router)
+app.include_router(debug_router)
+app.include_router(admin_router)
 
 
 @app.get("/")
@@ -46,7 +121,22 @@ async def root():
 
 @app.get("/health")
 async def health():
-    return {"status": "ok"}
+    return {"status": "ok", "startup": startup_timer.report()}
+
+
+@app.get("/health/upstream")
+async def upstream_health():
+    """Shared upstream connection pool settings, per-host connection reuse and orchestrator session use."""
+    return {
+        **get_pool_stats(),
+        "orchestrator_session": {"enabled": ORCHESTRATOR_SESSION_ENABLED, **orchestrator.session.stats()},
+    }
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """LLM token, latency, error and fallback counters, state I/O and queue depths, in Prometheus text format."""
+    return Response(content=render_metrics(), media_type=CONTENT_TYPE)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,59 @@
+"""Admin routes — list, download and delete request profiles."""
+import logging
+from typing import Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import FileResponse, PlainTextResponse
+
+from config import PROFILING_ENABLED
+from utils.profiling import profile_store, render_text_report, token_matches, is_pyinstrument_available
+
+logger = logging.getLogger(__name__)
+
+
+def require_admin(x_admin_token: Optional[str] = Header(default=None)) -> None:
+    """Dependency: reject callers without the configured PROFILING_TOKEN."""
+    if not token_matches(x_admin_token):
+        raise HTTPException(status_code=403, detail="Admin token required")
+
+
+router = APIRouter(prefix="/api/admin", tags=["admin"], dependencies=[Depends(require_admin)])
+
+
+@router.get("/profiles")
+async def list_profiles():
+    """Returns stored request profiles, newest first."""
+    return {
+        "enabled": PROFILING_ENABLED,
+        "profiler": "pyinstrument" if is_pyinstrument_available() else "cprofile",
+        "profiles": profile_store.list(),
+    }
+
+
+@router.get("/profiles/{profile_id}")
+async def download_profile(profile_id: str, format: str = Query(default="raw", pattern="^(raw|text)$")):
+    """Downloads a profile artifact.
+    
+    pyinstrument profiles are HTML call trees; cProfile profiles are pstats
+    files, or a cumulative-time report with ?format=text.
+    """
+    meta = profile_store.get(profile_id)
+    if meta is None:
+        raise HTTPException(status_code=404, detail=f"Profile not found: {profile_id}")
+    path = profile_store.artifact_path(meta)
+    if not path.exists():
+        raise HTTPException(status_code=404, detail=f"Profile artifact missing: {profile_id}")
+    
+    if format == "text":
+        if meta["profiler"] != "cprofile":
+            raise HTTPException(status_code=400, detail="Text reports are only available for cProfile profiles")
+        return PlainTextResponse(render_text_report(path))
+    media_type = "text/html" if meta["profiler"] == "pyinstrument" else "application/octet-stream"
+    return FileResponse(path, media_type=media_type, filename=meta["artifact"])
+
+
+@router.delete("/profiles/{profile_id}")
+async def delete_profile(profile_id: str):
+    """Deletes a stored profile."""
+    if not profile_store.delete(profile_id):
+        raise HTTPException(status_code=404, detail=f"Profile not found: {profile_id}")
+    return {"deleted": profile_id}
@@ -1,9 +1,16 @@
 """Audio API routes — ElevenLabs TTS streaming endpoints."""
 import logging
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import Response
+from pathlib import Path
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import FileResponse, Response, StreamingResponse
 from pydantic import BaseModel
-from voice.elevenlabs_client import generate_transmission_audio
+from typing import Optional
+from config import AUDIO_FORMATS, AUDIO_BITRATES_KBPS
+from voice.elevenlabs_client import (
+    render_transmission_clip, render_transmission_variant, open_transmission_stream,
+    get_cached_clip, get_clip_by_key, get_cache_key, clear_cache, get_cache_stats,
+)
+from voice.transcode import get_transcode_stats, MEDIA_TYPES
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/audio", tags=["audio"])
@@ -13,31 +20,89 @@ class AudioRequest(BaseModel):
     text: str
 
 
+UNAVAILABLE_DETAIL = "Audio generation unavailable — ElevenLabs API may be down or unconfigured"
+
+# Clips are immutable per cache key, so browsers may keep them
+CLIP_CACHE_CONTROL = "public, max-age=86400"
+
+
+def _etag(key: str) -> str:
+    """Strong ETag for a clip, derived from its cache key."""
+    return f'"{key}"'
+
+
+def _not_modified(request: Request, etag: str) -> bool:
+    """Whether the client's If-None-Match already covers this clip."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
+
+
+def _clip_response(request: Request, key: str, path: Path, codename: str,
+                   media_type: str = MEDIA_TYPES["mp3"]) -> Response:
+    """Serve a cached clip straight from disk.
+    
+    FileResponse handles Range/If-Range requests (so <audio> seeking works)
+    and streams the file without loading it into memory.
+    """
+    etag = _etag(key)
+    headers = {"ETag": etag, "Cache-Control": CLIP_CACHE_CONTROL}
+    if _not_modified(request, etag):
+        return Response(status_code=304, headers=headers)
+    return FileResponse(
+        path,
+        media_type=media_type,
+        headers={**headers, "Content-Disposition": f"inline; filename={codename}_transmission{path.suffix}"},
+    )
+
+
+async def _variant_response(request: Request, codename: str, text: str, fmt: str,
+                            bitrate: Optional[int]) -> Response:
+    """Serve a transcoded (or source MP3) variant of a transmission from the cache."""
+    try:
+        clip = await render_transmission_variant(codename, text, fmt, bitrate)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    if clip is None:
+        raise HTTPException(status_code=503, detail=UNAVAILABLE_DETAIL)
+    
+    key, path, media_type = clip
+    return _clip_response(request, key, path, codename, media_type)
+
+
 @router.post("/generate/{codename}")
-async def generate_audio(codename: str, request: AudioRequest):
+async def generate_audio(codename: str, request: AudioRequest, http_request: Request, stream: bool = False,
+                         format: str = "mp3", bitrate: Optional[int] = None):
     """Generate TTS audio for an operative's transmission.
     
     Args:
         codename: Operative codename (determines voice).
         request: AudioRequest with text to convert.
+        stream: Forward audio chunks as they are synthesized instead of
+            buffering the whole clip (source MP3 only).
+        format: Output format — "mp3" or "opus" (Ogg).
+        bitrate: Target bitrate in kbps; transcodes the clip when set.
     
     Returns:
-        MP3 audio bytes.
+        Audio bytes in the requested format.
     """
+    codename = codename.upper()
+    if format != "mp3" or bitrate is not None:
+        return await _variant_response(http_request, codename, request.text, format, bitrate)
+    if stream:
+        return await _stream_audio(http_request, codename, request.text)
+    
     try:
-        audio_bytes = generate_transmission_audio(codename.upper(), request.text)
+        clip = await render_transmission_clip(codename, request.text)
         
-        if audio_bytes is None:
-            raise HTTPException(
-                status_code=503,
-                detail="Audio generation unavailable — ElevenLabs API may be down or unconfigured"
-            )
+        if clip is None:
+            raise HTTPException(status_code=503, detail=UNAVAILABLE_DETAIL)
         
-        return Response(
-            content=audio_bytes,
-            media_type="audio/mpeg",
-            headers={"Content-Disposition": f"inline; filename={codename}_transmission.mp3"}
-        )
+        key, path = clip
+        return _clip_response(http_request, key, path, codename)
     except HTTPException:
         raise
     except Exception as e:
@@ -45,20 +110,106 @@ async def generate_audio(codename: str, request: AudioRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/stream/{codename}")
+async def stream_audio(codename: str, text: str, request: Request, format: str = "mp3",
+                       bitrate: Optional[int] = None):
+    """Stream TTS audio for a transmission — usable directly as an <audio> src.
+    
+    Cached clips are served as seekable file responses; otherwise audio is
+    forwarded chunk by chunk as it is synthesized. Transcoded variants are
+    rendered in full before being served.
+    
+    Args:
+        codename: Operative codename (determines voice).
+        text: Transmission text to convert.
+        format: Output format — "mp3" or "opus" (Ogg).
+        bitrate: Target bitrate in kbps; transcodes the clip when set.
+    
+    Returns:
+        Audio in the requested format (chunked MP3 on a cache miss).
+    """
+    if format != "mp3" or bitrate is not None:
+        return await _variant_response(request, codename.upper(), text, format, bitrate)
+    return await _stream_audio(request, codename.upper(), text)
+
+
+@router.get("/clip/{key}")
+async def get_clip(key: str, request: Request):
+    """Serve a cached clip by cache key, with ETag and Range support."""
+    path = get_clip_by_key(key)
+    if path is None:
+        raise HTTPException(status_code=404, detail="Clip not cached")
+    media_type = MEDIA_TYPES["opus"] if path.suffix == ".ogg" else MEDIA_TYPES["mp3"]
+    return _clip_response(request, key, path, key, media_type)
+
+
+async def _stream_audio(request: Request, codename: str, text: str) -> Response:
+    """Serve a cached clip from disk, or stream it while tee-ing into the cache."""
+    cached = get_cached_clip(codename, text)
+    if cached is not None:
+        key, path = cached
+        return _clip_response(request, key, path, codename)
+    
+    try:
+        audio_stream = await open_transmission_stream(codename, text)
+    except Exception as e:
+        logger.error(f"Audio stream error for {codename}: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+    
+    if audio_stream is None:
+        raise HTTPException(status_code=503, detail=UNAVAILABLE_DETAIL)
+    
+    return StreamingResponse(
+        audio_stream,
+        media_type="audio/mpeg",
+        headers={
+            "ETag": _etag(get_cache_key(codename, text)),
+            "Content-Disposition": f"inline; filename={codename}_transmission.mp3",
+        }
+    )
+
+
 @router.get("/test/{codename}")
-async def test_audio(codename: str):
+async def test_audio(codename: str, request: Request):
     """Test audio generation with a short sample text."""
     test_text = f"This is {codename}, secure channel confirmed. Standing by for orders."
     try:
-        audio_bytes = generate_transmission_audio(codename.upper(), test_text)
+        clip = await render_transmission_clip(codename.upper(), test_text)
         
-        if audio_bytes is None:
+        if clip is None:
             return {"status": "unavailable", "message": "ElevenLabs not configured or API error"}
         
-        return Response(
-            content=audio_bytes,
-            media_type="audio/mpeg",
-        )
+        key, path = clip
+        return _clip_response(request, key, path, codename.upper())
     except Exception as e:
         logger.error(f"Audio test error for {codename}: {e}")
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/formats")
+async def audio_formats():
+    """Supported output formats/bitrates and bandwidth saved by transcoded variants."""
+    return {
+        "formats": {fmt: {"default_bitrate": kbps, "media_type": MEDIA_TYPES[fmt]} for fmt, kbps in AUDIO_FORMATS.items()},
+        "bitrates": AUDIO_BITRATES_KBPS,
+        "transcoding": get_transcode_stats(),
+    }
+
+
+# --- Voice Cache ---
+
+@router.get("/cache")
+async def cache_stats():
+    """Voice cache size, hit/miss counters and byte totals."""
+    return get_cache_stats()
+
+
+@router.delete("/cache")
+async def evict_cache(codename: Optional[str] = None, older_than: Optional[float] = None, all: bool = False):
+    """Evict cached clips for an operative and/or not played in `older_than` seconds.
+    
+    Pass all=true to wipe the whole cache explicitly.
+    """
+    if codename is None and older_than is None and not all:
+        raise HTTPException(status_code=400, detail="Specify codename, older_than or all=true")
+    return clear_cache(codename=codename.upper() if codename else None, older_than=older_than)
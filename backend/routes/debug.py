@@ -0,0 +1,25 @@
+"""Debug routes — recent traces from the in-memory trace ring."""
+import logging
+from fastapi import APIRouter, HTTPException, Query
+
+from utils.tracing import tracer, otlp_document
+
+logger = logging.getLogger(__name__)
+router = APIRouter(prefix="/api/debug", tags=["debug"])
+
+
+@router.get("/traces")
+async def list_traces(limit: int = Query(default=50, ge=1, le=500)):
+    """Returns the most recent traces, newest first, with their root span and duration."""
+    return {"enabled": tracer.enabled, "traces": tracer.recent(limit)}
+
+
+@router.get("/traces/{trace_id}")
+async def get_trace(trace_id: str, format: str = Query(default="spans", pattern="^(spans|otlp)$")):
+    """Returns every span of a trace, in start order (or as an OTLP/JSON document)."""
+    spans = tracer.get(trace_id)
+    if spans is None:
+        raise HTTPException(status_code=404, detail=f"Trace not found: {trace_id}")
+    if format == "otlp":
+        return otlp_document(spans)
+    return {"trace_id": trace_id, "spans": [s.to_dict() for s in spans]}
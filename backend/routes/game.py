@@ -1,14 +1,22 @@
 """Game API routes — all game-related endpoints."""
+import json
 import logging
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from pydantic import BaseModel
-from typing import Optional
+from typing import List, Optional
 
-from game.state_manager import load_world_state, get_public_world_state, is_game_over
-from game.operative_manager import get_all_operatives_public, get_operative_public_info
+from config import (
+    MAX_BATCH_ORDERS, DASHBOARD_FIELDS, TRANSMISSION_PAGE_SIZE, TRANSMISSION_MAX_PAGE_SIZE,
+)
+
+from game.operative_manager import get_operative_public_info
+from game.snapshots import VersionedView, public_snapshot_view, world_state_view, operatives_view
 from game.turn_manager import turn_manager
 from game.decision_engine import handle_extraction_order
+from game.events import event_bus, publish, GAME_RESET
 from utils.create_backups import reset_game_state
+from utils.admission import admitted, admission
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api", tags=["game"])
@@ -19,6 +27,10 @@ class OrderRequest(BaseModel):
     operative: Optional[str] = None
 
 
+class BatchOrderRequest(BaseModel):
+    orders: List[OrderRequest]
+
+
 class EventResponseRequest(BaseModel):
     action: str
 
@@ -27,14 +39,47 @@ class ExtractRequest(BaseModel):
     codename: str
 
 
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Whether the client's If-None-Match already covers this version."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
+
+
+def _versioned_response(request: Request, view: VersionedView, since: Optional[int]) -> Response:
+    """Serve a versioned view as a full document, a JSON Patch, or 304.
+    
+    With `since`, the body is an RFC 6902 patch from that version to the
+    current one. If that version is too old to diff against, the full
+    document is returned instead (check the Content-Type).
+    """
+    version, doc = view.current()
+    etag = view.etag(version)
+    headers = {"ETag": etag, "X-State-Version": str(version), "Cache-Control": "no-cache"}
+
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+
+    if since is not None:
+        patch = view.delta_since(since)
+        if patch is not None:
+            return JSONResponse(patch, headers=headers, media_type="application/json-patch+json")
+
+    return JSONResponse(doc, headers=headers)
+
+
 # --- World State ---
 
 @router.get("/world-state")
-async def get_world_state():
-    """Returns current world state (public view — no loyalty scores)."""
+async def get_world_state(request: Request, since: Optional[int] = None):
+    """Returns current world state (public view — no loyalty scores).
+    
+    Supports If-None-Match, and `?since=<version>` for a JSON Patch delta.
+    """
     try:
-        state = load_world_state()
-        return get_public_world_state(state)
+        return _versioned_response(request, world_state_view, since)
     except Exception as e:
         logger.error(f"Error loading world state: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -43,10 +88,13 @@ async def get_world_state():
 # --- Operatives ---
 
 @router.get("/operatives")
-async def get_operatives():
-    """Returns operative list with public info (codename, location, signal quality)."""
+async def get_operatives(request: Request, since: Optional[int] = None):
+    """Returns operative list with public info (codename, location, signal quality).
+    
+    Supports If-None-Match, and `?since=<version>` for a JSON Patch delta.
+    """
     try:
-        return get_all_operatives_public()
+        return _versioned_response(request, operatives_view, since)
     except Exception as e:
         logger.error(f"Error loading operatives: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -65,19 +113,14 @@ async def get_operative(codename: str):
 
 # --- Orders ---
 
-@router.post("/order")
+@router.post("/order", dependencies=[Depends(admitted)])
 async def issue_order(request: OrderRequest):
     """Director issues an order to an operative.
     
     Routes through orchestrator → operative → state updates.
     """
     try:
-        # If operative specified, prepend to order for routing
-        order_text = request.order
-        if request.operative:
-            order_text = f"{request.operative}: {order_text}"
-        
-        result = await turn_manager.issue_order(order_text)
+        result = await turn_manager.issue_order(order_text(request))
         
         if result.get("game_over"):
             return result
@@ -88,9 +131,46 @@ async def issue_order(request: OrderRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/orders/batch", dependencies=[Depends(admitted)])
+async def issue_orders_batch(request: BatchOrderRequest):
+    """Director issues several orders at once.
+    
+    Orders are routed with one orchestrator call and dispatched to operatives
+    in parallel. Results stream back as newline-delimited JSON, one line per
+    order as it finishes, followed by the synthesized intel and a final
+    "complete" line.
+    """
+    if not request.orders:
+        raise HTTPException(status_code=400, detail="No orders provided")
+    if len(request.orders) > MAX_BATCH_ORDERS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Too many orders in batch (max {MAX_BATCH_ORDERS})"
+        )
+    
+    order_texts = [order_text(order) for order in request.orders]
+    
+    async def stream_results():
+        try:
+            async for result in turn_manager.issue_orders(order_texts):
+                yield json.dumps(result) + "\n"
+        except Exception as e:
+            logger.error(f"Error processing order batch: {e}")
+            yield json.dumps({"type": "error", "error": str(e)}) + "\n"
+    
+    return StreamingResponse(stream_results(), media_type="application/x-ndjson")
+
+
+def order_text(request: OrderRequest) -> str:
+    """If operative specified, prepend to order for routing."""
+    if request.operative:
+        return f"{request.operative}: {request.order}"
+    return request.order
+
+
 # --- Turn Management ---
 
-@router.post("/start-turn")
+@router.post("/start-turn", dependencies=[Depends(admitted)])
 async def start_turn():
     """Start a new turn — generates world event and briefing."""
     try:
@@ -101,7 +181,7 @@ async def start_turn():
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.post("/end-turn")
+@router.post("/end-turn", dependencies=[Depends(admitted)])
 async def end_turn():
     """End the current turn — triggers autonomous events, advances state."""
     try:
@@ -126,9 +206,22 @@ async def respond_to_event(request: EventResponseRequest):
 # --- Transmissions ---
 
 @router.get("/transmissions")
-async def get_transmissions():
-    """Returns all transmission log entries."""
-    return turn_manager.get_transmissions()
+async def get_transmissions(
+    after: Optional[str] = None,
+    before: Optional[str] = None,
+    limit: int = Query(default=TRANSMISSION_PAGE_SIZE, ge=1, le=TRANSMISSION_MAX_PAGE_SIZE),
+):
+    """Returns a page of transmission log entries, oldest first.
+    
+    Without a cursor, returns the most recent entries. Poll for new ones with
+    `?after=<next_cursor>`; page back through history with `?before=<prev_cursor>`.
+    """
+    if after is not None and before is not None:
+        raise HTTPException(status_code=400, detail="Use either 'after' or 'before', not both")
+    try:
+        return turn_manager.get_transmissions(after=after, before=before, limit=limit)
+    except KeyError:
+        raise HTTPException(status_code=404, detail=f"Unknown transmission cursor {after or before}")
 
 
 # --- Briefing ---
@@ -147,6 +240,73 @@ async def get_rogue_events():
     return turn_manager.get_rogue_events()
 
 
+# --- Admission ---
+
+@router.get("/admission")
+async def get_admission_stats():
+    """Returns in-flight and queued LLM-bound requests, overall and per session."""
+    return admission.stats()
+
+
+# --- Dashboard ---
+
+@router.get("/dashboard")
+async def get_dashboard(fields: Optional[str] = None):
+    """Returns the full public view of the game in one response.
+    
+    World state, operatives and game-over status come from a single state
+    snapshot, so they are always consistent with each other.
+    
+    Args:
+        fields: Comma-separated sections to include (default: all). One of
+            world_state, operatives, transmissions, briefing, rogue_events,
+            current_event, game_over.
+    """
+    selected = [f.strip() for f in fields.split(",") if f.strip()] if fields else DASHBOARD_FIELDS
+    unknown = [f for f in selected if f not in DASHBOARD_FIELDS]
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown dashboard field(s): {', '.join(unknown)} (choose from {', '.join(DASHBOARD_FIELDS)})",
+        )
+
+    try:
+        version, snapshot = public_snapshot_view.current()
+        sections = {
+            "world_state": lambda: snapshot["world_state"],
+            "operatives": lambda: snapshot["operatives"],
+            "game_over": lambda: snapshot["game_over"],
+            "transmissions": lambda: turn_manager.get_transmissions()["transmissions"],
+            "briefing": turn_manager.get_current_briefing,
+            "rogue_events": turn_manager.get_rogue_events,
+            "current_event": lambda: turn_manager.current_event,
+        }
+        dashboard = {"version": version}
+        for field in selected:
+            dashboard[field] = sections[field]()
+        return dashboard
+    except Exception as e:
+        logger.error(f"Error building dashboard: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+# --- Live Events ---
+
+@router.get("/events")
+async def stream_events(last_event_id: Optional[int] = Header(default=None)):
+    """Server-Sent Events stream of game state changes.
+    
+    Event types: tension_change, world_update, signal_change, transmission,
+    rogue_alert, world_event, turn_advance, audio_ready, game_reset,
+    job_progress, job_complete and resync (client should refetch full state).
+    """
+    return StreamingResponse(
+        event_bus.stream(last_event_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 # --- Extraction ---
 
 @router.post("/extract")
@@ -167,11 +327,8 @@ async def new_game():
     """Reset all game state to initial values and start fresh."""
     try:
         reset_game_state()
-        # Reset turn manager
-        turn_manager.current_event = None
-        turn_manager.transmissions = []
-        turn_manager.current_briefing = ""
-        turn_manager.rogue_events = []
+        turn_manager.reset()
+        publish(GAME_RESET, {"turn": 1})
         
         return {"message": "Game reset to initial state", "turn": 1}
     except Exception as e:
@@ -182,8 +339,5 @@ async def new_game():
 @router.get("/game-over")
 async def check_game_over():
     """Check if any game-over condition is met."""
-    state = load_world_state()
-    result = is_game_over(state)
-    if result:
-        return result
-    return {"game_over": False}
+    _, snapshot = public_snapshot_view.current()
+    return snapshot["game_over"]
@@ -0,0 +1,80 @@
+"""Job API routes — run long turn operations in the background."""
+import logging
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import JSONResponse
+
+from game.jobs import job_manager
+from game.turn_manager import turn_manager
+from routes.game import OrderRequest, order_text
+from utils.admission import AdmissionTicket, admission_ticket
+
+logger = logging.getLogger(__name__)
+router = APIRouter(prefix="/api/jobs", tags=["jobs"])
+
+
+def _submitted(job: dict, created: bool) -> JSONResponse:
+    """202 for a new job; 200 with the existing job for a duplicate submission."""
+    return JSONResponse(
+        {**job, "duplicate": not created},
+        status_code=202 if created else 200,
+        headers={"Location": f"/api/jobs/{job['id']}"},
+    )
+
+
+@router.post("/order")
+async def submit_order(request: OrderRequest, ticket: AdmissionTicket = Depends(admission_ticket)):
+    """Queue a Director order (routing → operative → synthesis).
+    
+    Returns the job immediately; fetch /api/jobs/{id} or listen for the
+    job_complete event for the result (same shape as POST /api/order).
+    """
+    text = order_text(request)
+    job, created = job_manager.submit(
+        "order", lambda: turn_manager.issue_order(text),
+        dedupe_key=f"order:{text.strip().lower()}", ticket=ticket,
+    )
+    return _submitted(job, created)
+
+
+@router.post("/start-turn")
+async def submit_start_turn(ticket: AdmissionTicket = Depends(admission_ticket)):
+    """Queue the start of a new turn (world event → briefing)."""
+    job, created = job_manager.submit(
+        "start-turn", turn_manager.start_turn, dedupe_key="start-turn", ticket=ticket
+    )
+    return _submitted(job, created)
+
+
+@router.post("/end-turn")
+async def submit_end_turn(ticket: AdmissionTicket = Depends(admission_ticket)):
+    """Queue the end of the current turn (rogue check → advance)."""
+    job, created = job_manager.submit(
+        "end-turn", turn_manager.end_turn, dedupe_key="end-turn", ticket=ticket
+    )
+    return _submitted(job, created)
+
+
+@router.get("")
+async def list_jobs(active: bool = False):
+    """Returns retained jobs, newest first (only queued/running ones with ?active=true)."""
+    return job_manager.list(active_only=active)
+
+
+@router.get("/{job_id}")
+async def get_job(job_id: str):
+    """Returns a job's status, current stage and, once finished, its result or error."""
+    job = job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return job
+
+
+@router.delete("/{job_id}")
+async def cancel_job(job_id: str):
+    """Cancel a queued or running job (e.g. a duplicate submission)."""
+    job = job_manager.cancel(job_id)
+    if job is None:
+        if job_manager.get(job_id) is not None:
+            raise HTTPException(status_code=409, detail=f"Job {job_id} is running on another worker")
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return job
@@ -0,0 +1,96 @@
+"""Compare two saved benchmark runs: mean time and allocations per benchmark, side by side.
+
+pytest-benchmark's own comparison (--benchmark-compare) covers timings only;
+this also reads the allocation figures the suite stores in extra_info.
+
+Usage, from backend/:
+    python -m tests.benchmarks.compare_allocations [OLD.json NEW.json] [--fail-above PERCENT]
+
+Without file arguments, the two most recent runs saved under .benchmarks/ are compared.
+"""
+import argparse
+import json
+import pathlib
+import sys
+from typing import Dict, List, Optional
+
+STORAGE_DIR = pathlib.Path(".benchmarks")
+
+# Figures compared: (label, getter); larger is worse for all of them
+FIGURES = [
+    ("mean_us", lambda b: b["stats"]["mean"] * 1e6),
+    ("alloc_peak_bytes", lambda b: b["extra_info"].get("alloc_peak_bytes")),
+    ("alloc_retained_bytes", lambda b: b["extra_info"].get("alloc_retained_bytes")),
+]
+
+
+def _latest_runs(storage: pathlib.Path, count: int = 2) -> List[pathlib.Path]:
+    runs = sorted(storage.glob("*/*.json"), key=lambda p: p.stat().st_mtime)
+    if len(runs) < count:
+        raise SystemExit(f"Need {count} saved runs in {storage}/ (run pytest tests/benchmarks --benchmark-autosave)")
+    return runs[-count:]
+
+
+def _load(path: pathlib.Path) -> Dict[str, dict]:
+    with open(path, "r", encoding="utf-8") as f:
+        return {b["fullname"]: b for b in json.load(f)["benchmarks"]}
+
+
+def _change(old: Optional[float], new: Optional[float]) -> Optional[float]:
+    if old is None or new is None:
+        return None
+    if old == 0:
+        return 0.0 if new == 0 else float("inf")
+    return (new - old) / old * 100
+
+
+def compare(old_path: pathlib.Path, new_path: pathlib.Path) -> List[dict]:
+    """Per-benchmark figures of both runs and their change in percent (benchmarks in both runs only)."""
+    old, new = _load(old_path), _load(new_path)
+    rows = []
+    for name in sorted(old.keys() & new.keys()):
+        row = {"name": name.split("::")[-1]}
+        for label, get in FIGURES:
+            before, after = get(old[name]), get(new[name])
+            row[label] = (before, after, _change(before, after))
+        rows.append(row)
+    return rows
+
+
+def _format(value: Optional[float]) -> str:
+    return "-" if value is None else f"{value:,.0f}"
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("runs", nargs="*", type=pathlib.Path, help="OLD.json NEW.json")
+    parser.add_argument("--fail-above", type=float, default=None,
+                        help="Exit with status 1 if any figure grew by more than this many percent")
+    args = parser.parse_args(argv)
+    if len(args.runs) not in (0, 2):
+        parser.error("give two saved runs, or none to use the two latest")
+    old_path, new_path = args.runs or _latest_runs(STORAGE_DIR)
+
+    rows = compare(old_path, new_path)
+    print(f"{old_path.name} -> {new_path.name}")
+    width = max((len(r["name"]) for r in rows), default=10)
+    print(f"{'benchmark':<{width}}  " + "  ".join(f"{label:>32}" for label, _ in FIGURES))
+    regressions = []
+    for row in rows:
+        cells = []
+        for label, _ in FIGURES:
+            before, after, change = row[label]
+            delta = "" if change is None else f" ({change:+.1f}%)"
+            cells.append(f"{_format(before) + ' -> ' + _format(after) + delta:>32}")
+            if args.fail_above is not None and change is not None and change > args.fail_above:
+                regressions.append(f"{row['name']} {label} {change:+.1f}%")
+        print(f"{row['name']:<{width}}  " + "  ".join(cells))
+
+    if regressions:
+        print(f"\nGrew by more than {args.fail_above}%:\n  " + "\n  ".join(regressions))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,151 @@
+"""Benchmark fixtures: games of different lengths and allocation measurement."""
+import logging
+import shutil
+import tracemalloc
+
+import pytest
+
+from config import OPERATIVE_CODENAMES
+from game import operative_manager, state_manager
+from game.state_manager import bump_state_version
+
+# Game lengths benchmarked: a new game, a long session and a very long one
+GAME_TURNS = [1, 50, 500]
+
+# Orders issued per turn in the synthetic history
+ORDERS_PER_TURN = 2
+
+DECISIONS = ["comply", "comply", "partial", "comply", "deceive", "exceed"]
+
+
+def _history(turn: int) -> tuple:
+    """Mission and event history of a game that has reached `turn`.
+
+    Returns:
+        (world state mission log, missions by operative, world events, rogue events).
+    """
+    mission_log = []
+    missions = {codename: [] for codename in OPERATIVE_CODENAMES}
+    world_events = []
+    rogue_events = []
+    for t in range(1, turn):
+        for i in range(ORDERS_PER_TURN):
+            codename = OPERATIVE_CODENAMES[(t * ORDERS_PER_TURN + i) % len(OPERATIVE_CODENAMES)]
+            order = f"{codename}, confirm the courier schedule for drop site {t}-{i}"
+            report = f"Director, drop site {t}-{i} is clean. Courier arrives at 0300 as planned."
+            decision = DECISIONS[(t + i) % len(DECISIONS)]
+            missions[codename].append({
+                "id": f"mission_{t}_{codename}",
+                "turn": t,
+                "order_received": order,
+                "decision": decision,
+                "reason_hidden": "The schedule suits my own contacts as well.",
+                "meta_valid": True,
+                "reported_to_director": report,
+                "outcome": f"Decision: {decision}, loyalty shift: 1",
+            })
+            mission_log.append({
+                "turn": t,
+                "operative": codename,
+                "order": order,
+                "response_summary": report,
+                "mission_type": "field_operation",
+            })
+        world_events.append({
+            "event_title": f"Signals spike on turn {t}",
+            "event_description": "Unusual traffic was intercepted on monitored frequencies.",
+            "affected_region": "middle_east",
+            "tension_impact": 1,
+            "turn": t,
+        })
+        if t % 10 == 0:
+            rogue_events.append({
+                "id": f"rogue_{t}",
+                "type": "defection_warning",
+                "codename": "GHOST",
+                "turn": t,
+                "narration": "GHOST reports an approach by a foreign service.",
+            })
+    # The turn cycle keeps only the last 20 world events
+    return mission_log, missions, world_events[-20:], rogue_events
+
+
+class Game:
+    """A game in a temporary directory that has reached a given turn."""
+
+    def __init__(self, turn: int, root):
+        self.turn = turn
+        self._root = root
+        self._saved = root / "saved"
+
+    def build(self) -> None:
+        mission_log, missions, world_events, rogue_events = _history(self.turn)
+        state = state_manager.load_world_state()
+        state.update(turn=self.turn, mission_log=mission_log,
+                     world_events=world_events, rogue_events=rogue_events)
+        state_manager.save_world_state(state)
+        for codename in OPERATIVE_CODENAMES:
+            data = operative_manager.load_operative(codename)
+            data["missions"] = missions[codename]
+            operative_manager.save_operative(codename, data)
+        shutil.copytree(self._root / "state", self._saved / "state")
+        shutil.copytree(self._root / "memory", self._saved / "memory")
+
+    def restore(self) -> None:
+        """Put every file back as built, for benchmarks that change the game."""
+        for name in ("state", "memory"):
+            shutil.rmtree(self._root / name)
+            shutil.copytree(self._saved / name, self._root / name)
+        # Cached views and prompts are keyed by state version
+        bump_state_version()
+
+    def size(self) -> int:
+        """Bytes of game state on disk."""
+        return sum(p.stat().st_size for name in ("state", "memory") for p in (self._root / name).glob("*.json"))
+
+
+@pytest.fixture(params=GAME_TURNS, ids=[f"turn{t}" for t in GAME_TURNS])
+def game(request, stub_llm, game_dirs):
+    """The game at turn 1, 50 and 500."""
+    game = Game(request.param, game_dirs)
+    game.build()
+    return game
+
+
+@pytest.fixture(autouse=True)
+def quiet_logs():
+    """Keep log formatting and capture out of the timings."""
+    logging.disable(logging.INFO)
+    yield
+    logging.disable(logging.NOTSET)
+
+
+@pytest.fixture
+def measure(benchmark, request):
+    """Benchmark a function, then record the allocations of one more call.
+
+    Peak and retained bytes (tracemalloc) and, for game benchmarks, the game
+    size go into the benchmark's extra_info, so they are saved with it and
+    compare_allocations.py can compare them between runs.
+    """
+    def run(func, setup=None, rounds: int = 30):
+        if setup is None:
+            result = benchmark(func)
+        else:
+            # pytest-benchmark would take a value returned by setup as the call's arguments
+            result = benchmark.pedantic(func, setup=lambda: setup() and None, rounds=rounds, warmup_rounds=1)
+            setup()
+        tracemalloc.start()
+        try:
+            func()
+            retained, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        benchmark.extra_info["alloc_peak_bytes"] = peak
+        benchmark.extra_info["alloc_retained_bytes"] = retained
+        if "game" in request.fixturenames:
+            game = request.getfixturevalue("game")
+            benchmark.extra_info["turn"] = game.turn
+            benchmark.extra_info["state_bytes"] = game.size()
+        return result
+    return run
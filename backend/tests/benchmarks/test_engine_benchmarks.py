@@ -0,0 +1,111 @@
+"""Game engine hot paths, timed with pytest-benchmark against games of 1, 50 and 500 turns."""
+import asyncio
+import json
+import pathlib
+import random
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from agents.operative import build_operative_prompt, parse_hidden_meta, strip_hidden_meta
+from agents.orchestrator import _build_orchestrator_prompt
+from game import rogue_engine
+from game.decision_engine import process_operative_response
+from game.operative_manager import load_all_operatives
+from game.state_manager import bump_state_version, is_game_over, load_world_state, save_world_state
+from tests.stub_llm import OPERATIVE_RESPONSE
+
+CORPUS = json.loads(
+    (pathlib.Path(__file__).parent.parent / "corpus" / "operative_responses.json").read_text("utf-8"))
+TEXT_RESPONSES = [case["response"] for case in CORPUS if case["mode"] == "text"]
+
+
+@pytest.fixture
+def run_async():
+    """Run coroutines on one event loop for the whole benchmark."""
+    loop = asyncio.new_event_loop()
+    yield loop.run_until_complete
+    loop.close()
+
+
+# --- Prompts (rendered from scratch: the state version changes before each call) ---
+
+@pytest.mark.benchmark(group="prompts")
+def test_build_operative_prompt(game, measure):
+    prompt = measure(lambda: build_operative_prompt("CEDAR"), setup=bump_state_version, rounds=100)
+    assert "CEDAR" in prompt
+
+
+@pytest.mark.benchmark(group="prompts")
+def test_build_orchestrator_prompt(game, measure):
+    prompt = measure(_build_orchestrator_prompt, setup=bump_state_version, rounds=100)
+    assert f"{game.turn}" in prompt
+
+
+# --- HIDDEN_META parsing (the text cases of the response corpus per round) ---
+
+@pytest.mark.benchmark(group="hidden_meta")
+def test_parse_hidden_meta(measure):
+    metas = measure(lambda: [parse_hidden_meta(response) for response in TEXT_RESPONSES])
+    assert len(metas) == len(TEXT_RESPONSES)
+
+
+@pytest.mark.benchmark(group="hidden_meta")
+def test_strip_hidden_meta(measure):
+    texts = measure(lambda: [strip_hidden_meta(response) for response in TEXT_RESPONSES])
+    assert not any("[HIDDEN_META]" in text for text in texts)
+
+
+# --- Turn logic ---
+
+@pytest.mark.benchmark(group="turn")
+def test_process_operative_response(game, measure):
+    response_data = {
+        "codename": "CEDAR",
+        "response": strip_hidden_meta(OPERATIVE_RESPONSE),
+        "hidden_meta": parse_hidden_meta(OPERATIVE_RESPONSE),
+        "meta_valid": True,
+    }
+    changes = measure(
+        lambda: process_operative_response("CEDAR", "CEDAR, watch the port", response_data),
+        setup=game.restore,
+    )
+    assert changes["decision"] == "comply"
+
+
+@pytest.mark.benchmark(group="turn")
+def test_check_autonomous_triggers(game, measure, run_async, monkeypatch):
+    # The same rolls every round, so each round fires the same events
+    rng = random.Random()
+    monkeypatch.setattr(rogue_engine, "random", rng)
+
+    def setup():
+        game.restore()
+        rng.seed(game.turn)
+
+    events = measure(lambda: run_async(rogue_engine.check_autonomous_triggers()), setup=setup)
+    assert isinstance(events, list)
+
+
+@pytest.mark.benchmark(group="turn")
+def test_is_game_over(game, measure):
+    state = load_world_state()
+    assert measure(lambda: is_game_over(state)) is None
+
+
+# --- State files ---
+
+@pytest.mark.benchmark(group="state")
+def test_world_state_load_save_cycle(game, measure):
+    def cycle():
+        state = load_world_state()
+        save_world_state(state)
+        return state
+
+    assert measure(cycle)["turn"] == game.turn
+
+
+@pytest.mark.benchmark(group="state")
+def test_load_all_operatives(game, measure):
+    assert len(measure(load_all_operatives)) == 5
@@ -0,0 +1,59 @@
+"""Shared fixtures: a stub LLM and a private copy of the game state for each test."""
+import os
+
+# Set before the app's config is imported: never reach the real APIs from
+# tests, whatever .env holds, and report state I/O in response headers
+os.environ["MISTRAL_API_KEY"] = "test"
+os.environ["ELEVENLABS_API_KEY"] = ""
+os.environ["UPSTREAM_WARMUP"] = "false"
+os.environ["SESSION_STORE"] = "memory"
+os.environ["IO_DEBUG_HEADERS"] = "true"
+
+import shutil
+
+import pytest
+
+from config import MEMORY_INITIAL_DIR, STATE_INITIAL_DIR
+from agents import mistral_client
+from game import operative_manager, state_manager
+from game.transmission_log import TransmissionLog
+from game.turn_manager import turn_manager
+from utils import create_backups
+from voice.cache import voice_cache
+from tests.stub_llm import StubMistral
+
+
+@pytest.fixture
+def stub_llm(monkeypatch):
+    """Answer every LLM call with a canned response."""
+    stub = StubMistral()
+    monkeypatch.setattr(mistral_client, "get_client", lambda: stub)
+    return stub
+
+
+@pytest.fixture
+def game_dirs(tmp_path, monkeypatch, voice_dir):
+    """A fresh game in a temporary directory (the initial state and memory files, and an empty voice cache)."""
+    state_dir = tmp_path / "state"
+    memory_dir = tmp_path / "memory"
+    shutil.copytree(STATE_INITIAL_DIR, state_dir)
+    shutil.copytree(MEMORY_INITIAL_DIR, memory_dir)
+    monkeypatch.setattr(state_manager, "WORLD_STATE_PATH", state_dir / "world_state.json")
+    monkeypatch.setattr(operative_manager, "MEMORY_DIR", memory_dir)
+    monkeypatch.setattr(create_backups, "STATE_DIR", state_dir)
+    monkeypatch.setattr(create_backups, "MEMORY_DIR", memory_dir)
+    monkeypatch.setattr(turn_manager, "transmissions", TransmissionLog(state_dir / "transmissions.jsonl"))
+    turn_manager.reset()
+    # Cached views and prompts are keyed by state version
+    state_manager.bump_state_version()
+    return tmp_path
+
+
+@pytest.fixture
+def voice_dir(tmp_path, monkeypatch):
+    """An empty voice cache in a temporary directory."""
+    cache_dir = tmp_path / "voice"
+    monkeypatch.setattr(voice_cache, "cache_dir", cache_dir)
+    monkeypatch.setattr(voice_cache, "_entries", type(voice_cache._entries)())
+    monkeypatch.setattr(voice_cache, "_loaded", False)
+    return cache_dir
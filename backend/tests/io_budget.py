@@ -0,0 +1,49 @@
+"""I/O budget assertions — fail a test when a request or block reads or writes state files more than it should."""
+from contextlib import contextmanager
+from typing import Iterator
+
+from utils.io_budget import (
+    IOStats, io_scope, READS_HEADER, WRITES_HEADER, BYTES_READ_HEADER, BYTES_WRITTEN_HEADER,
+)
+
+
+def io_used(response) -> dict:
+    """State I/O reported in a response's X-State-* headers (needs IO_DEBUG_HEADERS)."""
+    if READS_HEADER not in response.headers:
+        raise AssertionError("Response has no X-State-* headers; is IO_DEBUG_HEADERS set?")
+    return {
+        "reads": int(response.headers[READS_HEADER]),
+        "writes": int(response.headers[WRITES_HEADER]),
+        "bytes_read": int(response.headers[BYTES_READ_HEADER]),
+        "bytes_written": int(response.headers[BYTES_WRITTEN_HEADER]),
+    }
+
+
+def _check(label: str, used: dict, reads: int, writes: int) -> None:
+    over = []
+    if used["reads"] > reads:
+        over.append(f"{used['reads']} reads (budget {reads})")
+    if used["writes"] > writes:
+        over.append(f"{used['writes']} writes (budget {writes})")
+    if over:
+        raise AssertionError(f"{label} exceeded its state I/O budget: {', '.join(over)}; used {used}")
+
+
+def assert_io_budget(response, reads: int, writes: int) -> dict:
+    """Assert a request did at most `reads` state file reads and `writes` writes.
+
+    Returns:
+        The I/O the request used.
+    """
+    used = io_used(response)
+    request = response.request
+    _check(f"{request.method} {request.url.path}", used, reads, writes)
+    return used
+
+
+@contextmanager
+def io_budget(reads: int, writes: int, label: str = "block") -> Iterator[IOStats]:
+    """Assert the code in the block does at most `reads` reads and `writes` writes."""
+    with io_scope() as stats:
+        yield stats
+    _check(label, stats.as_dict(), reads, writes)
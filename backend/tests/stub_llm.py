@@ -0,0 +1,103 @@
+"""A stand-in for the Mistral client: canned, well-formed responses for every call the game makes."""
+import json
+import re
+
+from config import OPERATIVE_CODENAMES
+
+OPERATIVE_RESPONSE = (
+    "Director, package secured at the drop. No surveillance observed on approach; "
+    "the courier used the agreed signal.\n\n"
+    "[HIDDEN_META]\n"
+    "decision: comply\n"
+    "loyalty_shift: 1\n"
+    "reason: The order matches my own read of the situation.\n"
+    "tension_impact: 2\n"
+    "exposure_impact: 1\n"
+    "[/HIDDEN_META]"
+)
+
+WORLD_EVENT = {
+    "event_title": "Border Checkpoint Incident",
+    "event_description": "A convoy was stopped at a border crossing and two passengers detained.",
+    "affected_region": "middle_east",
+    "tension_impact": 4,
+    "suggested_actions": ["Ask CEDAR for local reporting", "Stand down the courier network"],
+}
+
+BRIEFING = "Director, the network is stable. Tensions are rising in the Middle East; advise caution."
+
+
+def _target(text: str) -> str:
+    for codename in OPERATIVE_CODENAMES:
+        if codename in text.upper():
+            return codename
+    return OPERATIVE_CODENAMES[0]
+
+
+def _routing(order: str) -> dict:
+    return {
+        "target_operative": _target(order),
+        "mission_brief": order,
+        "mission_type": "reconnaissance",
+        "risk_level": "medium",
+    }
+
+
+def respond(messages: list, response_format: dict = None) -> str:
+    """The canned reply to a conversation (the last user message decides which)."""
+    request = messages[-1]["content"]
+    if "MODE: GENERATE_EVENT" in request:
+        return json.dumps(WORLD_EVENT)
+    if "MODE: ROUTE_ORDER" in request:
+        orders = re.findall(r'^\d+\. "(.*)"$', request, re.MULTILINE)
+        if orders:
+            return json.dumps({"routes": [_routing(order) for order in orders]})
+        return json.dumps(_routing(request))
+    if "ORDER RECEIVED" in request:
+        if response_format and response_format.get("type") == "json_schema":
+            transmission, _, _ = OPERATIVE_RESPONSE.partition("[HIDDEN_META]")
+            return json.dumps({
+                "transmission": transmission.strip(),
+                "meta": {"decision": "comply", "loyalty_shift": 1, "reason": "Matches my read.",
+                         "tension_impact": 2, "exposure_impact": 1},
+            })
+        return OPERATIVE_RESPONSE
+    return BRIEFING
+
+
+class _Usage:
+    prompt_tokens = 100
+    completion_tokens = 20
+
+
+class _Message:
+    def __init__(self, content: str):
+        self.content = content
+
+
+class _Choice:
+    def __init__(self, content: str):
+        self.message = _Message(content)
+
+
+class _Response:
+    usage = _Usage()
+
+    def __init__(self, content: str):
+        self.choices = [_Choice(content)]
+
+
+class _Chat:
+    def __init__(self):
+        self.calls = 0
+
+    async def complete_async(self, model, messages, temperature, response_format=None, **kwargs):
+        self.calls += 1
+        return _Response(respond(messages, response_format))
+
+
+class StubMistral:
+    """Drop-in for the object returned by mistral_client.get_client()."""
+
+    def __init__(self):
+        self.chat = _Chat()
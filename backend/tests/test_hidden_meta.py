@@ -0,0 +1,95 @@
+"""HIDDEN_META parsing against the operative response corpus."""
+import json
+import pathlib
+import random
+
+import pytest
+
+from agents.hidden_meta import (
+    DECISIONS, META_FIELDS, HiddenMetaParser, parse_operative_response, parse_structured_response,
+)
+from agents.operative import parse_hidden_meta, strip_hidden_meta
+
+CORPUS = json.loads((pathlib.Path(__file__).parent / "corpus" / "operative_responses.json").read_text("utf-8"))
+TEXT_CASES = [case for case in CORPUS if case["mode"] == "text"]
+
+
+def _parse(case: dict) -> dict:
+    if case["mode"] == "json":
+        return parse_structured_response(case["response"])
+    return parse_operative_response(case["response"])
+
+
+def _feed_in_chunks(response: str, sizes) -> tuple:
+    parser = HiddenMetaParser()
+    emitted = []
+    position = 0
+    for size in sizes:
+        if position >= len(response):
+            break
+        emitted.append(parser.feed(response[position:position + size]))
+        position += size
+    emitted.append(parser.feed(response[position:]))
+    emitted.append(parser.close())
+    return emitted, parser.result()
+
+
+@pytest.mark.parametrize("case", CORPUS, ids=[case["name"] for case in CORPUS])
+def test_corpus(case):
+    result = _parse(case)
+    assert result["text"] == case["expected"]["text"]
+    assert result["hidden_meta"] == case["expected"]["hidden_meta"]
+    assert result["meta_valid"] == case["expected"]["meta_valid"]
+    assert bool(result["problems"]) != result["meta_valid"]
+
+
+@pytest.mark.parametrize("case", TEXT_CASES, ids=[case["name"] for case in TEXT_CASES])
+def test_streamed_chunks_match_whole_response(case):
+    whole = parse_operative_response(case["response"])
+    rng = random.Random(case["name"])
+    splits = [[1] * len(case["response"])] + [
+        [rng.randint(1, 16) for _ in range(len(case["response"]))] for _ in range(20)
+    ]
+    for sizes in splits:
+        emitted, result = _feed_in_chunks(case["response"], sizes)
+        assert result == whole
+        assert "".join(emitted).strip() == whole["text"]
+
+
+@pytest.mark.parametrize("case", TEXT_CASES, ids=[case["name"] for case in TEXT_CASES])
+def test_streamed_chunks_never_leak_meta(case):
+    rng = random.Random(f"leak:{case['name']}")
+    for _ in range(20):
+        emitted, _ = _feed_in_chunks(case["response"], [rng.randint(1, 8) for _ in range(len(case["response"]))])
+        public = "".join(emitted)
+        assert "HIDDEN_META" not in public
+        assert "loyalty_shift" not in public.lower()
+
+
+def test_legacy_helpers():
+    case = next(case for case in CORPUS if case["name"] == "well_formed")
+    assert strip_hidden_meta(case["response"]) == case["expected"]["text"]
+    assert parse_hidden_meta(case["response"]) == case["expected"]["hidden_meta"]
+
+
+def test_fuzzed_responses_always_yield_usable_meta():
+    rng = random.Random(2024)
+    for _ in range(500):
+        response = rng.choice(CORPUS)["response"]
+        mutation = rng.randrange(3)
+        if mutation == 0:
+            response = response[:rng.randrange(len(response) + 1)]
+        elif mutation == 1:
+            start = rng.randrange(len(response))
+            response = response[:start] + response[start + rng.randint(1, 20):]
+        else:
+            start = rng.randrange(len(response))
+            noise = "".join(rng.choice("[]/:`*\n-+0123456789 HIDDEN_META") for _ in range(rng.randint(1, 20)))
+            response = response[:start] + noise + response[start:]
+
+        for result in (parse_operative_response(response), parse_structured_response(response)):
+            assert set(result["hidden_meta"]) == set(META_FIELDS)
+            assert result["hidden_meta"]["decision"] in DECISIONS
+            for field in ("loyalty_shift", "tension_impact", "exposure_impact"):
+                assert isinstance(result["hidden_meta"][field], int)
+            assert "[HIDDEN_META]" not in result["text"]
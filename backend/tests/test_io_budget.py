@@ -0,0 +1,123 @@
+"""State I/O budgets per endpoint, so a change that adds file reads or writes fails here first.
+
+Budgets are the current cost of each call with the stub LLM; lower them
+when a change makes a call cheaper.
+"""
+import asyncio
+import random
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from game import rogue_engine
+from game.operative_manager import load_operative
+from game.state_manager import bump_state_version, load_world_state
+from game.turn_manager import turn_manager
+from main import app
+from tests.io_budget import assert_io_budget, io_budget
+
+
+class _NoRogueEvents(random.Random):
+    """Rolls that never trigger an autonomous event, so end-turn I/O is deterministic."""
+
+    def random(self):
+        return 1.0
+
+
+@pytest.fixture
+def client(stub_llm, game_dirs, monkeypatch):
+    monkeypatch.setattr(rogue_engine, "random", _NoRogueEvents())
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.mark.parametrize("path", [
+    "/api/world-state", "/api/operatives", "/api/dashboard", "/api/game-over",
+    "/api/transmissions", "/api/briefing", "/api/rogue-events",
+])
+def test_reads_of_unchanged_state_touch_no_files(client, path):
+    response = client.get(path)
+    assert response.status_code == 200
+    assert_io_budget(response, reads=0, writes=0)
+
+
+def test_snapshot_rebuild_reads_each_file_once(client):
+    bump_state_version()
+    response = client.get("/api/dashboard")
+    assert response.status_code == 200
+    # The world state and five operative files
+    assert_io_budget(response, reads=6, writes=0)
+
+
+def test_operative_detail(client):
+    response = client.get("/api/operatives/CEDAR")
+    assert response.status_code == 200
+    assert_io_budget(response, reads=1, writes=0)
+
+
+@pytest.mark.parametrize("path, body, reads, writes", [
+    ("/api/start-turn", None, 15, 2),
+    ("/api/order", {"order": "CEDAR, watch the port"}, 21, 4),
+    ("/api/respond-to-event", {"action": "Stand down the courier network"}, 1, 1),
+    ("/api/end-turn", None, 8, 1),
+    ("/api/extract", {"codename": "GHOST"}, 2, 2),
+])
+def test_turn_endpoints(client, path, body, reads, writes):
+    response = client.post(path, json=body) if body else client.post(path)
+    assert response.status_code == 200
+    assert_io_budget(response, reads=reads, writes=writes)
+
+
+def test_headers_report_bytes(client):
+    response = client.post("/api/order", json={"order": "CEDAR, watch the port"})
+    used = assert_io_budget(response, reads=21, writes=4)
+    assert used["bytes_read"] > 0
+    assert used["bytes_written"] > 0
+
+
+def test_end_turn_without_events_writes_world_state_once(client):
+    client.post("/api/start-turn")
+    response = client.post("/api/end-turn")
+    assert response.status_code == 200
+    assert response.json()["rogue_events"] == []
+    assert_io_budget(response, reads=8, writes=1)
+
+
+def test_order_batch(stub_llm, game_dirs):
+    # A streamed batch does its I/O after the headers are sent, so it is measured directly
+    async def run():
+        return [item async for item in turn_manager.issue_orders(
+            ["CEDAR, watch the port", "GHOST, meet the contact"])]
+
+    with io_budget(reads=30, writes=10, label="issue_orders (2 orders)"):
+        items = asyncio.run(run())
+    assert items[-1]["type"] == "complete"
+
+
+def test_silent_defection_reads_and_writes_each_operative_once(stub_llm, game_dirs):
+    operative = load_operative("GHOST")
+    state = load_world_state()
+    # GHOST's status, then one read and write for each of the four other operatives
+    with io_budget(reads=5, writes=6, label="silent defection") as stats:
+        event = asyncio.run(rogue_engine._handle_silent_defection("GHOST", operative, state))
+    assert stats.files["write:world_state"] == 1
+    assert event["type"] == "silent_defection"
+
+    cedar = load_operative("CEDAR")
+    assert "GHOST" in cedar["known_compromises"]
+    assert cedar["loyalty"] == 88 - 3
+    assert load_operative("GHOST")["current_status"] == "dark"
+
+
+def test_job_reports_its_io(client):
+    submitted = client.post("/api/jobs/order", json={"order": "CEDAR, watch the port"}).json()
+    deadline = time.monotonic() + 10
+    while True:
+        job = client.get(f"/api/jobs/{submitted['id']}").json()
+        if job["status"] not in ("queued", "running") or time.monotonic() > deadline:
+            break
+        time.sleep(0.01)
+    assert job["status"] == "succeeded"
+    assert job["io"]["reads"] > 0
+    assert job["io"]["files"]["write:transmissions"] == 1
@@ -0,0 +1,41 @@
+"""JSON Patch round trips: applying make_patch(old, new) to old gives new."""
+import pytest
+
+from utils.json_patch import apply_patch, make_patch
+
+STATE = {
+    "turn": 3,
+    "tension": 41,
+    "operatives": {"CEDAR": {"loyalty": 88, "status": "active"}, "GHOST": {"loyalty": 60, "status": "active"}},
+    "mission_log": [{"turn": 1, "operative": "CEDAR"}, {"turn": 2, "operative": "GHOST"}],
+}
+
+CASES = {
+    "unchanged": (STATE, STATE),
+    "scalar changed": (STATE, {**STATE, "tension": 44}),
+    "nested value changed": (STATE, {**STATE, "operatives": {
+        **STATE["operatives"], "GHOST": {"loyalty": 52, "status": "dark"}}}),
+    "key added and removed": (STATE, {**{k: v for k, v in STATE.items() if k != "tension"}, "game_over": True}),
+    "list appended": (STATE, {**STATE, "mission_log": STATE["mission_log"] + [{"turn": 3, "operative": "CEDAR"}]}),
+    "list shrunk": (STATE, {**STATE, "mission_log": STATE["mission_log"][:1]}),
+    "list emptied": (STATE, {**STATE, "mission_log": []}),
+    "type changed": (STATE, {**STATE, "mission_log": None}),
+    "keys needing escapes": ({"a/b": 1, "c~d": [1]}, {"a/b": 2, "c~d": [1, 2], "e/~f": {}}),
+    "root replaced": ([1, 2], {"turn": 1}),
+}
+
+
+@pytest.mark.parametrize("old, new", CASES.values(), ids=CASES.keys())
+def test_round_trip(old, new):
+    assert apply_patch(old, make_patch(old, new)) == new
+
+
+def test_apply_does_not_modify_the_source():
+    new = {**STATE, "mission_log": []}
+    apply_patch(STATE, make_patch(STATE, new))
+    assert len(STATE["mission_log"]) == 2
+
+
+def test_invalid_path_raises_value_error():
+    with pytest.raises(ValueError):
+        apply_patch(STATE, [{"op": "replace", "path": "/operatives/SPARROW/loyalty", "value": 1}])
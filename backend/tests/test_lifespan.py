@@ -0,0 +1,18 @@
+"""App lifespan: the server can be started again in the same process."""
+from fastapi.testclient import TestClient
+
+from agents import mistral_client
+from main import app
+from utils import http_pool
+
+
+def test_restart_builds_sdk_clients_on_the_new_http_pool(game_dirs):
+    with TestClient(app):
+        first = mistral_client.get_client()
+    assert http_pool._client is None
+    assert mistral_client._client is None
+
+    with TestClient(app):
+        second = mistral_client.get_client()
+        assert second is not first
+        assert not http_pool.get_http_client().is_closed
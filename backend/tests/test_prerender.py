@@ -0,0 +1,44 @@
+"""Background pre-rendering runs outside the request that queued it."""
+import asyncio
+
+import pytest
+
+from utils.io_budget import current_io, io_scope
+from utils.tracing import span, tracer
+from voice import prerender
+
+
+@pytest.fixture
+def worker(monkeypatch):
+    """A pre-render worker whose renders record the span and I/O scope they ran in."""
+    seen = []
+
+    async def render(codename, text):
+        seen.append((tracer.current_span(), current_io()))
+        return True
+
+    monkeypatch.setattr(prerender, "is_tts_available", lambda codename: True)
+    monkeypatch.setattr(prerender, "prerender_transmission_audio", render)
+    monkeypatch.setattr(prerender, "TTS_PRERENDER_ENABLED", True)
+    monkeypatch.setattr(prerender, "_queue", None)
+    monkeypatch.setattr(prerender, "_worker", None)
+    monkeypatch.setattr(tracer, "enabled", True)
+    return seen
+
+
+def test_each_prerender_is_a_root_span_outside_the_request(worker):
+    async def run():
+        with span("POST /api/order") as request_span, io_scope():
+            prerender.enqueue_prerender("t1", "CEDAR", "First transmission.")
+        prerender.enqueue_prerender("t2", "CEDAR", "Second transmission.")
+        await prerender._queue.join()
+        await prerender.stop_prerender_worker()
+        return request_span
+
+    request_span = asyncio.run(run())
+    assert [prerender.get_audio_status(i) for i in ("t1", "t2")] == ["ready", "ready"]
+    (first, first_io), (second, second_io) = worker
+    assert first.name == second.name == "tts.prerender"
+    assert first.parent_id is None and second.parent_id is None
+    assert len({request_span.trace_id, first.trace_id, second.trace_id}) == 3
+    assert first_io is None and second_io is None
@@ -0,0 +1,63 @@
+"""Joining sentence clips: concat_mp3 and the streaming join produce the same bytes."""
+import asyncio
+
+import pytest
+
+from voice.elevenlabs_client import _join_segment
+from voice.segmentation import concat_mp3, info_frame_length
+
+# MPEG-1 Layer III, 128 kbps, 44.1 kHz, stereo: 417-byte frames
+FRAME_HEADER = b"\xff\xfb\x90\x00"
+FRAME_LENGTH = 417
+
+
+def _frame(fill: bytes) -> bytes:
+    return FRAME_HEADER + fill * (FRAME_LENGTH - 4)
+
+
+def _info_frame() -> bytes:
+    # The tag id sits after the header and 32 bytes of side info
+    return (FRAME_HEADER + bytes(32) + b"Info").ljust(FRAME_LENGTH, b"\x00")
+
+
+def _clip(n: int, id3v1: bool = True) -> bytes:
+    id3v2 = b"ID3\x04\x00\x00\x00\x00\x00\x0a" + bytes(10)
+    audio = b"".join(_frame(bytes([n * 16 + i])) for i in range(3))
+    return id3v2 + _info_frame() + audio + (b"TAG".ljust(128, b"x") if id3v1 else b"")
+
+
+def _streamed(parts, chunk_size: int) -> bytes:
+    async def source(part):
+        for i in range(0, len(part), chunk_size):
+            yield part[i:i + chunk_size]
+
+    async def run():
+        out = []
+        for i, part in enumerate(parts):
+            async for chunk in _join_segment(source(part), keep_id3=i == 0):
+                out.append(chunk)
+        return b"".join(out)
+
+    return asyncio.run(run())
+
+
+def test_info_frame_is_recognised():
+    assert info_frame_length(_info_frame()) == FRAME_LENGTH
+    assert info_frame_length(_frame(b"\x01")) == 0
+    assert info_frame_length(b"ID3") == 0
+
+
+def test_concat_keeps_only_audio_frames_and_the_first_id3_tag():
+    parts = [_clip(1), _clip(2), _clip(3, id3v1=False)]
+    joined = concat_mp3(parts)
+    assert joined.startswith(b"ID3")
+    assert joined.count(b"ID3") == 1
+    assert b"Info" not in joined
+    assert b"TAG" not in joined
+    assert len(joined) == 20 + 9 * FRAME_LENGTH
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 100, 4096])
+def test_streaming_join_matches_concat(chunk_size):
+    parts = [_clip(1), _clip(2), _clip(3, id3v1=False)]
+    assert _streamed(parts, chunk_size) == concat_mp3(parts)
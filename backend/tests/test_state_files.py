@@ -0,0 +1,46 @@
+"""State files under concurrent writers: atomic replacement and no lost updates."""
+import multiprocessing
+import threading
+
+import pytest
+
+from game import state_manager
+from game.operative_manager import load_operative, update_loyalty
+from game.state_manager import load_world_state, save_world_state
+
+UPDATES = 20
+
+
+def _lower_loyalty(times: int) -> None:
+    for _ in range(times):
+        update_loyalty("CEDAR", -1)
+
+
+def test_threads_lose_no_updates(game_dirs):
+    threads = [threading.Thread(target=_lower_loyalty, args=(UPDATES,)) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert load_operative("CEDAR")["loyalty"] == 88 - 3 * UPDATES
+
+
+@pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(), reason="needs fork")
+def test_worker_processes_lose_no_updates(game_dirs):
+    # Forked children inherit the fixture's redirected paths
+    context = multiprocessing.get_context("fork")
+    workers = [context.Process(target=_lower_loyalty, args=(UPDATES,)) for _ in range(2)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(timeout=30)
+    assert [worker.exitcode for worker in workers] == [0, 0]
+    assert load_operative("CEDAR")["loyalty"] == 88 - 2 * UPDATES
+
+
+def test_save_replaces_the_file_and_leaves_no_temporary_files(game_dirs):
+    state = load_world_state()
+    state["turn"] = 7
+    save_world_state(state)
+    assert load_world_state()["turn"] == 7
+    assert not list(state_manager.WORLD_STATE_PATH.parent.glob(".*.tmp"))
@@ -0,0 +1,80 @@
+"""Concurrent requests for the same transmission render it with ElevenLabs once."""
+import asyncio
+
+import pytest
+
+from voice import elevenlabs_client
+from voice.cache import voice_cache
+
+TEXT = "CEDAR reporting. The courier is in position."
+
+
+class _StubTTS:
+    """text_to_speech stand-in that counts upstream requests."""
+
+    def __init__(self, audio: bool = True):
+        self.audio = audio
+        self.requests = []
+
+    async def _chunks(self, text: str):
+        if self.audio:
+            for i in range(0, len(text), 8):
+                await asyncio.sleep(0.005)
+                yield text[i:i + 8].encode()
+
+    def convert(self, voice_id, text, model_id, output_format):
+        self.requests.append(text)
+        return self._chunks(text)
+
+    stream = convert
+
+
+@pytest.fixture
+def tts(voice_dir, monkeypatch):
+    stub = _StubTTS()
+    client = type("Client", (), {"text_to_speech": stub})()
+    monkeypatch.setattr(elevenlabs_client, "ELEVENLABS_API_KEY", "test")
+    monkeypatch.setattr(elevenlabs_client, "get_client", lambda: client)
+    monkeypatch.setattr(elevenlabs_client, "_voice_semaphores", {})
+    monkeypatch.setattr(elevenlabs_client, "_interactive_idle", asyncio.Event())
+    elevenlabs_client._interactive_idle.set()
+    return stub
+
+
+async def _stream():
+    stream = await elevenlabs_client.open_transmission_stream("CEDAR", TEXT)
+    return b"".join([chunk async for chunk in stream])
+
+
+def test_streams_prerender_and_render_share_one_upstream_render(tts, voice_dir):
+    async def run():
+        return await asyncio.gather(
+            _stream(), _stream(),
+            elevenlabs_client.prerender_transmission_audio("CEDAR", TEXT),
+            elevenlabs_client.render_transmission_clip("CEDAR", TEXT),
+        )
+
+    first, second, prerendered, (key, path) = asyncio.run(run())
+    # One request per sentence, whoever asked first
+    assert sorted(tts.requests) == ["CEDAR reporting.", "The courier is in position."]
+    assert first == second == path.read_bytes()
+    assert prerendered is True
+    assert voice_cache.contains(key)
+    assert not list(voice_dir.glob("*.part"))
+
+
+def test_prerender_after_stream_reuses_the_clip(tts):
+    async def run():
+        await _stream()
+        return await elevenlabs_client.prerender_transmission_audio("CEDAR", TEXT)
+
+    assert asyncio.run(run()) is True
+    assert len(tts.requests) == 2
+
+
+def test_empty_upstream_audio_is_not_cached(tts, voice_dir):
+    tts.audio = False
+    assert asyncio.run(elevenlabs_client.render_transmission_clip("CEDAR", TEXT)) is None
+    assert asyncio.run(elevenlabs_client.open_transmission_stream("CEDAR", TEXT)) is None
+    assert voice_cache.stats()["entries"] == 0
+    assert not list(voice_dir.glob("*.part"))
@@ -0,0 +1,32 @@
+"""Voice cache index: LRU order survives a restart."""
+from voice.cache import VoiceCache
+
+
+def _cache_with_clips(cache_dir, *keys) -> VoiceCache:
+    cache = VoiceCache(cache_dir, max_bytes=1024 * 1024, flush_interval=3600)
+    cache.load()
+    for key in keys:
+        path = cache.cache_dir / f"CEDAR_{key}.mp3"
+        path.write_bytes(b"\xff\xfb" + key.encode())
+        cache.commit(key, path, codename="CEDAR")
+    return cache
+
+
+def test_replays_are_flushed_and_reloaded_in_lru_order(tmp_path):
+    cache = _cache_with_clips(tmp_path, "a", "b", "c")
+    cache.lookup("a")
+    cache.flush()
+
+    reloaded = VoiceCache(tmp_path, max_bytes=1024 * 1024)
+    reloaded.load()
+    assert list(reloaded._entries) == ["b", "c", "a"]
+
+
+def test_replays_are_saved_once_the_flush_interval_passes(tmp_path):
+    cache = _cache_with_clips(tmp_path, "a", "b")
+    cache.flush_interval = 0
+    cache.lookup("a")
+
+    reloaded = VoiceCache(tmp_path, max_bytes=1024 * 1024)
+    reloaded.load()
+    assert list(reloaded._entries) == ["b", "a"]
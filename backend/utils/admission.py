@@ -0,0 +1,236 @@
+"""Admission control — per-session queues and backpressure for LLM-bound endpoints."""
+import asyncio
+import logging
+import math
+import time
+from typing import AsyncIterator, Dict
+
+from fastapi import HTTPException, Request
+
+from utils.metrics import registry, record_queue_wait
+from config import (
+    ADMISSION_MAX_IN_FLIGHT, ADMISSION_MAX_QUEUE,
+    ADMISSION_GLOBAL_MAX_IN_FLIGHT, ADMISSION_GLOBAL_MAX_QUEUE,
+    ADMISSION_INITIAL_SERVICE_SECONDS,
+)
+
+logger = logging.getLogger(__name__)
+
+SESSION_HEADER = "x-session-id"
+
+# Ticket lifecycle
+_WAITING = "waiting"
+_RUNNING = "running"
+_CLOSED = "closed"
+
+
+class AdmissionRejected(Exception):
+    """Raised when a session's queue (or the global queue) is full."""
+
+    def __init__(self, retry_after: int, scope: str):
+        super().__init__(f"{scope} queue full — retry in {retry_after}s")
+        self.retry_after = retry_after
+        self.scope = scope
+
+
+class _Queue:
+    """In-flight slots plus a bounded count of waiters."""
+
+    def __init__(self, max_in_flight: int, max_queue: int):
+        self.max_in_flight = max_in_flight
+        self.max_queue = max_queue
+        self.slots = asyncio.Semaphore(max_in_flight)
+        self.in_flight = 0
+        self.waiting = 0
+
+    @property
+    def full(self) -> bool:
+        return self.in_flight + self.waiting >= self.max_in_flight + self.max_queue
+
+    @property
+    def idle(self) -> bool:
+        return self.in_flight == 0 and self.waiting == 0
+
+
+class AdmissionTicket:
+    """A place in a session's queue.
+
+    Acquire it before doing the work and close it afterwards. Closing is
+    idempotent and also gives up the place if the work never started.
+    """
+
+    def __init__(self, controller: "AdmissionController", session_id: str):
+        self._controller = controller
+        self.session_id = session_id
+        self._state = _WAITING
+        self._started = 0.0
+        self.claimed = False
+
+    def claim(self) -> None:
+        """Mark the ticket as owned by a background job, which will close it."""
+        self.claimed = True
+
+    async def acquire(self) -> None:
+        """Wait for a session slot, then a global slot."""
+        session_queue = self._controller._sessions[self.session_id]
+        global_queue = self._controller._global
+        waiting_since = time.monotonic()
+        await session_queue.slots.acquire()
+        try:
+            await global_queue.slots.acquire()
+        except BaseException:
+            session_queue.slots.release()
+            raise
+        session_queue.waiting -= 1
+        global_queue.waiting -= 1
+        session_queue.in_flight += 1
+        global_queue.in_flight += 1
+        self._state = _RUNNING
+        self._started = time.monotonic()
+        record_queue_wait("admission", self._started - waiting_since)
+
+    def close(self) -> None:
+        if self._state == _CLOSED:
+            return
+        self._controller._release(self, running=self._state == _RUNNING, started=self._started)
+        self._state = _CLOSED
+
+
+class AdmissionController:
+    """Bounds concurrent LLM-bound work per session and overall.
+
+    Each session may run ADMISSION_MAX_IN_FLIGHT requests at once with up to
+    ADMISSION_MAX_QUEUE more waiting; beyond that, requests are rejected with
+    a Retry-After estimate instead of piling up behind each other.
+    """
+
+    def __init__(self, max_in_flight: int = ADMISSION_MAX_IN_FLIGHT, max_queue: int = ADMISSION_MAX_QUEUE,
+                 global_max_in_flight: int = ADMISSION_GLOBAL_MAX_IN_FLIGHT,
+                 global_max_queue: int = ADMISSION_GLOBAL_MAX_QUEUE):
+        self._max_in_flight = max_in_flight
+        self._max_queue = max_queue
+        self._global = _Queue(global_max_in_flight, global_max_queue)
+        self._sessions: Dict[str, _Queue] = {}
+        self._service_seconds = ADMISSION_INITIAL_SERVICE_SECONDS
+        self._admitted = 0
+        self._rejected = 0
+
+    def admit(self, session_id: str) -> AdmissionTicket:
+        """Take a place in the session's queue.
+
+        Raises:
+            AdmissionRejected: If the session or global queue is full.
+        """
+        session_queue = self._sessions.get(session_id)
+        if session_queue is None:
+            session_queue = self._sessions[session_id] = _Queue(self._max_in_flight, self._max_queue)
+        for scope, queue in (("session", session_queue), ("global", self._global)):
+            if queue.full:
+                self._rejected += 1
+                if session_queue.idle:
+                    del self._sessions[session_id]
+                retry_after = self._retry_after(queue)
+                logger.warning(f"Admission rejected for session {session_id} ({scope} queue full)")
+                raise AdmissionRejected(retry_after, scope)
+        session_queue.waiting += 1
+        self._global.waiting += 1
+        self._admitted += 1
+        return AdmissionTicket(self, session_id)
+
+    def _retry_after(self, queue: _Queue) -> int:
+        """Seconds until a place is likely to free up, from the average service time."""
+        waves = (queue.waiting + 1) / queue.max_in_flight
+        return max(1, min(60, math.ceil(self._service_seconds * waves)))
+
+    def _release(self, ticket: AdmissionTicket, running: bool, started: float) -> None:
+        session_queue = self._sessions[ticket.session_id]
+        if running:
+            session_queue.in_flight -= 1
+            self._global.in_flight -= 1
+            session_queue.slots.release()
+            self._global.slots.release()
+            # Exponentially weighted average of how long admitted work takes
+            elapsed = time.monotonic() - started
+            self._service_seconds = 0.8 * self._service_seconds + 0.2 * elapsed
+        else:
+            session_queue.waiting -= 1
+            self._global.waiting -= 1
+        if session_queue.idle:
+            del self._sessions[ticket.session_id]
+
+    def stats(self) -> dict:
+        """Queue depths and counters for monitoring."""
+        return {
+            "in_flight": self._global.in_flight,
+            "queued": self._global.waiting,
+            "admitted": self._admitted,
+            "rejected": self._rejected,
+            "avg_service_seconds": round(self._service_seconds, 3),
+            "limits": {
+                "session_max_in_flight": self._max_in_flight,
+                "session_max_queue": self._max_queue,
+                "global_max_in_flight": self._global.max_in_flight,
+                "global_max_queue": self._global.max_queue,
+            },
+            "sessions": {
+                session_id: {"in_flight": q.in_flight, "queued": q.waiting}
+                for session_id, q in self._sessions.items()
+            },
+        }
+
+
+# Global admission controller instance
+admission = AdmissionController()
+
+registry.gauge(
+    "shadow_admission_requests", "LLM-bound requests admitted, by state (in_flight or queued).",
+    lambda: {("in_flight",): admission._global.in_flight, ("queued",): admission._global.waiting},
+    ["state"],
+)
+registry.gauge(
+    "shadow_admission_avg_service_seconds", "Moving average of admitted request duration.",
+    lambda: {(): admission._service_seconds},
+)
+
+
+def session_id_for(request: Request) -> str:
+    """Identify the caller's session: the X-Session-Id header, else the client address."""
+    session_id = request.headers.get(SESSION_HEADER)
+    if session_id:
+        return session_id[:64]
+    return request.client.host if request.client else "anonymous"
+
+
+def _admit(request: Request) -> AdmissionTicket:
+    try:
+        return admission.admit(session_id_for(request))
+    except AdmissionRejected as e:
+        raise HTTPException(
+            status_code=429,
+            detail=f"Too many requests in progress ({e.scope} queue full)",
+            headers={"Retry-After": str(e.retry_after)},
+        )
+
+
+async def admitted(request: Request) -> AsyncIterator[AdmissionTicket]:
+    """Dependency: wait for a slot, holding it until the response has been sent."""
+    ticket = _admit(request)
+    try:
+        await ticket.acquire()
+        yield ticket
+    finally:
+        ticket.close()
+
+
+async def admission_ticket(request: Request) -> AsyncIterator[AdmissionTicket]:
+    """Dependency: reserve a place without waiting, for work handed to a background job.
+
+    The job claims the ticket and closes it when it finishes; an unclaimed
+    ticket (e.g. a duplicate submission) is released with the request.
+    """
+    ticket = _admit(request)
+    try:
+        yield ticket
+    finally:
+        if not ticket.claimed:
+            ticket.close()
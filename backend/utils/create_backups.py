@@ -1,12 +1,13 @@
 """Utility to create/restore backups of game state and memory files."""
 import json
-import shutil
 import logging
 from config import MEMORY_DIR, MEMORY_INITIAL_DIR, STATE_DIR, STATE_INITIAL_DIR, OPERATIVE_CODENAMES
+from game.state_manager import bump_state_version, state_lock, write_state_file
 
 logger = logging.getLogger(__name__)
 
 
+@state_lock
 def reset_game_state():
     """Reset all game state and memory files to initial values."""
     # Reset world state
@@ -14,7 +15,7 @@ def reset_game_state():
         src = STATE_INITIAL_DIR / filename
         dst = STATE_DIR / filename
         if src.exists():
-            shutil.copy2(src, dst)
+            write_state_file(dst, src.read_text(encoding="utf-8"))
             logger.info(f"Reset {filename}")
 
     # Reset operative memories
@@ -22,7 +23,8 @@ def reset_game_state():
         src = MEMORY_INITIAL_DIR / f"{codename}.json"
         dst = MEMORY_DIR / f"{codename}.json"
         if src.exists():
-            shutil.copy2(src, dst)
+            write_state_file(dst, src.read_text(encoding="utf-8"))
             logger.info(f"Reset {codename} memory")
 
+    bump_state_version()
     logger.info("Game state fully reset to initial values.")
@@ -0,0 +1,116 @@
+"""Shared upstream HTTP pool — one tuned httpx client for the Mistral and ElevenLabs SDKs."""
+import logging
+from collections import defaultdict
+from typing import Dict, Optional
+
+import httpx
+
+from config import (
+    HTTP_POOL_MAX_CONNECTIONS, HTTP_POOL_MAX_KEEPALIVE, HTTP_KEEPALIVE_EXPIRY,
+    HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT, HTTP_WRITE_TIMEOUT, HTTP_POOL_TIMEOUT,
+    HTTP2_ENABLED,
+)
+
+logger = logging.getLogger(__name__)
+
+_client: Optional[httpx.AsyncClient] = None
+
+# Per-host connection reuse counters
+_stats: Dict[str, dict] = defaultdict(lambda: {
+    "requests": 0,
+    "new_connections": 0,
+    "reused_connections": 0,
+    "tls_handshakes": 0,
+    "http_versions": defaultdict(int),
+})
+
+
+def is_http2_available() -> bool:
+    """Whether HTTP/2 was requested and the h2 package is installed."""
+    if not HTTP2_ENABLED:
+        return False
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+async def _on_request(request: httpx.Request) -> None:
+    """Attach a trace hook recording whether this request opened a connection."""
+    events = request.extensions.setdefault("shadow_trace", {"connect": False, "tls": False})
+
+    async def trace(event_name: str, info: dict) -> None:
+        if event_name == "connection.connect_tcp.complete":
+            events["connect"] = True
+        elif event_name == "connection.start_tls.complete":
+            events["tls"] = True
+
+    request.extensions["trace"] = trace
+
+
+async def _on_response(response: httpx.Response) -> None:
+    events = response.request.extensions.get("shadow_trace", {})
+    stats = _stats[response.request.url.host]
+    stats["requests"] += 1
+    if events.get("connect"):
+        stats["new_connections"] += 1
+    else:
+        stats["reused_connections"] += 1
+    if events.get("tls"):
+        stats["tls_handshakes"] += 1
+    stats["http_versions"][response.http_version] += 1
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the shared upstream client, creating it on first use."""
+    global _client
+    if _client is None:
+        http2 = is_http2_available()
+        if HTTP2_ENABLED and not http2:
+            logger.info("HTTP/2 requested but the h2 package is not installed — using HTTP/1.1")
+        _client = httpx.AsyncClient(
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=HTTP_POOL_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_POOL_MAX_KEEPALIVE,
+                keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+            ),
+            timeout=httpx.Timeout(
+                connect=HTTP_CONNECT_TIMEOUT,
+                read=HTTP_READ_TIMEOUT,
+                write=HTTP_WRITE_TIMEOUT,
+                pool=HTTP_POOL_TIMEOUT,
+            ),
+            event_hooks={"request": [_on_request], "response": [_on_response]},
+        )
+    return _client
+
+
+async def close_http_client() -> None:
+    """Close pooled connections (used on shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+def get_pool_stats() -> dict:
+    """Connection reuse per upstream host."""
+    hosts = {}
+    for host, stats in _stats.items():
+        total = stats["requests"]
+        hosts[host] = {
+            **stats,
+            "http_versions": dict(stats["http_versions"]),
+            "reuse_ratio": round(stats["reused_connections"] / total, 3) if total else 0.0,
+        }
+    return {
+        "http2": is_http2_available(),
+        "limits": {
+            "max_connections": HTTP_POOL_MAX_CONNECTIONS,
+            "max_keepalive_connections": HTTP_POOL_MAX_KEEPALIVE,
+            "keepalive_expiry": HTTP_KEEPALIVE_EXPIRY,
+        },
+        "hosts": hosts,
+    }
@@ -0,0 +1,142 @@
+"""State I/O accounting — file reads, writes and bytes per request or turn, in metrics and debug headers."""
+import contextvars
+import logging
+from collections import Counter
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from config import IO_DEBUG_HEADERS
+from utils.metrics import registry
+
+logger = logging.getLogger(__name__)
+
+READS_HEADER = "X-State-Reads"
+WRITES_HEADER = "X-State-Writes"
+BYTES_READ_HEADER = "X-State-Bytes-Read"
+BYTES_WRITTEN_HEADER = "X-State-Bytes-Written"
+IO_HEADERS = [READS_HEADER, WRITES_HEADER, BYTES_READ_HEADER, BYTES_WRITTEN_HEADER]
+
+# Operations per request: most reads touch one to a dozen files
+IO_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100)
+
+
+class IOStats:
+    """State file operations and bytes counted within one scope (a request, a job)."""
+
+    __slots__ = ("reads", "writes", "bytes_read", "bytes_written", "files")
+
+    def __init__(self):
+        self.reads = 0
+        self.writes = 0
+        self.bytes_read = 0
+        self.bytes_written = 0
+        # "read:world_state", "write:operative" ... -> count
+        self.files: Counter = Counter()
+
+    def as_dict(self) -> dict:
+        return {
+            "reads": self.reads,
+            "writes": self.writes,
+            "bytes_read": self.bytes_read,
+            "bytes_written": self.bytes_written,
+            "files": dict(sorted(self.files.items())),
+        }
+
+
+# The scope counting I/O for the current task. Tasks and threads started
+# from a request share its IOStats object, so their I/O is counted with it.
+_current_io: contextvars.ContextVar[Optional[IOStats]] = contextvars.ContextVar("current_io", default=None)
+
+_io_ops = registry.counter(
+    "shadow_state_io_total", "State file reads and writes, by operation and file kind.", ["op", "file"])
+_io_bytes = registry.counter(
+    "shadow_state_io_bytes_total", "Bytes read from and written to state files, by operation.", ["op"])
+_request_io = registry.histogram(
+    "shadow_request_state_io", "State file operations per HTTP request, by route and operation.",
+    ["route", "op"], IO_BUCKETS)
+
+
+def record_read(kind: str, nbytes: int) -> None:
+    """Count one state file read.
+
+    Args:
+        kind: What was read (e.g. 'world_state', 'operative').
+        nbytes: Bytes read.
+    """
+    _io_ops.inc("read", kind)
+    _io_bytes.inc("read", amount=nbytes)
+    stats = _current_io.get()
+    if stats is not None:
+        stats.reads += 1
+        stats.bytes_read += nbytes
+        stats.files[f"read:{kind}"] += 1
+
+
+def record_write(kind: str, nbytes: int) -> None:
+    """Count one state file write.
+
+    Args:
+        kind: What was written (e.g. 'world_state', 'operative').
+        nbytes: Bytes written.
+    """
+    _io_ops.inc("write", kind)
+    _io_bytes.inc("write", amount=nbytes)
+    stats = _current_io.get()
+    if stats is not None:
+        stats.writes += 1
+        stats.bytes_written += nbytes
+        stats.files[f"write:{kind}"] += 1
+
+
+def current_io() -> Optional[IOStats]:
+    """The IOStats of the enclosing scope, or None outside of one."""
+    return _current_io.get()
+
+
+@contextmanager
+def io_scope() -> Iterator[IOStats]:
+    """Count state I/O done within the block (and tasks started from it) separately."""
+    stats = IOStats()
+    token = _current_io.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_io.reset(token)
+
+
+class IOBudgetMiddleware:
+    """ASGI middleware counting state I/O per HTTP request.
+
+    Every request's counts go to the shadow_request_state_io histogram. With
+    IO_DEBUG_HEADERS set, responses also carry them in X-State-* headers;
+    those are sent with the response start, so I/O done while a streaming
+    body is produced only shows up in the metrics.
+    """
+
+    def __init__(self, app, exclude_prefixes: tuple = ("/api/events",), debug_headers: bool = IO_DEBUG_HEADERS):
+        self.app = app
+        self._exclude = exclude_prefixes
+        self._debug_headers = debug_headers
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"].startswith(self._exclude):
+            return await self.app(scope, receive, send)
+
+        with io_scope() as stats:
+            async def send_with_io(message):
+                if message["type"] == "http.response.start" and self._debug_headers:
+                    headers = list(message.get("headers", []))
+                    for name, value in ((READS_HEADER, stats.reads), (WRITES_HEADER, stats.writes),
+                                        (BYTES_READ_HEADER, stats.bytes_read),
+                                        (BYTES_WRITTEN_HEADER, stats.bytes_written)):
+                        headers.append((name.lower().encode(), str(value).encode()))
+                    message = {**message, "headers": headers}
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_io)
+            finally:
+                route = scope.get("route")
+                if route is not None:
+                    _request_io.observe(route.path, "read", value=stats.reads)
+                    _request_io.observe(route.path, "write", value=stats.writes)
@@ -0,0 +1,98 @@
+"""Minimal RFC 6902 JSON Patch generation and application."""
+import copy
+from typing import Any, List
+
+
+def _escape(token: str) -> str:
+    """Escape a key for use in a JSON Pointer (RFC 6901)."""
+    return str(token).replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def make_patch(old: Any, new: Any, path: str = "") -> List[dict]:
+    """Build a JSON Patch that transforms `old` into `new`.
+
+    Dicts are diffed key by key and lists element by element (with trailing
+    adds/removes), so small changes to large documents give small patches.
+
+    Args:
+        old: Source document.
+        new: Target document.
+        path: JSON Pointer prefix (used for recursion).
+
+    Returns:
+        List of patch operations.
+    """
+    if old == new:
+        return []
+
+    if isinstance(old, dict) and isinstance(new, dict):
+        ops = []
+        for key in old:
+            if key not in new:
+                ops.append({"op": "remove", "path": f"{path}/{_escape(key)}"})
+        for key, value in new.items():
+            child = f"{path}/{_escape(key)}"
+            if key not in old:
+                ops.append({"op": "add", "path": child, "value": value})
+            else:
+                ops.extend(make_patch(old[key], value, child))
+        return ops
+
+    if isinstance(old, list) and isinstance(new, list):
+        ops = []
+        common = min(len(old), len(new))
+        for i in range(common):
+            ops.extend(make_patch(old[i], new[i], f"{path}/{i}"))
+        # Remove from the end so earlier indices stay valid
+        for i in range(len(old) - 1, common - 1, -1):
+            ops.append({"op": "remove", "path": f"{path}/{i}"})
+        for i in range(common, len(new)):
+            ops.append({"op": "add", "path": f"{path}/-", "value": new[i]})
+        return ops
+
+    return [{"op": "replace", "path": path, "value": new}]
+
+
+def apply_patch(doc: Any, patch: List[dict]) -> Any:
+    """Apply add/remove/replace operations to a copy of `doc`.
+
+    Raises:
+        ValueError: If an operation is unsupported or its path is invalid.
+    """
+    doc = copy.deepcopy(doc)
+    for op in patch:
+        tokens = [_unescape(t) for t in op["path"].split("/")[1:]]
+        if not tokens:
+            if op["op"] not in ("replace", "add"):
+                raise ValueError(f"Cannot {op['op']} the document root")
+            doc = copy.deepcopy(op["value"])
+            continue
+        parent = doc
+        try:
+            for token in tokens[:-1]:
+                parent = parent[int(token)] if isinstance(parent, list) else parent[token]
+        except (KeyError, IndexError, ValueError) as e:
+            raise ValueError(f"Invalid patch path {op['path']}") from e
+        last = tokens[-1]
+        if isinstance(parent, list):
+            if op["op"] == "add":
+                index = len(parent) if last == "-" else int(last)
+                parent.insert(index, copy.deepcopy(op["value"]))
+            elif op["op"] == "remove":
+                del parent[int(last)]
+            elif op["op"] == "replace":
+                parent[int(last)] = copy.deepcopy(op["value"])
+            else:
+                raise ValueError(f"Unsupported patch op {op['op']}")
+        else:
+            if op["op"] in ("add", "replace"):
+                parent[last] = copy.deepcopy(op["value"])
+            elif op["op"] == "remove":
+                del parent[last]
+            else:
+                raise ValueError(f"Unsupported patch op {op['op']}")
+    return doc
@@ -0,0 +1,196 @@
+"""Metrics — a small in-process registry exported in the Prometheus text format."""
+import logging
+from collections import defaultdict
+from typing import Callable, Dict, List, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Upstream LLM calls take from under a second to over a minute
+LATENCY_BUCKETS = (0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 15.0, 30.0, 60.0, 120.0)
+QUEUE_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+    return f"{{{pairs}}}"
+
+
+class Counter:
+    """A monotonically increasing value per label combination."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.help = help_text
+        self.labels = tuple(labels)
+        self._values: Dict[Tuple[str, ...], float] = defaultdict(float)
+
+    def inc(self, *label_values: str, amount: float = 1.0) -> None:
+        self._values[tuple(label_values)] += amount
+
+    def lines(self) -> List[str]:
+        return [
+            f"{self.name}{_format_labels(self.labels, key)} {_format_value(value)}"
+            for key, value in sorted(self._values.items())
+        ]
+
+
+class Histogram:
+    """Observation counts in cumulative buckets, plus their sum and count."""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, help_text: str, labels: Sequence[str] = (),
+                 buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.name = name
+        self.help = help_text
+        self.labels = tuple(labels)
+        self.buckets = tuple(sorted(buckets)) + (float("inf"),)
+        self._counts: Dict[Tuple[str, ...], List[int]] = {}
+        self._sums: Dict[Tuple[str, ...], float] = defaultdict(float)
+
+    def observe(self, *label_values: str, value: float) -> None:
+        key = tuple(label_values)
+        counts = self._counts.setdefault(key, [0] * len(self.buckets))
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                counts[i] += 1
+                break
+        self._sums[key] += value
+
+    def lines(self) -> List[str]:
+        lines = []
+        for key, counts in sorted(self._counts.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                labels = _format_labels(self.labels + ("le",), key + (_format_value(bound),))
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labels, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(self._sums[key])}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class Gauge:
+    """A value read from elsewhere (e.g. a queue depth) each time metrics are rendered."""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, help_text: str, collect: Callable[[], Dict[Tuple[str, ...], float]],
+                 labels: Sequence[str] = ()):
+        self.name = name
+        self.help = help_text
+        self.labels = tuple(labels)
+        self._collect = collect
+
+    def lines(self) -> List[str]:
+        try:
+            values = self._collect()
+        except Exception as e:
+            logger.warning(f"Gauge {self.name} could not be collected: {e}")
+            return []
+        return [
+            f"{self.name}{_format_labels(self.labels, key)} {_format_value(value)}"
+            for key, value in sorted(values.items())
+        ]
+
+
+class MetricsRegistry:
+    """Holds every metric and renders them for a scrape."""
+
+    def __init__(self):
+        self._metrics: Dict[str, object] = {}
+
+    def _register(self, metric):
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, help_text: str, labels: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, help_text, labels))
+
+    def histogram(self, name: str, help_text: str, labels: Sequence[str] = (),
+                  buckets: Sequence[float] = LATENCY_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, help_text, labels, buckets))
+
+    def gauge(self, name: str, help_text: str, collect: Callable[[], Dict[Tuple[str, ...], float]],
+              labels: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, help_text, collect, labels))
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format."""
+        out = []
+        for metric in self._metrics.values():
+            out.append(f"# HELP {metric.name} {metric.help}")
+            out.append(f"# TYPE {metric.name} {metric.kind}")
+            out.extend(metric.lines())
+        return "\n".join(out) + "\n"
+
+
+# Global registry instance
+registry = MetricsRegistry()
+
+_llm_requests = registry.counter(
+    "shadow_llm_requests_total", "LLM calls by mode and outcome (ok or error).", ["mode", "outcome"])
+_llm_prompt_tokens = registry.counter(
+    "shadow_llm_prompt_tokens_total", "Prompt tokens sent, by mode.", ["mode"])
+_llm_completion_tokens = registry.counter(
+    "shadow_llm_completion_tokens_total", "Completion tokens received, by mode.", ["mode"])
+_llm_latency = registry.histogram(
+    "shadow_llm_upstream_seconds", "Upstream LLM call latency, by mode.", ["mode"], LATENCY_BUCKETS)
+_llm_fallbacks = registry.counter(
+    "shadow_llm_fallbacks_total", "LLM results replaced by a local fallback, by mode.", ["mode"])
+_queue_wait = registry.histogram(
+    "shadow_queue_wait_seconds", "Time work waited before starting, by queue.", ["queue"], QUEUE_BUCKETS)
+
+
+def record_llm_call(mode: str, seconds: float, prompt_tokens: int = 0,
+                    completion_tokens: int = 0, error: bool = False) -> None:
+    """Record one upstream LLM call.
+
+    Args:
+        mode: What the call was for (e.g. 'route_order', 'operative').
+        seconds: Upstream latency.
+        prompt_tokens: Prompt tokens reported by the API.
+        completion_tokens: Completion tokens reported by the API.
+        error: Whether the call failed.
+    """
+    _llm_requests.inc(mode, "error" if error else "ok")
+    _llm_latency.observe(mode, value=seconds)
+    if prompt_tokens:
+        _llm_prompt_tokens.inc(mode, amount=prompt_tokens)
+    if completion_tokens:
+        _llm_completion_tokens.inc(mode, amount=completion_tokens)
+
+
+def record_fallback(mode: str) -> None:
+    """Record that a local fallback stood in for an LLM result."""
+    _llm_fallbacks.inc(mode)
+
+
+def record_queue_wait(queue: str, seconds: float) -> None:
+    """Record how long a piece of work waited for a slot (e.g. 'admission', 'job')."""
+    _queue_wait.observe(queue, value=seconds)
+
+
+def render_metrics() -> str:
+    return registry.render()
@@ -0,0 +1,228 @@
+"""Request profiling — opt-in, per-request profiles stored on disk with retention limits."""
+import asyncio
+import cProfile
+import io
+import json
+import logging
+import pstats
+import random
+import re
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional
+
+from config import (
+    PROFILING_ENABLED, PROFILING_TOKEN, PROFILE_SAMPLE_RATE,
+    PROFILE_DIR, PROFILE_MAX_COUNT, PROFILE_MAX_BYTES,
+)
+from utils.tracing import tracer
+
+logger = logging.getLogger(__name__)
+
+PROFILE_HEADER = "x-profile"
+PROFILE_ID_HEADER = "X-Profile-Id"
+
+_ID_PATTERN = re.compile(r"^[0-9a-f]{12}$")
+
+
+def is_pyinstrument_available() -> bool:
+    """Whether the sampling profiler (pyinstrument) is installed."""
+    try:
+        import pyinstrument  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+class _RequestProfiler:
+    """Wraps pyinstrument when installed, cProfile otherwise.
+
+    pyinstrument's async mode attributes time spent awaiting to the coroutine
+    that awaited, so the saved tree follows a request through TurnManager
+    into the LLM calls. cProfile only sees the functions that ran on the
+    event loop thread while the request was open, so its report also
+    includes work done for other requests at the same time.
+    """
+
+    def __init__(self):
+        if is_pyinstrument_available():
+            from pyinstrument import Profiler
+            self.kind = "pyinstrument"
+            self.extension = ".html"
+            self._profiler = Profiler(async_mode="enabled")
+        else:
+            self.kind = "cprofile"
+            self.extension = ".prof"
+            self._profiler = cProfile.Profile()
+
+    def start(self) -> None:
+        if self.kind == "pyinstrument":
+            self._profiler.start()
+        else:
+            self._profiler.enable()
+
+    def stop(self) -> None:
+        if self.kind == "pyinstrument":
+            self._profiler.stop()
+        else:
+            self._profiler.disable()
+
+    def write(self, path: Path) -> None:
+        if self.kind == "pyinstrument":
+            path.write_text(self._profiler.output_html(), encoding="utf-8")
+        else:
+            self._profiler.dump_stats(str(path))
+
+
+class ProfileStore:
+    """Profile artifacts plus a JSON metadata file for each, bounded by count and bytes."""
+
+    def __init__(self, profile_dir: Path = PROFILE_DIR, max_count: int = PROFILE_MAX_COUNT,
+                 max_bytes: int = PROFILE_MAX_BYTES):
+        self.profile_dir = profile_dir
+        self.max_count = max_count
+        self.max_bytes = max_bytes
+
+    def _meta_path(self, profile_id: str) -> Path:
+        return self.profile_dir / f"{profile_id}.json"
+
+    def save(self, profile_id: str, profiler: _RequestProfiler, meta: dict) -> dict:
+        """Write a profile artifact and its metadata, then enforce retention.
+
+        Returns:
+            The stored metadata.
+        """
+        self.profile_dir.mkdir(parents=True, exist_ok=True)
+        artifact = self.profile_dir / f"{profile_id}{profiler.extension}"
+        profiler.write(artifact)
+        meta = {
+            **meta,
+            "id": profile_id,
+            "profiler": profiler.kind,
+            "artifact": artifact.name,
+            "bytes": artifact.stat().st_size,
+        }
+        self._meta_path(profile_id).write_text(json.dumps(meta), encoding="utf-8")
+        self._prune()
+        return meta
+
+    def list(self) -> List[dict]:
+        """Metadata for every stored profile, newest first."""
+        if not self.profile_dir.exists():
+            return []
+        profiles = []
+        for path in self.profile_dir.glob("*.json"):
+            try:
+                profiles.append(json.loads(path.read_text(encoding="utf-8")))
+            except (OSError, ValueError):
+                continue
+        return sorted(profiles, key=lambda p: p.get("created_at", ""), reverse=True)
+
+    def get(self, profile_id: str) -> Optional[dict]:
+        if not _ID_PATTERN.match(profile_id):
+            return None
+        try:
+            return json.loads(self._meta_path(profile_id).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def artifact_path(self, meta: dict) -> Path:
+        return self.profile_dir / meta["artifact"]
+
+    def delete(self, profile_id: str) -> bool:
+        meta = self.get(profile_id)
+        if meta is None:
+            return False
+        self.artifact_path(meta).unlink(missing_ok=True)
+        self._meta_path(profile_id).unlink(missing_ok=True)
+        return True
+
+    def _prune(self) -> None:
+        """Drop the oldest profiles beyond the count or byte budget."""
+        profiles = self.list()
+        total = sum(p.get("bytes", 0) for p in profiles)
+        while profiles and (len(profiles) > self.max_count or total > self.max_bytes):
+            oldest = profiles.pop()
+            total -= oldest.get("bytes", 0)
+            self.delete(oldest["id"])
+            logger.info(f"Profile {oldest['id']} removed (retention)")
+
+
+def render_text_report(path: Path, limit: int = 60) -> str:
+    """Top functions by cumulative time from a cProfile artifact."""
+    out = io.StringIO()
+    stats = pstats.Stats(str(path), stream=out)
+    stats.sort_stats("cumulative").print_stats(limit)
+    return out.getvalue()
+
+
+# Global profile store instance
+profile_store = ProfileStore()
+
+
+def token_matches(value: Optional[str]) -> bool:
+    """Whether a supplied token is acceptable (any value when no token is configured)."""
+    return not PROFILING_TOKEN or value == PROFILING_TOKEN
+
+
+class ProfilingMiddleware:
+    """ASGI middleware profiling selected requests.
+
+    Does nothing unless PROFILING_ENABLED is set. Then a request is profiled
+    when it carries an X-Profile header (whose value must equal
+    PROFILING_TOKEN, if one is configured) or is picked by
+    PROFILE_SAMPLE_RATE. One request is profiled at a time; the response of
+    a profiled request carries X-Profile-Id.
+    """
+
+    def __init__(self, app, exclude_prefixes: tuple = ("/api/events", "/api/admin")):
+        self.app = app
+        self._exclude = exclude_prefixes
+        self._active = False
+
+    def _wanted(self, scope) -> bool:
+        for name, value in scope.get("headers", []):
+            if name == PROFILE_HEADER.encode():
+                return token_matches(value.decode("latin-1"))
+        return PROFILE_SAMPLE_RATE > 0 and random.random() < PROFILE_SAMPLE_RATE
+
+    async def __call__(self, scope, receive, send):
+        if (not PROFILING_ENABLED or scope["type"] != "http" or self._active
+                or scope["path"].startswith(self._exclude) or not self._wanted(scope)):
+            return await self.app(scope, receive, send)
+
+        self._active = True
+        profile_id = uuid.uuid4().hex[:12]
+        status = {"code": None}
+
+        async def send_with_profile_id(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+                headers = list(message.get("headers", []))
+                headers.append((PROFILE_ID_HEADER.lower().encode(), profile_id.encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        profiler = _RequestProfiler()
+        started = time.perf_counter()
+        profiler.start()
+        try:
+            await self.app(scope, receive, send_with_profile_id)
+        finally:
+            profiler.stop()
+            self._active = False
+            meta = {
+                "method": scope["method"],
+                "path": scope["path"],
+                "status": status["code"],
+                "duration_ms": round((time.perf_counter() - started) * 1000, 1),
+                "created_at": datetime.now().isoformat(),
+                "trace_id": tracer.current_trace_id(),
+            }
+            try:
+                await asyncio.to_thread(profile_store.save, profile_id, profiler, meta)
+                logger.info(f"Profiled {meta['method']} {meta['path']} ({meta['duration_ms']}ms) as {profile_id}")
+            except Exception as e:
+                logger.warning(f"Could not save profile {profile_id}: {e}")
@@ -0,0 +1,80 @@
+"""Startup timing — import-to-ready time, warm-up steps and first-request latency."""
+import logging
+import time
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class StartupTimer:
+    """Collects boot timings so cold-start regressions show up in the logs."""
+
+    def __init__(self):
+        self.import_started: Optional[float] = None
+        self.imported: Optional[float] = None
+        self.ready: Optional[float] = None
+        self.steps: Dict[str, float] = {}
+        self.first_request_ms: Optional[float] = None
+        self.first_request_path: Optional[str] = None
+
+    def mark_imported(self, import_started: float) -> None:
+        self.import_started = import_started
+        self.imported = time.perf_counter()
+
+    @contextmanager
+    def step(self, name: str):
+        """Time one warm-up step."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.steps[name] = round((time.perf_counter() - started) * 1000, 1)
+
+    def mark_ready(self) -> None:
+        self.ready = time.perf_counter()
+        report = self.report()
+        steps = ", ".join(f"{name} {ms:.0f}ms" for name, ms in self.steps.items())
+        logger.info(
+            f"Ready in {report['import_to_ready_ms']:.0f}ms "
+            f"(imports {report['import_ms']:.0f}ms; warm-up: {steps})"
+        )
+
+    def record_first_request(self, path: str, elapsed: float) -> None:
+        self.first_request_ms = round(elapsed * 1000, 1)
+        self.first_request_path = path
+        logger.info(f"First request ({path}) served in {self.first_request_ms:.0f}ms")
+
+    def report(self) -> dict:
+        def ms(start, end):
+            return round((end - start) * 1000, 1) if start is not None and end is not None else None
+        return {
+            "import_ms": ms(self.import_started, self.imported),
+            "warmup_ms": ms(self.imported, self.ready),
+            "import_to_ready_ms": ms(self.import_started, self.ready),
+            "warmup_steps_ms": dict(self.steps),
+            "first_request_ms": self.first_request_ms,
+            "first_request_path": self.first_request_path,
+        }
+
+
+# Global startup timer instance
+startup_timer = StartupTimer()
+
+
+class FirstRequestTimer:
+    """ASGI middleware recording how long the first HTTP request takes end to end."""
+
+    def __init__(self, app):
+        self.app = app
+        self._pending = True
+
+    async def __call__(self, scope, receive, send):
+        if not self._pending or scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        self._pending = False
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            startup_timer.record_first_request(scope["path"], time.perf_counter() - started)
@@ -0,0 +1,270 @@
+"""Tracing — lightweight spans across the turn cycle, kept in memory and optionally exported as OTLP JSON."""
+import contextvars
+import functools
+import inspect
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Iterator, List, Optional
+
+from config import TRACING_ENABLED, TRACE_BUFFER_SIZE, TRACE_EXPORT_PATH
+
+logger = logging.getLogger(__name__)
+
+SERVICE_NAME = "shadow-network"
+TRACE_HEADER = "X-Trace-Id"
+
+# Export is batched: spans are written when a root span ends or this many are pending
+_EXPORT_BATCH_SIZE = 256
+
+# OTLP status codes
+_STATUS_OK = 1
+_STATUS_ERROR = 2
+
+
+class Span:
+    """One timed operation within a trace."""
+
+    __slots__ = ("trace_id", "span_id", "parent_id", "name", "attributes",
+                 "start_ns", "end_ns", "error", "_token")
+
+    def __init__(self, name: str, parent: Optional["Span"], attributes: dict):
+        self.trace_id = parent.trace_id if parent else os.urandom(16).hex()
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent.span_id if parent else None
+        self.name = name
+        self.attributes = attributes
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.error: Optional[str] = None
+        self._token = None
+
+    def set(self, **attributes) -> None:
+        """Add attributes (e.g. token counts) once they are known."""
+        self.attributes.update(attributes)
+
+    @property
+    def duration_ms(self) -> float:
+        end = self.end_ns if self.end_ns is not None else time.time_ns()
+        return (end - self.start_ns) / 1e6
+
+    def to_dict(self) -> dict:
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "start_ns": self.start_ns,
+            "duration_ms": round(self.duration_ms, 3),
+            "attributes": dict(self.attributes),
+            "error": self.error,
+        }
+
+    def to_otlp(self) -> dict:
+        span = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": 1,  # SPAN_KIND_INTERNAL
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns or self.start_ns),
+            "attributes": [_otlp_attribute(k, v) for k, v in self.attributes.items()],
+            "status": (
+                {"code": _STATUS_ERROR, "message": self.error} if self.error else {"code": _STATUS_OK}
+            ),
+        }
+        if self.parent_id:
+            span["parentSpanId"] = self.parent_id
+        return span
+
+
+def _otlp_attribute(key: str, value) -> dict:
+    if isinstance(value, bool):
+        return {"key": key, "value": {"boolValue": value}}
+    if isinstance(value, int):
+        return {"key": key, "value": {"intValue": str(value)}}
+    if isinstance(value, float):
+        return {"key": key, "value": {"doubleValue": value}}
+    return {"key": key, "value": {"stringValue": str(value)}}
+
+
+def otlp_document(spans: List[Span]) -> dict:
+    """Wrap spans in an OTLP/JSON ExportTraceServiceRequest."""
+    return {
+        "resourceSpans": [{
+            "resource": {"attributes": [_otlp_attribute("service.name", SERVICE_NAME)]},
+            "scopeSpans": [{
+                "scope": {"name": SERVICE_NAME},
+                "spans": [span.to_otlp() for span in spans],
+            }],
+        }],
+    }
+
+
+class Tracer:
+    """Collects finished spans into a ring of recent traces.
+
+    The current span is held in a context variable, so it follows the code
+    through awaits and into tasks started from it (e.g. parallel operative
+    calls and background jobs).
+    """
+
+    def __init__(self, enabled: bool = TRACING_ENABLED, buffer_size: int = TRACE_BUFFER_SIZE,
+                 export_path: str = TRACE_EXPORT_PATH):
+        self.enabled = enabled
+        self._buffer_size = buffer_size
+        self._export_path = export_path
+        self._current: contextvars.ContextVar[Optional[Span]] = contextvars.ContextVar("current_span", default=None)
+        self._traces: "OrderedDict[str, List[Span]]" = OrderedDict()
+        self._pending: List[Span] = []
+        # Sync endpoints and their state helpers run in the threadpool
+        self._lock = threading.Lock()
+
+    def current_span(self) -> Optional[Span]:
+        return self._current.get()
+
+    def current_trace_id(self) -> Optional[str]:
+        span = self._current.get()
+        return span.trace_id if span else None
+
+    def start(self, name: str, **attributes) -> Span:
+        span = Span(name, self._current.get(), attributes)
+        span._token = self._current.set(span)
+        return span
+
+    def finish(self, span: Span, error: Optional[BaseException] = None) -> None:
+        span.end_ns = time.time_ns()
+        if error is not None:
+            span.error = f"{type(error).__name__}: {error}"
+        try:
+            self._current.reset(span._token)
+        except ValueError:
+            # Finished in a different context than it started in (e.g. a generator)
+            pass
+        self._record(span)
+
+    def _record(self, span: Span) -> None:
+        with self._lock:
+            spans = self._traces.get(span.trace_id)
+            if spans is None:
+                spans = self._traces[span.trace_id] = []
+                while len(self._traces) > self._buffer_size:
+                    self._traces.popitem(last=False)
+            spans.append(span)
+            if not self._export_path:
+                return
+            self._pending.append(span)
+            due = span.parent_id is None or len(self._pending) >= _EXPORT_BATCH_SIZE
+        if due:
+            self.flush()
+
+    def flush(self) -> None:
+        """Append pending spans to the export file as one OTLP/JSON line."""
+        with self._lock:
+            if not self._pending or not self._export_path:
+                return
+            spans, self._pending = self._pending, []
+        try:
+            with open(self._export_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(otlp_document(spans)) + "\n")
+        except OSError as e:
+            logger.warning(f"Trace export to {self._export_path} failed: {e}")
+
+    def recent(self, limit: int = 50) -> list:
+        """Summaries of the most recent traces, newest first."""
+        with self._lock:
+            traces = [(trace_id, list(spans)) for trace_id, spans in reversed(self._traces.items())][:limit]
+        summaries = []
+        for trace_id, spans in traces:
+            root = next((s for s in spans if s.parent_id is None), spans[0])
+            summaries.append({
+                "trace_id": trace_id,
+                "root": root.name,
+                "started_ns": min(s.start_ns for s in spans),
+                "duration_ms": round(root.duration_ms, 3),
+                "spans": len(spans),
+                "errors": sum(1 for s in spans if s.error),
+            })
+        return summaries
+
+    def get(self, trace_id: str) -> Optional[List[Span]]:
+        with self._lock:
+            spans = self._traces.get(trace_id)
+            spans = list(spans) if spans is not None else None
+        return sorted(spans, key=lambda s: s.start_ns) if spans is not None else None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._traces.clear()
+
+
+# Global tracer instance
+tracer = Tracer()
+
+
+@contextmanager
+def span(name: str, **attributes) -> Iterator[Optional[Span]]:
+    """Time a block as a span, a child of whatever span is current.
+
+    Yields None when tracing is disabled.
+    """
+    if not tracer.enabled:
+        yield None
+        return
+    current = tracer.start(name, **attributes)
+    try:
+        yield current
+    except BaseException as e:
+        tracer.finish(current, e)
+        raise
+    tracer.finish(current)
+
+
+def traced(name: str):
+    """Decorator: run a function (sync or async) inside a span of the given name."""
+    def decorator(func):
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if not tracer.enabled:
+                    return await func(*args, **kwargs)
+                with span(name):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not tracer.enabled:
+                return func(*args, **kwargs)
+            with span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+class TracingMiddleware:
+    """ASGI middleware opening a root span per HTTP request and returning its trace id."""
+
+    def __init__(self, app, exclude_prefixes: tuple = ("/api/events", "/api/debug")):
+        self.app = app
+        self._exclude = exclude_prefixes
+
+    async def __call__(self, scope, receive, send):
+        if (not tracer.enabled or scope["type"] != "http"
+                or scope["path"].startswith(self._exclude)):
+            return await self.app(scope, receive, send)
+
+        with span(f"{scope['method']} {scope['path']}", **{"http.method": scope["method"]}) as root:
+            async def send_with_trace_id(message):
+                if message["type"] == "http.response.start":
+                    root.set(**{"http.status_code": message["status"]})
+                    headers = list(message.get("headers", []))
+                    headers.append((TRACE_HEADER.lower().encode(), root.trace_id.encode()))
+                    message = {**message, "headers": headers}
+                await send(message)
+
+            await self.app(scope, receive, send_with_trace_id)
@@ -0,0 +1,275 @@
+"""Voice Cache — bounded, indexed on-disk cache of rendered audio clips."""
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+from config import VOICE_CACHE_DIR, VOICE_CACHE_MAX_BYTES, VOICE_CACHE_INDEX_FLUSH_SECONDS
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILENAME = "index.json"
+
+
+def _extension_for(output_format: str) -> str:
+    """File extension for an audio output format (e.g. 'mp3_44100_128' -> '.mp3')."""
+    container = output_format.split("_", 1)[0]
+    return {"mp3": ".mp3", "opus": ".ogg", "ogg": ".ogg", "wav": ".wav"}.get(container, ".bin")
+
+
+class VoiceCache:
+    """LRU cache of audio clips with an in-memory index and a byte budget.
+
+    The index maps cache keys to entry metadata and is kept in LRU order
+    (least recently used first). It is persisted alongside the clips so it can
+    be reloaded at startup without touching every file. Writes and evictions
+    save it immediately; replays only mark it dirty, and it is saved at most
+    every `flush_interval` seconds (and by flush() on shutdown), so LRU order
+    survives a restart without an index write per replay.
+    """
+
+    def __init__(self, cache_dir: Path, max_bytes: int, flush_interval: float = 30.0):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.flush_interval = flush_interval
+        self._entries: "OrderedDict[str, dict]" = OrderedDict()
+        self._loaded = False
+        self._dirty = False
+        self._saved_at = 0.0
+        self.hits = 0
+        self.misses = 0
+        self.bytes_written = 0
+        self.bytes_hit = 0
+        self.evictions = 0
+        self.bytes_evicted = 0
+
+    # --- Keys & paths ---
+
+    @staticmethod
+    def make_key(voice_id: str, model_id: str, output_format: str, text: str) -> str:
+        """Build a cache key covering everything that changes the rendered audio."""
+        material = "\x1f".join([voice_id, model_id, output_format, text])
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()[:32]
+
+    def path_for(self, key: str, codename: str, output_format: str) -> Path:
+        """Path a clip with this key should be written to."""
+        return self.cache_dir / f"{codename}_{key}{_extension_for(output_format)}"
+
+    def part_path(self) -> Path:
+        """Create a uniquely named partial file to write a clip into before committing it.
+
+        Every writer gets its own file, so concurrent renders of the same key
+        never interleave; leftovers from a crash are removed by load().
+        """
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, name = tempfile.mkstemp(dir=self.cache_dir, suffix=".part")
+        os.close(fd)
+        return Path(name)
+
+    # --- Index lifecycle ---
+
+    def load(self) -> None:
+        """Load the index from disk, reconciling it with the files present."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        entries = {}
+        index_path = self.cache_dir / INDEX_FILENAME
+        if index_path.exists():
+            try:
+                with open(index_path, "r") as f:
+                    entries = {e["key"]: e for e in json.load(f).get("entries", [])}
+            except (json.JSONDecodeError, KeyError, TypeError) as e:
+                logger.warning(f"Voice cache index unreadable, rebuilding: {e}")
+
+        on_disk = {}
+        for path in self.cache_dir.iterdir():
+            if path.name.startswith("index.") or not path.is_file():
+                continue
+            if path.suffix == ".part":
+                # Left over from an interrupted stream
+                path.unlink(missing_ok=True)
+                continue
+            on_disk[path.name] = path
+
+        self._entries.clear()
+        for entry in sorted(entries.values(), key=lambda e: e.get("last_access", 0)):
+            path = on_disk.pop(entry.get("filename", ""), None)
+            if path is not None:
+                self._entries[entry["key"]] = entry
+
+        # Files with no index entry (e.g. clips from an older cache layout) are
+        # adopted as least-recently-used so the budget accounts for them
+        for path in sorted(on_disk.values(), key=lambda p: p.stat().st_mtime):
+            stat = path.stat()
+            key = f"orphan:{path.name}"
+            self._entries[key] = {
+                "key": key,
+                "filename": path.name,
+                "codename": path.name.split("_", 1)[0],
+                "size": stat.st_size,
+                "created_at": stat.st_mtime,
+                "last_access": stat.st_mtime,
+            }
+            self._entries.move_to_end(key, last=False)
+
+        self._loaded = True
+        self._evict_to_budget()
+        self._save_index()
+        logger.info(f"Voice cache loaded ({len(self._entries)} clips, {self.total_bytes} bytes)")
+
+    def _ensure_loaded(self) -> None:
+        if not self._loaded:
+            self.load()
+
+    def _save_index(self) -> None:
+        """Persist the index atomically."""
+        index_path = self.cache_dir / INDEX_FILENAME
+        tmp_path = index_path.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump({"entries": list(self._entries.values())}, f)
+        os.replace(tmp_path, index_path)
+        self._dirty = False
+        self._saved_at = time.monotonic()
+
+    def flush(self) -> None:
+        """Save access order changed by lookups since the index was last written."""
+        if self._loaded and self._dirty:
+            self._save_index()
+
+    # --- Lookups & writes ---
+
+    def lookup(self, key: str) -> Optional[Path]:
+        """Find a cached clip by key, marking it most recently used.
+
+        Returns:
+            Path to the clip, or None on a miss.
+        """
+        self._ensure_loaded()
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        entry["last_access"] = time.time()
+        self.hits += 1
+        self.bytes_hit += entry["size"]
+        self._dirty = True
+        if time.monotonic() - self._saved_at >= self.flush_interval:
+            self._save_index()
+        return self.cache_dir / entry["filename"]
+
+    def contains(self, key: str) -> bool:
+        """Check for a key without affecting LRU order or metrics."""
+        self._ensure_loaded()
+        return key in self._entries
+
+    def entry(self, key: str) -> Optional[dict]:
+        """Get an entry's metadata without affecting LRU order or metrics."""
+        self._ensure_loaded()
+        return self._entries.get(key)
+
+    def commit(self, key: str, path: Path, **metadata) -> None:
+        """Register a clip that has been fully written to `path`.
+
+        Args:
+            key: Cache key from make_key().
+            path: Location of the written clip inside the cache directory.
+            **metadata: Extra fields stored on the entry (codename, voice_id, ...).
+        """
+        self._ensure_loaded()
+        size = path.stat().st_size
+        now = time.time()
+        self._entries[key] = {
+            **metadata,
+            "key": key,
+            "filename": path.name,
+            "size": size,
+            "created_at": now,
+            "last_access": now,
+        }
+        self._entries.move_to_end(key)
+        self.bytes_written += size
+        self._evict_to_budget(keep=key)
+        self._save_index()
+
+    # --- Eviction ---
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(e["size"] for e in self._entries.values())
+
+    def _remove(self, key: str) -> int:
+        entry = self._entries.pop(key)
+        (self.cache_dir / entry["filename"]).unlink(missing_ok=True)
+        self.evictions += 1
+        self.bytes_evicted += entry["size"]
+        return entry["size"]
+
+    def _evict_to_budget(self, keep: Optional[str] = None) -> None:
+        """Evict least-recently-used clips until the cache fits its byte budget."""
+        total = self.total_bytes
+        for key in list(self._entries.keys()):
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            total -= self._remove(key)
+
+    def evict(self, codename: Optional[str] = None, voice_id: Optional[str] = None,
+              keys: Optional[list] = None, older_than: Optional[float] = None) -> dict:
+        """Evict clips matching every given filter.
+
+        Args:
+            codename: Only clips rendered for this operative.
+            voice_id: Only clips rendered with this voice.
+            keys: Only these cache keys.
+            older_than: Only clips not accessed in this many seconds.
+
+        Returns:
+            Dict with the number of clips and bytes evicted.
+        """
+        self._ensure_loaded()
+        cutoff = time.time() - older_than if older_than is not None else None
+        removed, freed = 0, 0
+        for key, entry in list(self._entries.items()):
+            if codename is not None and entry.get("codename") != codename:
+                continue
+            if voice_id is not None and entry.get("voice_id") != voice_id:
+                continue
+            if keys is not None and key not in keys:
+                continue
+            if cutoff is not None and entry["last_access"] >= cutoff:
+                continue
+            freed += self._remove(key)
+            removed += 1
+        if removed:
+            self._save_index()
+        logger.info(f"Voice cache evicted {removed} clips ({freed} bytes)")
+        return {"evicted": removed, "bytes_freed": freed}
+
+    # --- Metrics ---
+
+    def stats(self) -> dict:
+        """Cache size and hit/miss/bytes counters."""
+        self._ensure_loaded()
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self.total_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 3) if lookups else 0.0,
+            "bytes_hit": self.bytes_hit,
+            "bytes_written": self.bytes_written,
+            "evictions": self.evictions,
+            "bytes_evicted": self.bytes_evicted,
+        }
+
+
+# Global voice cache instance
+voice_cache = VoiceCache(VOICE_CACHE_DIR, VOICE_CACHE_MAX_BYTES, VOICE_CACHE_INDEX_FLUSH_SECONDS)
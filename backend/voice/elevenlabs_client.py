@@ -1,38 +1,250 @@
 """ElevenLabs TTS client — generates operative voice transmissions."""
-import hashlib
+import asyncio
 import logging
+from contextlib import aclosing, asynccontextmanager
 from pathlib import Path
-from typing import Optional
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 
-from elevenlabs.client import ElevenLabs
-from config import ELEVENLABS_API_KEY, ELEVENLABS_MODEL, OPERATIVE_VOICES, VOICE_CACHE_DIR
+import aiofiles
+from config import (
+    ELEVENLABS_API_KEY, ELEVENLABS_MODEL, ELEVENLABS_OUTPUT_FORMAT, OPERATIVE_VOICES,
+    TTS_MAX_CONCURRENCY_PER_VOICE, TTS_SEGMENTATION_ENABLED, UPSTREAM_WARMUP_TIMEOUT,
+    HTTP_READ_TIMEOUT,
+)
+from utils.http_pool import get_http_client
+from voice.cache import voice_cache
+from voice.segmentation import normalize_text, split_sentences, concat_mp3, strip_join_head, ID3V1_LENGTH
+from voice.transcode import (
+    is_transcoding_available, transcode, validate_variant, variant_name, record_served, MEDIA_TYPES,
+)
+from utils.tracing import traced
 
 logger = logging.getLogger(__name__)
 
-# Initialize ElevenLabs client
-client = ElevenLabs(api_key=ELEVENLABS_API_KEY) if ELEVENLABS_API_KEY else None
+# ElevenLabs client (async, so TTS never blocks the event loop) — created on
+# first use so importing the SDK doesn't slow down startup
+_client = None
 
-# Ensure cache directory exists
-VOICE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+# Chunk size used when streaming cached clips back to the client
+STREAM_CHUNK_SIZE = 16 * 1024
 
+# Per-voice concurrency limits — one slow voice can't starve the others
+_voice_semaphores: Dict[str, asyncio.Semaphore] = {}
 
-def _get_cache_path(codename: str, text: str) -> Path:
-    """Generate a cache file path based on codename and text hash."""
-    text_hash = hashlib.md5(text.encode()).hexdigest()[:12]
-    return VOICE_CACHE_DIR / f"{codename}_{text_hash}.mp3"
+# On-demand (Director-initiated) renders in flight — background pre-rendering
+# waits for these to drain so it never competes with a pressed play button
+_interactive_in_flight = 0
+_interactive_idle = asyncio.Event()
+_interactive_idle.set()
 
+# Cache key -> [lock, requests holding or waiting for it]. Renders, pre-renders
+# and streams of the same clip (or sentence) queue on its lock, so ElevenLabs
+# is asked for it once and the others reuse the cached result
+_render_locks: Dict[str, list] = {}
 
-def generate_transmission_audio(codename: str, text: str) -> Optional[bytes]:
-    """Generate TTS audio for an operative's transmission.
+
+def _cache_key(voice_id: str, text: str) -> str:
+    """Voice cache key for a clip rendered with the configured model and format."""
+    return voice_cache.make_key(voice_id, ELEVENLABS_MODEL, ELEVENLABS_OUTPUT_FORMAT, text)
+
+
+def _commit_to_cache(key: str, path: Path, codename: str, voice_id: str, kind: str = "clip") -> None:
+    """Register a fully written clip (or sentence segment) in the voice cache index."""
+    voice_cache.commit(
+        key, path,
+        codename=codename,
+        voice_id=voice_id,
+        model_id=ELEVENLABS_MODEL,
+        output_format=ELEVENLABS_OUTPUT_FORMAT,
+        kind=kind,
+    )
+
+
+def _segments_for(text: str) -> List[str]:
+    """Spoken segments for a transmission.
+    
+    Text is normalized and, for MP3 output, split into sentences so each
+    sentence is synthesized and cached once per voice — recurring sign-ons and
+    sign-offs are never re-rendered.
+    """
+    normalized = normalize_text(text) or text
+    if not TTS_SEGMENTATION_ENABLED or not ELEVENLABS_OUTPUT_FORMAT.startswith("mp3"):
+        return [normalized]
+    return split_sentences(normalized) or [normalized]
+
+
+def _get_voice_semaphore(voice_id: str) -> asyncio.Semaphore:
+    """Get the concurrency limiter for a voice, creating it on first use."""
+    semaphore = _voice_semaphores.get(voice_id)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(TTS_MAX_CONCURRENCY_PER_VOICE)
+        _voice_semaphores[voice_id] = semaphore
+    return semaphore
+
+
+@asynccontextmanager
+async def _interactive_request():
+    """Mark an on-demand render as in flight for its duration."""
+    global _interactive_in_flight
+    _interactive_in_flight += 1
+    _interactive_idle.clear()
+    try:
+        yield
+    finally:
+        _interactive_in_flight -= 1
+        if _interactive_in_flight == 0:
+            _interactive_idle.set()
+
+
+@asynccontextmanager
+async def _rendering(key: str):
+    """Hold the render lock for a cache key.
+    
+    Whoever gets the lock after waiting must re-check the cache before
+    rendering — the previous holder has usually just committed the clip.
+    """
+    slot = _render_locks.setdefault(key, [asyncio.Lock(), 0])
+    slot[1] += 1
+    try:
+        async with slot[0]:
+            yield
+    finally:
+        slot[1] -= 1
+        if slot[1] == 0:
+            del _render_locks[key]
+
+
+def get_client():
+    """Get the ElevenLabs client, constructing it on first use (None without an API key)."""
+    global _client
+    if _client is None and ELEVENLABS_API_KEY:
+        from elevenlabs.client import AsyncElevenLabs
+        _client = AsyncElevenLabs(
+            api_key=ELEVENLABS_API_KEY,
+            httpx_client=get_http_client(),
+            timeout=HTTP_READ_TIMEOUT,
+        )
+    return _client
+
+
+def reset_client() -> None:
+    """Drop the client, so the next call builds one on the current HTTP pool (used on shutdown)."""
+    global _client
+    _client = None
+
+
+async def warm_up() -> bool:
+    """Construct the client and open a pooled connection to the API.
+    
+    Returns:
+        True if the API answered.
+    """
+    if not ELEVENLABS_API_KEY:
+        return False
+    try:
+        await asyncio.wait_for(get_client().models.list(), timeout=UPSTREAM_WARMUP_TIMEOUT)
+        return True
+    except Exception as e:
+        logger.warning(f"ElevenLabs warm-up failed: {e}")
+        return False
+
+
+def is_tts_available(codename: str) -> bool:
+    """Whether audio can be generated for an operative at all."""
+    return bool(ELEVENLABS_API_KEY) and codename in OPERATIVE_VOICES
+
+
+@traced("tts.render")
+async def _render(voice_id: str, text: str) -> bytes:
+    """Render text with ElevenLabs in one request."""
+    async with _get_voice_semaphore(voice_id):
+        # Generate audio
+        audio_stream = get_client().text_to_speech.convert(
+            voice_id=voice_id,
+            text=text,
+            model_id=ELEVENLABS_MODEL,
+            output_format=ELEVENLABS_OUTPUT_FORMAT,
+        )
+        
+        # Collect audio bytes from the async stream
+        chunks = [chunk async for chunk in audio_stream]
+    return b"".join(chunks)
+
+
+async def _write_to_cache(key: str, codename: str, voice_id: str, audio_bytes: bytes, kind: str = "clip") -> Path:
+    """Write rendered audio into the voice cache.
+    
+    Raises:
+        RuntimeError: If ElevenLabs returned no audio (nothing is cached).
+    """
+    if not audio_bytes:
+        raise RuntimeError(f"ElevenLabs returned no audio for {codename}")
+    cache_path = voice_cache.path_for(key, codename, ELEVENLABS_OUTPUT_FORMAT)
+    part_path = voice_cache.part_path()
+    try:
+        async with aiofiles.open(part_path, "wb") as f:
+            await f.write(audio_bytes)
+        # Atomic, so a reader of an existing clip never sees a half-written file
+        part_path.replace(cache_path)
+    finally:
+        part_path.unlink(missing_ok=True)
+    _commit_to_cache(key, cache_path, codename, voice_id, kind=kind)
+    return cache_path
+
+
+async def _render_segment(codename: str, voice_id: str, segment: str) -> bytes:
+    """Get a sentence's audio from the cache, rendering it on a miss."""
+    key = _cache_key(voice_id, segment)
+    cached = await _read_cached(key)
+    if cached is not None:
+        return cached
+    async with _rendering(key):
+        if voice_cache.contains(key):
+            cached = await _read_cached(key)
+            if cached is not None:
+                return cached
+        audio_bytes = await _render(voice_id, segment)
+        await _write_to_cache(key, codename, voice_id, audio_bytes, kind="segment")
+    return audio_bytes
+
+
+async def _synthesize(codename: str, voice_id: str, text: str, key: str) -> bytes:
+    """Render a clip with ElevenLabs and write it to the cache."""
+    segments = _segments_for(text)
+    if len(segments) == 1:
+        audio_bytes = await _render(voice_id, segments[0])
+    else:
+        # Missing sentences render concurrently, bounded by the voice semaphore
+        parts = await asyncio.gather(*[
+            _render_segment(codename, voice_id, segment) for segment in segments
+        ])
+        audio_bytes = concat_mp3(parts)
+    
+    # Cache it
+    await _write_to_cache(key, codename, voice_id, audio_bytes)
+    logger.info(f"Generated and cached audio for {codename} ({len(segments)} segments, {len(audio_bytes)} bytes)")
+    return audio_bytes
+
+
+@traced("tts.render_transmission_clip")
+async def render_transmission_clip(codename: str, text: str) -> Optional[Tuple[str, Path]]:
+    """Ensure a transmission's audio is in the voice cache, rendering it if needed.
+    
+    The clip is never read into memory — callers serve it straight from disk.
     
     Args:
         codename: Operative codename (used to select voice).
         text: The transmission text to convert to speech.
     
     Returns:
-        Audio bytes (mp3), or None if generation fails.
+        (cache key, clip path), or None if generation fails.
     """
-    if not client:
+    cached = get_cached_clip(codename, text)
+    if cached is not None:
+        logger.info(f"Cache hit for {codename} audio")
+        return cached
+    
+    if not ELEVENLABS_API_KEY:
         logger.warning("ElevenLabs client not initialized — no API key")
         return None
     
@@ -41,51 +253,378 @@ def generate_transmission_audio(codename: str, text: str) -> Optional[bytes]:
         logger.error(f"No voice ID configured for {codename}")
         return None
     
-    # Check cache first
-    cache_path = _get_cache_path(codename, text)
-    if cache_path.exists():
-        logger.info(f"Cache hit for {codename} audio")
-        return cache_path.read_bytes()
+    key = _cache_key(voice_id, text)
+    try:
+        async with _interactive_request(), _rendering(key):
+            # A stream or pre-render may have cached it while this one waited
+            if not voice_cache.contains(key):
+                await _synthesize(codename, voice_id, text, key)
+    except Exception as e:
+        logger.error(f"ElevenLabs TTS failed for {codename}: {e}")
+        return None
+    return get_cached_clip(codename, text)
+
+
+async def render_transmission_variant(codename: str, text: str, fmt: str = "mp3",
+                                     bitrate_kbps: Optional[int] = None) -> Optional[Tuple[str, Path, str]]:
+    """Ensure a format/bitrate variant of a transmission is cached.
+    
+    The MP3 from ElevenLabs is rendered (or reused) first, then transcoded with
+    ffmpeg on the process pool. Each variant is cached under its own key. If
+    ffmpeg is unavailable the source MP3 is returned instead.
+    
+    Args:
+        codename: Operative codename (used to select voice).
+        text: The transmission text to convert to speech.
+        fmt: Output format ("mp3" or "opus").
+        bitrate_kbps: Target bitrate; None serves MP3 as rendered, or the
+            format's default bitrate for other formats.
+    
+    Returns:
+        (cache key, clip path, media type), or None if generation fails.
+    
+    Raises:
+        ValueError: If the format or bitrate is not supported.
+    """
+    if fmt == "mp3" and bitrate_kbps is None:
+        source = await render_transmission_clip(codename, text)
+        return (*source, MEDIA_TYPES["mp3"]) if source else None
+    bitrate_kbps = validate_variant(fmt, bitrate_kbps)
+    
+    voice_id = OPERATIVE_VOICES.get(codename)
+    if not voice_id:
+        logger.error(f"No voice ID configured for {codename}")
+        return None
+    
+    variant = variant_name(fmt, bitrate_kbps)
+    key = voice_cache.make_key(voice_id, ELEVENLABS_MODEL, variant, text)
+    path = voice_cache.lookup(key)
+    if path is None:
+        source = await render_transmission_clip(codename, text)
+        if source is None:
+            return None
+        if not is_transcoding_available():
+            logger.warning(f"ffmpeg not available — serving {codename} audio as source MP3")
+            return (*source, MEDIA_TYPES["mp3"])
+        
+        # Concurrent requests for a variant transcode it once
+        async with _rendering(key):
+            if voice_cache.contains(key):
+                path = voice_cache.lookup(key)
+            else:
+                source_key, source_path = source
+                path = voice_cache.path_for(key, codename, variant)
+                try:
+                    await transcode(source_path, path, fmt, bitrate_kbps)
+                except Exception as e:
+                    logger.error(f"Transcoding {codename} audio to {variant} failed: {e}")
+                    return (*source, MEDIA_TYPES["mp3"])
+                voice_cache.commit(
+                    key, path,
+                    codename=codename,
+                    voice_id=voice_id,
+                    model_id=ELEVENLABS_MODEL,
+                    output_format=variant,
+                    kind="variant",
+                    source_key=source_key,
+                )
+                logger.info(f"Transcoded {codename} audio to {variant}")
+    
+    entry = voice_cache.entry(key)
+    source_entry = voice_cache.entry(entry.get("source_key", "")) if entry else None
+    if entry and source_entry:
+        record_served(variant, entry["size"], source_entry["size"])
+    return key, path, MEDIA_TYPES[fmt]
+
+
+def get_cached_clip(codename: str, text: str) -> Optional[Tuple[str, Path]]:
+    """Look up a transmission's cached clip.
+    
+    Returns:
+        (cache key, clip path), or None on a miss.
+    """
+    voice_id = OPERATIVE_VOICES.get(codename)
+    if not voice_id:
+        return None
+    key = _cache_key(voice_id, text)
+    path = voice_cache.lookup(key)
+    return (key, path) if path is not None else None
+
+
+def get_clip_by_key(key: str) -> Optional[Path]:
+    """Look up a cached clip directly by its cache key."""
+    return voice_cache.lookup(key)
+
+
+def get_cache_key(codename: str, text: str) -> Optional[str]:
+    """Cache key a transmission's clip is (or will be) stored under."""
+    voice_id = OPERATIVE_VOICES.get(codename)
+    return _cache_key(voice_id, text) if voice_id else None
+
+
+async def prerender_transmission_audio(codename: str, text: str) -> bool:
+    """Render a transmission into the voice cache at background priority.
+    
+    Args:
+        codename: Operative codename (used to select voice).
+        text: The transmission text to convert to speech.
+    
+    Returns:
+        True if the clip is cached (already or newly rendered), else False.
+    """
+    if not is_tts_available(codename):
+        return False
+    
+    voice_id = OPERATIVE_VOICES[codename]
+    key = _cache_key(voice_id, text)
+    if voice_cache.contains(key):
+        return True
+    
+    # Yield to any on-demand renders before taking a voice slot
+    await _interactive_idle.wait()
     
     try:
-        # Generate audio
-        audio_generator = client.text_to_speech.convert(
+        async with _rendering(key):
+            # The Director may have played it (or be playing it) in the meantime
+            if voice_cache.contains(key):
+                return True
+            await _synthesize(codename, voice_id, text, key)
+        logger.info(f"Pre-rendered audio for {codename}")
+        return True
+    except Exception as e:
+        logger.error(f"ElevenLabs pre-render failed for {codename}: {e}")
+        return False
+
+
+@traced("tts.open_transmission_stream")
+async def open_transmission_stream(codename: str, text: str) -> Optional[AsyncIterator[bytes]]:
+    """Open a chunked audio stream for an operative's transmission.
+    
+    Cached clips are streamed from disk. Otherwise audio is forwarded from
+    ElevenLabs as it is synthesized and tee'd into the voice cache; the clip is
+    only committed to the cache once the stream completes. If the clip is
+    already being rendered (by a pre-render or another stream), this waits for
+    that render and streams the cached result instead of rendering it again.
+    
+    Args:
+        codename: Operative codename (used to select voice).
+        text: The transmission text to convert to speech.
+    
+    Returns:
+        Async iterator of mp3 chunks, or None if generation is unavailable.
+        The first chunk has already been received when this returns, so
+        upstream failures surface here rather than mid-stream.
+    """
+    if not ELEVENLABS_API_KEY:
+        logger.warning("ElevenLabs client not initialized — no API key")
+        return None
+    
+    voice_id = OPERATIVE_VOICES.get(codename)
+    if not voice_id:
+        logger.error(f"No voice ID configured for {codename}")
+        return None
+    
+    key = _cache_key(voice_id, text)
+    cache_path = voice_cache.lookup(key)
+    if cache_path is not None:
+        logger.info(f"Cache hit for {codename} audio (streaming)")
+        return _stream_cached_file(cache_path)
+    
+    stream = _stream_once(codename, voice_id, text, key)
+    try:
+        first_chunk = await stream.__anext__()
+    except StopAsyncIteration:
+        return None
+    except Exception as e:
+        logger.error(f"ElevenLabs TTS stream failed for {codename}: {e}")
+        return None
+    return _prepend_chunk(first_chunk, stream)
+
+
+async def _stream_cached_file(cache_path: Path) -> AsyncIterator[bytes]:
+    """Yield a cached clip from disk in fixed-size chunks."""
+    async with aiofiles.open(cache_path, "rb") as f:
+        while chunk := await f.read(STREAM_CHUNK_SIZE):
+            yield chunk
+
+
+async def _stream_once(codename: str, voice_id: str, text: str, key: str) -> AsyncIterator[bytes]:
+    """Stream a clip, rendering it unless another request has cached it while this one waited."""
+    async with _interactive_request(), _rendering(key):
+        if not voice_cache.contains(key):
+            async with aclosing(_stream_and_cache(codename, voice_id, text, key)) as stream:
+                async for chunk in stream:
+                    yield chunk
+            return
+        cache_path = voice_cache.lookup(key)
+    logger.info(f"Streaming {codename} audio rendered by another request")
+    async with aclosing(_stream_cached_file(cache_path)) as cached:
+        async for chunk in cached:
+            yield chunk
+
+
+async def _stream_and_cache(codename: str, voice_id: str, text: str, key: str) -> AsyncIterator[bytes]:
+    """Stream audio sentence by sentence while writing it to a partial cache file.
+    
+    Cached sentences are replayed from disk; missing ones are streamed from
+    ElevenLabs (and cached individually), so playback can start as soon as the
+    first sentence is available.
+    """
+    cache_path = voice_cache.path_for(key, codename, ELEVENLABS_OUTPUT_FORMAT)
+    part_path = voice_cache.part_path()
+    segments = _segments_for(text)
+    total = 0
+    completed = False
+    try:
+        async with aiofiles.open(part_path, "wb") as f:
+            for i, segment in enumerate(segments):
+                if len(segments) == 1:
+                    source = _stream_upstream(voice_id, segment)
+                else:
+                    # Joined exactly as concat_mp3 would join the cached sentences
+                    source = _join_segment(_stream_segment(codename, voice_id, segment), keep_id3=i == 0)
+                async with aclosing(source):
+                    async for chunk in source:
+                        await f.write(chunk)
+                        total += len(chunk)
+                        yield chunk
+        if total == 0:
+            logger.warning(f"ElevenLabs returned no audio for {codename}; nothing cached")
+            return
+        part_path.replace(cache_path)
+        _commit_to_cache(key, cache_path, codename, voice_id)
+        completed = True
+        logger.info(f"Streamed and cached audio for {codename} ({len(segments)} segments, {total} bytes)")
+    finally:
+        if not completed:
+            # Client disconnected or upstream failed — never cache a truncated clip
+            part_path.unlink(missing_ok=True)
+
+
+async def _stream_upstream(voice_id: str, text: str) -> AsyncIterator[bytes]:
+    """Stream raw audio chunks from ElevenLabs."""
+    async with _get_voice_semaphore(voice_id):
+        async for chunk in get_client().text_to_speech.stream(
             voice_id=voice_id,
             text=text,
             model_id=ELEVENLABS_MODEL,
-        )
-        
-        # Collect audio bytes from generator
-        audio_bytes = b"".join(audio_generator)
-        
-        # Cache it
-        cache_path.write_bytes(audio_bytes)
-        logger.info(f"Generated and cached audio for {codename} ({len(audio_bytes)} bytes)")
-        
-        return audio_bytes
-    except Exception as e:
-        logger.error(f"ElevenLabs TTS failed for {codename}: {e}")
+            output_format=ELEVENLABS_OUTPUT_FORMAT,
+        ):
+            if chunk:
+                yield chunk
+
+
+async def _stream_segment(codename: str, voice_id: str, segment: str) -> AsyncIterator[bytes]:
+    """Stream one sentence — from the cache if present, else from ElevenLabs into the cache."""
+    key = _cache_key(voice_id, segment)
+    cache_path = voice_cache.lookup(key)
+    if cache_path is None:
+        async with _rendering(key):
+            if not voice_cache.contains(key):
+                async with aclosing(_stream_segment_upstream(codename, voice_id, segment, key)) as upstream:
+                    async for chunk in upstream:
+                        yield chunk
+                return
+            cache_path = voice_cache.lookup(key)
+    async with aclosing(_stream_cached_file(cache_path)) as cached:
+        async for chunk in cached:
+            yield chunk
+
+
+async def _stream_segment_upstream(codename: str, voice_id: str, segment: str, key: str) -> AsyncIterator[bytes]:
+    """Stream one sentence from ElevenLabs, caching it once complete."""
+    cache_path = voice_cache.path_for(key, codename, ELEVENLABS_OUTPUT_FORMAT)
+    part_path = voice_cache.part_path()
+    total = 0
+    completed = False
+    try:
+        async with aiofiles.open(part_path, "wb") as f:
+            async with aclosing(_stream_upstream(voice_id, segment)) as upstream:
+                async for chunk in upstream:
+                    await f.write(chunk)
+                    total += len(chunk)
+                    yield chunk
+        if total == 0:
+            # A silent gap would end up inside every clip that reuses this sentence
+            raise RuntimeError(f"ElevenLabs returned no audio for a {codename} sentence")
+        part_path.replace(cache_path)
+        _commit_to_cache(key, cache_path, codename, voice_id, kind="segment")
+        completed = True
+    finally:
+        if not completed:
+            part_path.unlink(missing_ok=True)
+
+
+async def _join_segment(stream: AsyncIterator[bytes], keep_id3: bool) -> AsyncIterator[bytes]:
+    """Strip a sentence's per-clip metadata so it can be appended to an MP3 stream.
+    
+    The streaming counterpart of concat_mp3: the head is buffered until
+    strip_join_head can decide, and the last 128 bytes are held back in case
+    they are an ID3v1 tag.
+    """
+    head = b""
+    tail = b""
+    async with aclosing(stream):
+        async for chunk in stream:
+            if head is not None:
+                head += chunk
+                chunk = strip_join_head(head, keep_id3)
+                if chunk is None:
+                    continue
+                head = None
+            tail += chunk
+            if len(tail) > ID3V1_LENGTH:
+                yield tail[:-ID3V1_LENGTH]
+                tail = tail[-ID3V1_LENGTH:]
+    if head is not None:
+        tail += strip_join_head(head, keep_id3, final=True)
+    if len(tail) >= ID3V1_LENGTH and tail[-ID3V1_LENGTH:-ID3V1_LENGTH + 3] == b"TAG":
+        tail = tail[:-ID3V1_LENGTH]
+    if tail:
+        yield tail
+
+
+async def _prepend_chunk(first_chunk: bytes, stream: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Re-attach an already-consumed first chunk to the rest of a stream."""
+    try:
+        yield first_chunk
+        async for chunk in stream:
+            yield chunk
+    finally:
+        await stream.aclose()
+
+
+async def _read_cached(key: str) -> Optional[bytes]:
+    """Read a cached clip by key."""
+    cache_path = voice_cache.lookup(key)
+    if cache_path is None:
+        return None
+    try:
+        async with aiofiles.open(cache_path, "rb") as f:
+            return await f.read()
+    except FileNotFoundError:
         return None
 
 
-def get_cached_audio(codename: str, text: str) -> Optional[bytes]:
-    """Get cached audio if it exists.
+def clear_cache(codename: Optional[str] = None, text: Optional[str] = None,
+                older_than: Optional[float] = None) -> dict:
+    """Evict cached audio matching the given filters.
     
     Args:
-        codename: Operative codename.
-        text: The transmission text.
+        codename: Only clips for this operative's voice.
+        text: Only the clip for this exact transmission text (requires codename).
+        older_than: Only clips not played in this many seconds.
     
     Returns:
-        Cached audio bytes, or None.
+        Dict with the number of clips and bytes evicted.
     """
-    cache_path = _get_cache_path(codename, text)
-    if cache_path.exists():
-        return cache_path.read_bytes()
-    return None
+    keys = None
+    if text is not None:
+        voice_id = OPERATIVE_VOICES.get(codename or "")
+        keys = [_cache_key(voice_id, text)] if voice_id else []
+    return voice_cache.evict(codename=codename, keys=keys, older_than=older_than)
 
 
-def clear_cache():
-    """Clear all cached audio files."""
-    for f in VOICE_CACHE_DIR.glob("*.mp3"):
-        f.unlink()
-    logger.info("Voice cache cleared")
+def get_cache_stats() -> dict:
+    """Voice cache size and hit/miss/bytes counters."""
+    return voice_cache.stats()
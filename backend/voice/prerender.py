@@ -0,0 +1,119 @@
+"""Audio pre-rendering — warms the voice cache in the background as transmissions are created."""
+import asyncio
+import contextvars
+import itertools
+import logging
+from collections import OrderedDict
+from typing import Optional
+
+from config import TTS_PRERENDER_ENABLED, TTS_PRERENDER_MAX_QUEUE, TTS_PRERENDER_STATUS_LIMIT
+from game.events import publish, AUDIO_READY as AUDIO_READY_EVENT
+from utils.tracing import span
+from voice.elevenlabs_client import is_tts_available, prerender_transmission_audio
+
+logger = logging.getLogger(__name__)
+
+# Audio status values reported to the UI
+AUDIO_PENDING = "pending"
+AUDIO_READY = "ready"
+AUDIO_FAILED = "failed"
+AUDIO_UNAVAILABLE = "unavailable"
+
+# Queue priorities — lower renders first
+PRIORITY_TRANSMISSION = 0
+PRIORITY_ROGUE_EVENT = 1
+
+_queue: Optional[asyncio.PriorityQueue] = None
+_worker: Optional[asyncio.Task] = None
+_sequence = itertools.count()
+
+# Item id -> audio status, bounded so long games don't grow it forever
+_status: "OrderedDict[str, str]" = OrderedDict()
+
+
+def _set_status(item_id: str, status: str) -> None:
+    """Record an item's audio status, evicting the oldest entries past the limit."""
+    _status[item_id] = status
+    _status.move_to_end(item_id)
+    while len(_status) > TTS_PRERENDER_STATUS_LIMIT:
+        _status.popitem(last=False)
+
+
+def get_audio_status(item_id: str) -> Optional[str]:
+    """Get the pre-render status of a transmission or rogue event.
+
+    Returns:
+        One of pending/ready/failed/unavailable, or None if never enqueued.
+    """
+    return _status.get(item_id)
+
+
+def enqueue_prerender(item_id: str, codename: str, text: str, priority: int = PRIORITY_TRANSMISSION) -> str:
+    """Queue TTS pre-rendering of a transmission into the voice cache.
+
+    Must be called from within the running event loop. The worker is started
+    on first use and renders one clip at a time, yielding to on-demand requests.
+
+    Args:
+        item_id: Transmission or rogue event id used to report status.
+        codename: Operative codename (selects the voice).
+        text: Text to render.
+        priority: Queue priority (lower renders first).
+
+    Returns:
+        The initial audio status for the item.
+    """
+    global _queue, _worker
+
+    if not TTS_PRERENDER_ENABLED or not is_tts_available(codename) or not text:
+        _set_status(item_id, AUDIO_UNAVAILABLE)
+        return AUDIO_UNAVAILABLE
+
+    if _queue is None:
+        _queue = asyncio.PriorityQueue(maxsize=TTS_PRERENDER_MAX_QUEUE)
+    if _worker is None or _worker.done():
+        # Started in an empty context: a task inherits the current one, which
+        # would tie the worker to this request's trace and I/O scope for life
+        _worker = contextvars.Context().run(asyncio.create_task, _worker_loop())
+
+    try:
+        _queue.put_nowait((priority, next(_sequence), item_id, codename, text))
+    except asyncio.QueueFull:
+        # Audio will still be generated on demand when the Director presses play
+        logger.warning(f"Pre-render queue full — skipping audio for {item_id}")
+        _set_status(item_id, AUDIO_UNAVAILABLE)
+        return AUDIO_UNAVAILABLE
+
+    _set_status(item_id, AUDIO_PENDING)
+    return AUDIO_PENDING
+
+
+async def _worker_loop() -> None:
+    """Render queued clips one at a time for the lifetime of the process."""
+    while True:
+        _, _, item_id, codename, text = await _queue.get()
+        try:
+            # Each clip is its own trace
+            with span("tts.prerender", **{"prerender.item_id": item_id, "prerender.codename": codename}):
+                ok = await prerender_transmission_audio(codename, text)
+            _set_status(item_id, AUDIO_READY if ok else AUDIO_FAILED)
+            publish(AUDIO_READY_EVENT, {"id": item_id, "audio_status": _status.get(item_id)})
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Audio pre-render failed for {item_id}: {e}")
+            _set_status(item_id, AUDIO_FAILED)
+        finally:
+            _queue.task_done()
+
+
+async def stop_prerender_worker() -> None:
+    """Cancel the background worker (used on shutdown)."""
+    global _worker
+    if _worker is not None:
+        _worker.cancel()
+        try:
+            await _worker
+        except asyncio.CancelledError:
+            pass
+        _worker = None
@@ -0,0 +1,166 @@
+"""Text segmentation for TTS — normalizes transmissions and splits them into cacheable sentences."""
+import re
+from typing import List, Optional
+
+# Stage directions: whole lines in *...*, _..._, [...] or (...), e.g. "*static crackles*"
+_STAGE_DIRECTION_LINE = re.compile(r"^\s*(\*[^*\n]+\*|_[^_\n]+_|\[[^\]\n]+\]|\([^)\n]+\))\s*$", re.MULTILINE)
+# Inline bracketed directions, e.g. "[pause]" or "[STATIC]"
+_INLINE_BRACKETS = re.compile(r"\[[^\]\n]*\]")
+_HEADING = re.compile(r"^\s{0,3}#{1,6}\s*", re.MULTILINE)
+_RULE = re.compile(r"^\s*([-*_]\s*){3,}$", re.MULTILINE)
+_LIST_MARKER = re.compile(r"^\s*(?:[-*+•]|\d+[.)])\s+", re.MULTILINE)
+_EMPHASIS = re.compile(r"(\*{1,3}|_{2,3}|`+)")
+_WHITESPACE = re.compile(r"[ \t]+")
+
+# Sentence boundary: terminal punctuation (optionally followed by closing quotes)
+# and whitespace, or a line break
+_SENTENCE_END = re.compile(r"(?<=[.!?…])[\"'”’)]*\s+|\n+")
+
+# Fragments shorter than this are merged into the previous sentence
+MIN_SEGMENT_CHARS = 12
+
+
+def normalize_text(text: str) -> str:
+    """Strip markdown and stage directions so only spoken words remain.
+
+    Args:
+        text: Raw transmission text (may contain markdown).
+
+    Returns:
+        Plain text, one paragraph/line per line.
+    """
+    text = _STAGE_DIRECTION_LINE.sub("", text)
+    text = _INLINE_BRACKETS.sub("", text)
+    text = _RULE.sub("", text)
+    text = _HEADING.sub("", text)
+    text = _LIST_MARKER.sub("", text)
+    text = _EMPHASIS.sub("", text)
+    lines = [_WHITESPACE.sub(" ", line).strip() for line in text.splitlines()]
+    return "\n".join(line for line in lines if line)
+
+
+def split_sentences(text: str) -> List[str]:
+    """Split normalized text into sentences.
+
+    Very short fragments (e.g. "Over.") are merged into the preceding
+    sentence, as rendering them alone sounds clipped.
+
+    Args:
+        text: Normalized text from normalize_text().
+
+    Returns:
+        List of sentences in order.
+    """
+    sentences: List[str] = []
+    for part in _SENTENCE_END.split(text):
+        part = part.strip()
+        if not part:
+            continue
+        if sentences and len(part) < MIN_SEGMENT_CHARS:
+            sentences[-1] = f"{sentences[-1]} {part}"
+        else:
+            sentences.append(part)
+    return sentences
+
+
+def id3v2_length(data: bytes) -> int:
+    """Length of a leading ID3v2 tag, or 0 if there is none.
+
+    Args:
+        data: At least the first 10 bytes of an MP3 stream.
+    """
+    if len(data) < 10 or data[:3] != b"ID3":
+        return 0
+    size = (data[6] & 0x7F) << 21 | (data[7] & 0x7F) << 14 | (data[8] & 0x7F) << 7 | (data[9] & 0x7F)
+    footer = 10 if data[5] & 0x10 else 0
+    return 10 + size + footer
+
+
+# Trailing ID3v1 tag: the last 128 bytes, starting with "TAG"
+ID3V1_LENGTH = 128
+
+# Bytes needed after the ID3v2 tag to recognise a Xing/Info/VBRI frame: the
+# frame header, the longest side info and the 4-byte tag id
+_INFO_PROBE_LENGTH = 4 + 32 + 4
+
+# MPEG Layer III bitrates (kbps) by bitrate index, for MPEG-1 and MPEG-2/2.5
+_BITRATES_KBPS = {
+    1: [0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320],
+    2: [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+}
+# Sample rates by version bits (0 = MPEG-2.5, 2 = MPEG-2, 3 = MPEG-1) and rate index
+_SAMPLE_RATES = {0: [11025, 12000, 8000], 2: [22050, 24000, 16000], 3: [44100, 48000, 32000]}
+
+
+def info_frame_length(data: bytes, offset: int = 0) -> int:
+    """Length of a Xing/Info/VBRI header frame at `offset`, or 0 if there is none.
+
+    Encoders put one of these silent frames first in a clip; it declares the
+    clip's frame count (its duration and seek table), which is wrong for any
+    stream the clip is joined into.
+
+    Args:
+        data: MP3 bytes.
+        offset: Where the first MPEG frame starts (after any ID3v2 tag).
+    """
+    header = data[offset:offset + 4]
+    if len(header) < 4 or header[0] != 0xFF or header[1] & 0xE0 != 0xE0:
+        return 0
+    version = (header[1] >> 3) & 0x03
+    layer = (header[1] >> 1) & 0x03
+    bitrate_index = header[2] >> 4
+    rate_index = (header[2] >> 2) & 0x03
+    if version not in _SAMPLE_RATES or layer != 0x01 or bitrate_index in (0, 15) or rate_index == 3:
+        return 0
+    mpeg1 = version == 3
+    bitrate = _BITRATES_KBPS[1 if mpeg1 else 2][bitrate_index] * 1000
+    sample_rate = _SAMPLE_RATES[version][rate_index]
+    padding = (header[2] >> 1) & 0x01
+    mono = header[3] >> 6 == 0x03
+
+    side_info = (17 if mono else 32) if mpeg1 else (9 if mono else 17)
+    xing = data[offset + 4 + side_info:offset + 8 + side_info]
+    vbri = data[offset + 36:offset + 40]
+    if xing not in (b"Xing", b"Info") and vbri != b"VBRI":
+        return 0
+    return (144 if mpeg1 else 72) * bitrate // sample_rate + padding
+
+
+def strip_join_head(data: bytes, keep_id3: bool, final: bool = False) -> Optional[bytes]:
+    """Remove what must not be repeated when a clip is appended to an MP3 stream.
+
+    The Xing/Info frame is always dropped, the ID3v2 tag unless `keep_id3`
+    (for the first clip of the stream).
+
+    Args:
+        data: The start of a clip (all of it when `final`).
+        keep_id3: Keep the leading ID3v2 tag.
+        final: `data` is the whole clip, so decide with what there is.
+
+    Returns:
+        The clip start without those parts, or None if more bytes are needed to decide.
+    """
+    tag = id3v2_length(data)
+    if not final and (len(data) < 10 or len(data) < tag + _INFO_PROBE_LENGTH):
+        return None
+    frame = info_frame_length(data, tag)
+    if not final and len(data) < tag + frame:
+        return None
+    return (data[:tag] if keep_id3 else b"") + data[tag + frame:]
+
+
+def concat_mp3(parts: List[bytes]) -> bytes:
+    """Concatenate MP3 clips frame-wise into one playable stream.
+
+    MP3 frames are self-contained, so clips join by concatenation once their
+    per-clip metadata is removed: the ID3 tags of every clip but the first,
+    trailing ID3v1 tags, and every Xing/Info frame, since each one declares
+    only its own clip's length and later ones would play as glitches.
+    """
+    joined = []
+    for i, part in enumerate(parts):
+        part = strip_join_head(part, keep_id3=i == 0, final=True)
+        if part[-ID3V1_LENGTH:-ID3V1_LENGTH + 3] == b"TAG":
+            part = part[:-ID3V1_LENGTH]
+        joined.append(part)
+    return b"".join(joined)
@@ -0,0 +1,127 @@
+"""Audio transcoding — lower-bitrate MP3/Opus variants of cached clips via ffmpeg."""
+import asyncio
+import logging
+import os
+import shutil
+import subprocess
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Optional
+
+from config import FFMPEG_BINARY, TRANSCODE_WORKERS, AUDIO_FORMATS, AUDIO_BITRATES_KBPS
+from utils.tracing import traced
+
+logger = logging.getLogger(__name__)
+
+MEDIA_TYPES = {
+    "mp3": "audio/mpeg",
+    "opus": "audio/ogg",
+}
+
+_CODEC_ARGS = {
+    "mp3": ["-c:a", "libmp3lame", "-f", "mp3"],
+    "opus": ["-c:a", "libopus", "-vbr", "on", "-application", "voip", "-f", "ogg"],
+}
+
+_executor: Optional[ProcessPoolExecutor] = None
+
+# Per-variant byte totals, so bandwidth savings can be compared with the source MP3
+_stats: Dict[str, dict] = {}
+
+
+def variant_name(fmt: str, bitrate_kbps: int) -> str:
+    """Output format label for a variant, e.g. 'opus_32k'."""
+    return f"{fmt}_{bitrate_kbps}k"
+
+
+def validate_variant(fmt: str, bitrate_kbps: Optional[int]) -> int:
+    """Check a requested format/bitrate and fill in the default bitrate.
+
+    Raises:
+        ValueError: If the format or bitrate is not supported.
+    """
+    if fmt not in AUDIO_FORMATS:
+        raise ValueError(f"Unsupported audio format '{fmt}' (choose from {', '.join(AUDIO_FORMATS)})")
+    if bitrate_kbps is None:
+        return AUDIO_FORMATS[fmt]
+    if bitrate_kbps not in AUDIO_BITRATES_KBPS:
+        raise ValueError(f"Unsupported bitrate {bitrate_kbps}k (choose from {AUDIO_BITRATES_KBPS})")
+    return bitrate_kbps
+
+
+def is_transcoding_available() -> bool:
+    """Whether the ffmpeg binary can be found."""
+    return shutil.which(FFMPEG_BINARY) is not None
+
+
+def _run_ffmpeg(ffmpeg: str, src: str, dst: str, fmt: str, bitrate_kbps: int) -> int:
+    """Transcode one file (runs inside a pool worker process).
+
+    Returns:
+        Size of the transcoded file in bytes.
+    """
+    cmd = [
+        ffmpeg, "-y", "-loglevel", "error", "-i", src,
+        "-vn", *_CODEC_ARGS[fmt], "-b:a", f"{bitrate_kbps}k", dst,
+    ]
+    subprocess.run(cmd, check=True, capture_output=True, timeout=120)
+    return Path(dst).stat().st_size
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(max_workers=TRANSCODE_WORKERS)
+    return _executor
+
+
+@traced("tts.transcode")
+async def transcode(src: Path, dst: Path, fmt: str, bitrate_kbps: int) -> None:
+    """Transcode a clip into `dst` on the process pool.
+
+    The output is written to a uniquely named partial file first, so a failed
+    transcode never leaves a truncated variant behind and concurrent
+    transcodes of the same variant never share a file.
+    """
+    fd, name = tempfile.mkstemp(dir=dst.parent, suffix=".part")
+    os.close(fd)
+    part = Path(name)
+    loop = asyncio.get_running_loop()
+    try:
+        await loop.run_in_executor(
+            _get_executor(), _run_ffmpeg, FFMPEG_BINARY, str(src), str(part), fmt, bitrate_kbps
+        )
+        # ffmpeg picks the muxer from -f (so the .part suffix is harmless) and -y overwrites the empty file
+        part.replace(dst)
+    finally:
+        part.unlink(missing_ok=True)
+
+
+def record_served(variant: str, variant_bytes: int, source_bytes: int) -> None:
+    """Record that a variant was served in place of its source MP3."""
+    stats = _stats.setdefault(variant, {"served": 0, "bytes_served": 0, "source_bytes": 0})
+    stats["served"] += 1
+    stats["bytes_served"] += variant_bytes
+    stats["source_bytes"] += source_bytes
+
+
+def get_transcode_stats() -> dict:
+    """Bytes served per variant and the savings against the source MP3s."""
+    variants = {}
+    for variant, stats in _stats.items():
+        saved = stats["source_bytes"] - stats["bytes_served"]
+        variants[variant] = {
+            **stats,
+            "bytes_saved": saved,
+            "savings_ratio": round(saved / stats["source_bytes"], 3) if stats["source_bytes"] else 0.0,
+        }
+    return {"available": is_transcoding_available(), "variants": variants}
+
+
+def shutdown_transcoder() -> None:
+    """Stop the worker processes (used on shutdown)."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
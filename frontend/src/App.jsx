@@ -31,12 +31,13 @@ export default function App() {
   // --- Data Fetching ---
   const refreshState = useCallback(async () => {
     try {
-      const [ws, ops] = await Promise.all([
-        api.getWorldState(),
-        api.getOperatives(),
+      const dashboard = await api.getDashboard([
+        'world_state', 'operatives', 'transmissions', 'briefing',
       ]);
-      setWorldState(ws);
-      setOperatives(ops);
+      setWorldState(dashboard.world_state);
+      setOperatives(dashboard.operatives);
+      setTransmissions(dashboard.transmissions);
+      setBriefing(dashboard.briefing);
     } catch (err) {
       console.error('Failed to refresh state:', err);
     }
@@ -49,6 +50,52 @@ export default function App() {
     });
   }, [refreshState]);
 
+  // Live updates — the server pushes state changes, so no re-fetching after actions
+  useEffect(() => {
+    const handleEvent = (type, data) => {
+      switch (type) {
+        case 'tension_change':
+          setWorldState((prev) => prev && {
+            ...prev,
+            regions: {
+              ...prev.regions,
+              [data.region]: { ...prev.regions[data.region], tension: data.tension },
+            },
+          });
+          break;
+        case 'world_update':
+        case 'turn_advance':
+          setWorldState((prev) => prev && { ...prev, ...data });
+          break;
+        case 'signal_change':
+          setOperatives((prev) =>
+            prev.map((op) => (op.codename === data.codename ? data : op))
+          );
+          break;
+        case 'transmission':
+          setTransmissions((prev) =>
+            prev.some((t) => t.id === data.id) ? prev : [...prev, data]
+          );
+          break;
+        case 'audio_ready':
+          setTransmissions((prev) =>
+            prev.map((t) => (t.id === data.id ? { ...t, audio_status: data.audio_status } : t))
+          );
+          break;
+        case 'rogue_alert':
+          setAlerts([data]);
+          break;
+        case 'game_reset':
+        case 'resync':
+          refreshState();
+          break;
+        default:
+          break;
+      }
+    };
+    return api.subscribeEvents(handleEvent);
+  }, [refreshState]);
+
   // --- Turn Management ---
   const handleStartTurn = async () => {
     setIsLoading(true);
@@ -65,7 +112,6 @@ export default function App() {
       setBriefing(result.briefing);
       setTurnStarted(true);
       setStatusMessage('Turn started. Awaiting your orders, Director.');
-      await refreshState();
     } catch (err) {
       setStatusMessage(`Error: ${err.message}`);
     } finally {
@@ -93,7 +139,6 @@ export default function App() {
       setCurrentEvent(null);
       setBriefing('');
       setStatusMessage(`Turn ${result.new_turn} ready. Threat level: ${result.threat_level}.`);
-      await refreshState();
     } catch (err) {
       setStatusMessage(`Error: ${err.message}`);
     } finally {
@@ -116,29 +161,21 @@ export default function App() {
         return;
       }
 
-      // Fetch audio in parallel with showing the transmission
+      // Show the transmission and stream its audio as it is synthesized
       if (result.transmission) {
         const codename = result.transmission.codename;
         const responseText = result.transmission.response;
 
-        // Start audio generation immediately
-        const audioPromise = api.generateAudio(codename, responseText);
-
-        // Wait for audio before showing the transmission
-        let audioUrl = null;
-        try {
-          audioUrl = await audioPromise;
-        } catch (err) {
-          console.error('Audio generation failed:', err);
-        }
-
-        // Show transmission and play audio simultaneously
         setPendingOrder(null);
-        setTransmissions((prev) => [...prev, result.transmission]);
-
-        if (audioUrl && audioRef.current) {
-          audioRef.current.src = audioUrl;
-          audioRef.current.play().catch(() => {});
+        setTransmissions((prev) =>
+          prev.some((t) => t.id === result.transmission.id) ? prev : [...prev, result.transmission]
+        );
+
+        if (audioRef.current) {
+          audioRef.current.src = api.getAudioStreamUrl(codename, responseText);
+          audioRef.current.play().catch((err) => {
+            console.error('Audio playback failed:', err);
+          });
         }
       } else {
         setPendingOrder(null);
@@ -150,7 +187,6 @@ export default function App() {
       }
 
       setStatusMessage('Transmission received. Awaiting further orders.');
-      await refreshState();
     } catch (err) {
       setPendingOrder(null);
       setStatusMessage(`Transmission error: ${err.message}`);
@@ -166,7 +202,6 @@ export default function App() {
     try {
       await api.respondToEvent(action);
       setStatusMessage('Directive acknowledged.');
-      await refreshState();
     } catch (err) {
       setStatusMessage(`Error: ${err.message}`);
     } finally {
@@ -177,10 +212,9 @@ export default function App() {
   // --- Audio ---
   const handlePlayAudio = async (codename, text) => {
     try {
-      const audioUrl = await api.generateAudio(codename, text);
-      if (audioUrl && audioRef.current) {
-        audioRef.current.src = audioUrl;
-        audioRef.current.play();
+      if (audioRef.current) {
+        audioRef.current.src = api.getAudioStreamUrl(codename, text);
+        await audioRef.current.play();
       }
     } catch (err) {
       console.error('Audio playback failed:', err);
@@ -8,7 +8,11 @@ export default function AlertBanner({ alerts, gameOver, onNewGame }) {
 
   useEffect(() => {
     if (alerts && alerts.length > 0) {
-      setVisibleAlerts((prev) => [...prev, ...alerts]);
+      // Alerts can arrive both pushed live and in the end-turn result
+      setVisibleAlerts((prev) => [
+        ...prev,
+        ...alerts.filter((a) => !a.id || !prev.some((p) => p.id === a.id)),
+      ]);
 
       // Auto-dismiss non-critical alerts after 15 seconds
       const timer = setTimeout(() => {
@@ -114,7 +114,11 @@ export default function TransmissionLog({ transmissions, onPlayAudio, pendingOrd
                 <button
                   onClick={() => handlePlay(t)}
                   className="text-terminal-green/60 hover:text-terminal-green text-xs transition-colors"
-                  title="Play audio transmission"
+                  title={
+                    t.audio_status === 'pending'
+                      ? 'Audio rendering — playback will stream'
+                      : 'Play audio transmission'
+                  }
                 >
                   {playingId === t.id ? '⏹' : '🔊'}
                 </button>
@@ -4,10 +4,13 @@
 
 const API_BASE = '/api';
 
+// Identifies this tab to the server's per-session admission control
+const SESSION_ID = crypto.randomUUID();
+
 async function apiCall(endpoint, options = {}) {
   const url = `${API_BASE}${endpoint}`;
   const config = {
-    headers: { 'Content-Type': 'application/json' },
+    headers: { 'Content-Type': 'application/json', 'X-Session-Id': SESSION_ID },
     ...options,
   };
 
@@ -25,6 +28,25 @@ async function apiCall(endpoint, options = {}) {
   return response.json();
 }
 
+const JOB_POLL_MS = 500;
+
+// Submit a background job and resolve with its result once it finishes,
+// so long LLM round-trips never hold a request open
+async function runJob(endpoint, body = null) {
+  let job = await apiCall(endpoint, {
+    method: 'POST',
+    ...(body ? { body: JSON.stringify(body) } : {}),
+  });
+  while (job.status === 'queued' || job.status === 'running') {
+    await new Promise((resolve) => setTimeout(resolve, JOB_POLL_MS));
+    job = await apiCall(`/jobs/${job.id}`);
+  }
+  if (job.status !== 'succeeded') {
+    throw new Error(job.error || `Job ${job.status}`);
+  }
+  return job.result;
+}
+
 export function useGameApi() {
   // World state
   const getWorldState = () => apiCall('/world-state');
@@ -32,16 +54,49 @@ export function useGameApi() {
   // Operatives
   const getOperatives = () => apiCall('/operatives');
 
+  // Full public view in one request (optionally limited to some sections)
+  const getDashboard = (fields = null) =>
+    apiCall(fields ? `/dashboard?fields=${fields.join(',')}` : '/dashboard');
+
   // Issue order
   const issueOrder = (order, operative = null) =>
-    apiCall('/order', {
+    runJob('/jobs/order', { order, operative });
+
+  // Batch orders — results stream back as NDJSON, one line per finished order
+  const issueOrdersBatch = async (orders, onResult) => {
+    const response = await fetch(`${API_BASE}/orders/batch`, {
       method: 'POST',
-      body: JSON.stringify({ order, operative }),
+      headers: { 'Content-Type': 'application/json', 'X-Session-Id': SESSION_ID },
+      body: JSON.stringify({ orders }),
     });
+    if (!response.ok) {
+      const error = await response.json().catch(() => ({ detail: response.statusText }));
+      throw new Error(error.detail || `API Error: ${response.status}`);
+    }
+
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    const results = [];
+    let buffer = '';
+    for (;;) {
+      const { done, value } = await reader.read();
+      if (done) break;
+      buffer += decoder.decode(value, { stream: true });
+      const lines = buffer.split('\n');
+      buffer = lines.pop();
+      for (const line of lines) {
+        if (!line.trim()) continue;
+        const result = JSON.parse(line);
+        results.push(result);
+        if (onResult) onResult(result);
+      }
+    }
+    return results;
+  };
 
   // Turn management
-  const startTurn = () => apiCall('/start-turn', { method: 'POST' });
-  const endTurn = () => apiCall('/end-turn', { method: 'POST' });
+  const startTurn = () => runJob('/jobs/start-turn');
+  const endTurn = () => runJob('/jobs/end-turn');
 
   // Respond to event
   const respondToEvent = (action) =>
@@ -50,8 +105,15 @@ export function useGameApi() {
       body: JSON.stringify({ action }),
     });
 
-  // Transmissions
-  const getTransmissions = () => apiCall('/transmissions');
+  // Transmissions — one page at a time; pass a cursor from the previous page
+  const getTransmissions = ({ after = null, before = null, limit = null } = {}) => {
+    const params = new URLSearchParams();
+    if (after) params.set('after', after);
+    if (before) params.set('before', before);
+    if (limit) params.set('limit', limit);
+    const query = params.toString();
+    return apiCall(query ? `/transmissions?${query}` : '/transmissions');
+  };
 
   // Briefing
   const getBriefing = () => apiCall('/briefing');
@@ -85,10 +147,37 @@ export function useGameApi() {
     }
   };
 
+  // Live game events (Server-Sent Events) — returns an unsubscribe function.
+  // EventSource reconnects on its own and resumes from the last event id.
+  const subscribeEvents = (onEvent) => {
+    const source = new EventSource(`${API_BASE}/events`);
+    const types = [
+      'tension_change', 'world_update', 'signal_change', 'transmission',
+      'rogue_alert', 'world_event', 'turn_advance', 'audio_ready',
+      'game_reset', 'resync',
+    ];
+    types.forEach((type) =>
+      source.addEventListener(type, (e) => onEvent(type, JSON.parse(e.data)))
+    );
+    return () => source.close();
+  };
+
+  // Streaming audio — the URL can be used directly as an <audio> src so
+  // playback starts with the first synthesized chunk. Pass a format such as
+  // 'opus' (optionally with a bitrate in kbps) for lower-bandwidth variants.
+  const getAudioStreamUrl = (codename, text, format = 'mp3', bitrate = null) => {
+    const params = new URLSearchParams({ text });
+    if (format !== 'mp3') params.set('format', format);
+    if (bitrate) params.set('bitrate', bitrate);
+    return `${API_BASE}/audio/stream/${codename}?${params}`;
+  };
+
   return {
     getWorldState,
     getOperatives,
+    getDashboard,
     issueOrder,
+    issueOrdersBatch,
     startTurn,
     endTurn,
     respondToEvent,
@@ -99,5 +188,7 @@ export function useGameApi() {
     newGame,
     checkGameOver,
     generateAudio,
+    getAudioStreamUrl,
+    subscribeEvents,
   };
 }